@@ -0,0 +1,71 @@
+"""
+Microbenchmark of the PasswordManager: hashes/sec for each hashing config.
+
+    python -m benchmarks.password_hashing [--seconds 2] [--threads 8]
+
+`threads` concurrent callers share the configured worker pool, as the
+request threads of the app would.
+"""
+import argparse
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from prodot import ProObject
+
+from easy_framework._context import ctx
+from easy_framework.auth import PasswordManager
+from easy_framework.config import Config
+from easy_framework.exception import ServiceUnavailable
+
+ITERATIONS = [10000, 30000, 100000]
+BCRYPT_ROUNDS = [10, 12]
+WORKERS = [0, 4]
+
+
+def run(config: Config, seconds: float, threads: int):
+    cache = ProObject()
+    cache.config = config
+    ctx.set(cache)
+
+    manager = PasswordManager()
+    deadline = time.perf_counter() + seconds
+    rejected = 0
+
+    def worker():
+        nonlocal rejected
+        done = 0
+        ctx.set(cache)
+        while time.perf_counter() < deadline:
+            try:
+                manager.hash("benchmark-password")
+                done += 1
+            except ServiceUnavailable:
+                rejected += 1
+        return done
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        done = sum(executor.map(lambda _: worker(), range(threads)))
+    return done / (time.perf_counter() - start), rejected
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=2)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'iterations':>10} {'rounds':>6} {'workers':>7} {'hashes/sec':>10} {'503s':>6}")
+    for iterations, rounds, workers in itertools.product(ITERATIONS, BCRYPT_ROUNDS, WORKERS):
+        config = Config(
+            EASY_FRAMEWORK_AUTH_PASSWORD_ITERATIONS=iterations,
+            EASY_FRAMEWORK_AUTH_PASSWORD_BCRYPT_ROUNDS=rounds,
+            EASY_FRAMEWORK_AUTH_PASSWORD_WORKERS=workers,
+        )
+        rate, rejected = run(config, args.seconds, args.threads)
+        print(f"{iterations:>10} {rounds:>6} {workers:>7} {rate:>10.1f} {rejected:>6}")
+
+
+if __name__ == "__main__":
+    main()
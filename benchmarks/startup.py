@@ -0,0 +1,36 @@
+"""
+Startup report of an EasyFramework app, as json, to track startup regressions in CI.
+
+    python -m benchmarks.startup [--views tests/view] [--lazy] [--trace-memory]
+"""
+import argparse
+import json
+import os
+
+from flask import Flask
+
+from easy_framework import EasyFramework
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--views", help="view folder to import")
+    parser.add_argument("--lazy", action="store_true", help="register the views from the view manifest")
+    parser.add_argument("--trace-memory", action="store_true", help="trace the allocated bytes with tracemalloc")
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    easy_framework = EasyFramework(app)
+    config = easy_framework.config
+    config.EASY_FRAMEWORK_STARTUP_TRACE_MEMORY = args.trace_memory
+    if args.views:
+        config.EASY_FRAMEWORK_VIEW_AUTO_IMPORT = True
+        config.EASY_FRAMEWORK_VIEW_FOLDER = os.path.abspath(args.views)
+        config.EASY_FRAMEWORK_VIEW_LAZY_IMPORT = args.lazy
+
+    report = easy_framework.prepare(preload_views=False)
+    print(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Microbenchmark of the per-request cost of the view validators.
+
+    python -m benchmarks.validators [--requests 2000]
+
+"before" adds the `inspect.stack(context=2)` call that BaseValidator.__init__
+made on every instantiation to decide between decorator and direct call,
+"after" is the current implementation.
+"""
+import argparse
+import inspect
+import time
+
+from flask import Flask
+
+from easy_framework.auth import AuthSerializer
+from easy_framework.validator import BaseValidator
+from easy_framework.view import GenericApiView
+
+
+class NoopValidator(BaseValidator):
+    def validate(self, *args, **kwargs) -> None:
+        pass
+
+
+class StackInspectingValidator(NoopValidator):
+    def __init__(self, *args, **kwargs) -> None:
+        lines = inspect.stack(context=2)[1].code_context
+        any(line.strip().startswith('@') for line in lines or [])
+        super().__init__(*args, **kwargs)
+
+
+def build_view(validator):
+    @validator.decorator(methods_to_validate=['GET'])
+    @validator.decorator()
+    class View(GenericApiView):
+        model = None
+        serializer = AuthSerializer
+        field_lookup = None
+        methods = ['GET']
+        routes = ['/']
+        validate_request = False
+
+        def validations(self, *args, **kwargs):
+            pass
+
+    return View
+
+
+def run(view_class, requests: int) -> float:
+    app = Flask(__name__)
+    with app.test_request_context(method='GET'):
+        view = view_class()
+        start = time.perf_counter()
+        for _ in range(requests):
+            view._validate()
+        return (time.perf_counter() - start) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    before = run(build_view(StackInspectingValidator), args.requests)
+    after = run(build_view(NoopValidator), args.requests)
+    print(f"before: {before * 1e6:10.1f} us/request")
+    print(f"after:  {after * 1e6:10.1f} us/request ({before / after:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
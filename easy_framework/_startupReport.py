@@ -0,0 +1,163 @@
+from __future__ import annotations
+import typing as t
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+
+from loguru import logger
+
+
+@dataclass
+class StartupPhase:
+    '''
+    Cost of a startup phase (EG. `database_register`) or of the import of a view module.
+
+    `allocated_blocks` is the net number of memory blocks allocated by the python
+    allocator (always measured, it's free). `allocated_bytes` and `peak_bytes`
+    are only measured while tracemalloc is tracing.
+    '''
+
+    name: str
+    seconds: float
+    allocated_blocks: int
+    allocated_bytes: t.Optional[int] = None
+    peak_bytes: t.Optional[int] = None
+
+
+class _Measure:
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.blocks = sys.getallocatedblocks()
+        self.tracing = tracemalloc.is_tracing()
+        self.memory = tracemalloc.get_traced_memory()[0] if self.tracing else 0
+        self.peak = self.memory
+
+
+_current_report: ContextVar[t.Optional["StartupReport"]] = ContextVar("easy_framework.startup_report", default=None)
+
+
+@dataclass
+class StartupReport:
+    '''
+    Time and allocations of the EasyFramework setup, per phase and per imported view module.
+    Available in `app.startup_report` after the setup ran, and logged as a structured
+    loguru record (`startup_report` in the `extra` dict).
+
+    ### Flask Config Parameters:
+    `EASY_FRAMEWORK_STARTUP_TRACE_MEMORY` trace the allocated bytes with tracemalloc
+    (it slows the startup down)
+    '''
+
+    phases: t.List[StartupPhase] = field(default_factory=list)
+    modules: t.List[StartupPhase] = field(default_factory=list)
+    pid: int = field(default_factory=os.getpid)
+    trace_memory: bool = False
+    _stack: t.List[_Measure] = field(default_factory=list, init=False, repr=False)
+
+    @classmethod
+    def get_current(cls) -> t.Optional["StartupReport"]:
+        '''
+        Return the report of the setup running in this context, if any
+        '''
+        return _current_report.get()
+
+    @classmethod
+    def measure_module(cls, name: str) -> t.ContextManager:
+        '''
+        Measure the import of a view module in the current report (if any)
+        '''
+        report = cls.get_current()
+        if report is None:
+            return nullcontext()
+        return report.module(name)
+
+    @contextmanager
+    def activate(self) -> t.Iterator["StartupReport"]:
+        '''
+        Make it the current report (see `get_current`), tracing
+        the memory while active if `trace_memory` is set
+        '''
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        token = _current_report.set(self)
+        try:
+            yield self
+        finally:
+            _current_report.reset(token)
+            if started_tracing:
+                tracemalloc.stop()
+
+    def phase(self, name: str) -> t.ContextManager:
+        '''
+        Measure the code inside the `with` scope as a phase
+        '''
+        return self.measure(name, self.phases)
+
+    def module(self, name: str) -> t.ContextManager:
+        '''
+        Measure the code inside the `with` scope as the import of a module
+        '''
+        return self.measure(name, self.modules)
+
+    @contextmanager
+    def measure(self, name: str, target: t.List[StartupPhase]) -> t.Iterator[None]:
+        if self._stack and self._stack[-1].tracing:
+            # keep the peak of the outer measure before resetting it
+            self._stack[-1].peak = max(self._stack[-1].peak, tracemalloc.get_traced_memory()[1])
+        measure = _Measure()
+        if measure.tracing:
+            tracemalloc.reset_peak()
+        self._stack.append(measure)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            allocated_bytes = peak_bytes = None
+            if measure.tracing and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(measure.peak, peak)
+                allocated_bytes, peak_bytes = current - measure.memory, peak - measure.memory
+                if self._stack and self._stack[-1].tracing:
+                    self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            target.append(StartupPhase(
+                name,
+                time.perf_counter() - measure.start,
+                sys.getallocatedblocks() - measure.blocks,
+                allocated_bytes,
+                peak_bytes,
+            ))
+
+    @property
+    def seconds(self) -> float:
+        return sum(phase.seconds for phase in self.phases)
+
+    def get_phase(self, name: str) -> t.Optional[StartupPhase]:
+        return next((phase for phase in self.phases if phase.name == name), None)
+
+    def get_module(self, name: str) -> t.Optional[StartupPhase]:
+        return next((module for module in self.modules if module.name == name), None)
+
+    def slowest_modules(self, limit: int = 10) -> t.List[StartupPhase]:
+        return sorted(self.modules, key=lambda module: module.seconds, reverse=True)[:limit]
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        return {
+            'pid': self.pid,
+            'seconds': self.seconds,
+            'phases': [asdict(phase) for phase in self.phases],
+            'modules': [asdict(module) for module in self.modules],
+        }
+
+    def log(self) -> None:
+        '''
+        Log the report as a structured record (`startup_report` in the `extra` dict)
+        '''
+        phases = ", ".join(f"{phase.name}={phase.seconds * 1000:.1f}ms" for phase in self.phases)
+        logger.bind(startup_report=self.to_dict()).info(
+            f"EasyFramework startup in {self.seconds:.3f}s ({len(self.modules)} view modules imported): {phases}"
+        )
@@ -6,4 +6,7 @@ from ._authView import AuthView
 from ._baseAuthMethod import BaseAuthMethod
 from ._databaseMethodSql import DatabaseMethodSql
 from ._databaseMethodMongo import DatabaseMethodMongo
-from ._password import PasswordManager
\ No newline at end of file
+from ._password import PasswordManager
+from ._tokenCache import BaseTokenCache, MemoryTokenCache, TokenCacheEntry
+from ._signedTokenMethod import SignedTokenMethod, TokenUser, BaseRevocationList, MemoryRevocationList
+from ._sessionSweeper import SessionSweeper, SweepReport
@@ -3,6 +3,7 @@ from flask import Flask
 from ._databaseMethodSql import DatabaseMethodSql
 from ._databaseMethodMongo import DatabaseMethodMongo
 from ._baseAuthMethod import BaseAuthMethod
+from ._signedTokenMethod import SignedTokenMethod
 
 from easy_framework._context import cache
 
@@ -18,8 +19,8 @@ class AuthManager:
 
         ### Flask Config Parameters:
         `EASY_FRAMEWORK_AUTH_METHOD` This parameter is the name of the method that
-        will be used to manage the Auth system. Right now, the framework only support
-        the database method, but in the future we plan to support the dbless JWT system
+        will be used to manage the Auth system: "database_sql", "database_mongo"
+        or the dbless "jwt" (signed tokens, see `SignedTokenMethod`)
 
         ### Adding more methods.
             To implement a new method, create a child class from this one, and create a new function inside it.
@@ -30,16 +31,25 @@ class AuthManager:
         """
 
         self.app = flaskApp
+        self._auth_methods: dict[str, BaseAuthMethod] = {}
 
     @property
     def auth_method(self) -> BaseAuthMethod:
+        """
+        The auth method of the `EASY_FRAMEWORK_AUTH_METHOD` config.
+        It's built once and reused by all the requests (auth methods keep no request state)
+        """
         self.string_method = cache.config.EASY_FRAMEWORK_AUTH_METHOD
-        try:
-            return getattr(self, "auth_method_" + self.string_method)()
-        except AttributeError:
-            raise AttributeError(
-                'auth method not found. Try: "database" or "jwt"(not implementes yet). If you are creating one, the auth method function must my called: "auth_method_myMethod"'
-            )
+        method = self._auth_methods.get(self.string_method)
+        if method is None:
+            try:
+                factory = getattr(self, "auth_method_" + self.string_method)
+            except AttributeError:
+                raise AttributeError(
+                    'auth method not found. Try: "database_sql", "database_mongo" or "jwt". If you are creating one, the auth method function must my called: "auth_method_myMethod"'
+                )
+            method = self._auth_methods[self.string_method] = factory()
+        return method
 
     def auth_method_database_sql(self):
         """
@@ -55,12 +65,18 @@ class AuthManager:
 
     def auth_method_jwt(self):
         """
-        Default Auth system with DBless method
+        Default Auth system with DBless method: HMAC signed tokens
         """
-        raise NotImplementedError
+        return SignedTokenMethod()
 
     def loadUser(self):
         """
         Method that will call the function loadUser from the auth method being used.
         """
         self.auth_method.loadUser()
+
+    def validateToken(self):
+        """
+        Validate the request token with the auth method being used, once per request.
+        """
+        self.auth_method.validateTokenOnce()
@@ -1,4 +1,5 @@
 import typing as t
+import hashlib
 from datetime import datetime
 
 import sqlalchemy as sa
@@ -9,22 +10,68 @@ from ..model import BaseModelSql
 from easy_framework._context import cache
 
 
+def digest_token(token: str) -> str:
+    """
+    Fixed length (64 chars) sha256 digest of a session token, used to look it up
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 class AuthModel(BaseModelSql):
     """
     Authorization SQL Model.
     After login the user, here's where the session token is stored.
+
+    The sessions are looked up by `token_digest`, through an unique index that also
+    includes (on PostgreSQL) the columns needed by the lookup, so it can be an index only scan.
     """
 
     __tablename__ = "FLASK_EASY_FRAMEWORK_SESSION"
+    __table_args__ = (
+        sa.Index(
+            "ux_FLASK_EASY_FRAMEWORK_SESSION_token_digest",
+            "token_digest",
+            unique=True,
+            postgresql_include=["user_id", "expiration_date", "_deleted"],
+        ),
+    )
     token: orm.Mapped[str] = orm.mapped_column(sa.String(256), nullable=False)
-    user_id: orm.Mapped[int] = orm.mapped_column(nullable=False)
-    expiration_date: orm.Mapped[t.Optional[datetime]] = orm.mapped_column(default=None)
+    user_id: orm.Mapped[int] = orm.mapped_column(nullable=False, index=True)
+    expiration_date: orm.Mapped[t.Optional[datetime]] = orm.mapped_column(default=None, index=True)
+    token_digest: orm.Mapped[str] = orm.mapped_column(sa.String(64), init=False, nullable=False)
 
-    def save(self):
+    def before_save(self):
         """
         Before saving the token, we need to add the expiration date based on the `EASY_FRAMEWORK_AUTH_TOKEN_EXPIRATION` attribute in the Flask's app config
         """
         self.expiration_date = (
             datetime.now() + cache.config.EASY_FRAMEWORK_AUTH_TOKEN_EXPIRATION
         )
-        return super().save()
+        self.token_digest = digest_token(self.token)
+
+    @classmethod
+    def delete_expired(cls, batch_size: int = 1000, now: t.Optional[datetime] = None) -> int:
+        """
+        Hard delete up to `batch_size` expired (or logged out) sessions, in a single
+        short transaction commited right away, even inside an app context with
+        `EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK`. Returns the number of deleted sessions.
+
+        The ids are selected first and deleted by that list: MySQL rejects
+        a `LIMIT` in an `IN` subquery.
+        """
+        now = now or datetime.now()
+        expired = (
+            sa.select(cls.id)
+            .where(sa.or_(cls.expiration_date <= now, cls._deleted == True))
+            .limit(batch_size)
+        )
+        # own session: the request session (unit of work) would only flush the batch
+        with cls.get_databaseClass().getUnscopedSession() as dbSession:
+            ids = dbSession.execute(expired).scalars().all()
+            if not ids:
+                return 0
+            deleted = dbSession.execute(
+                sa.delete(cls).where(cls.id.in_(ids)).execution_options(synchronize_session=False)
+            ).rowcount
+            dbSession.commit()
+        return deleted
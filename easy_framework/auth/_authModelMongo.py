@@ -1,4 +1,5 @@
 from ..model import BaseModelMongo
+from ._authModel import digest_token
 from mongoengine import fields
 from flask import current_app
 from datetime import datetime
@@ -13,16 +14,41 @@ class AuthModelMongo(BaseModelMongo):
     """
 
     collection_name = "FLASK_EASY_FRAMEWORK_SESSION"
-    meta = {"collection": collection_name}
+    meta = {
+        "collection": collection_name,
+        "indexes": [
+            {"fields": ["token_digest"], "unique": True, "sparse": True},
+            "user_id",
+            # mongo removes the expired sessions by itself
+            {"fields": ["expiration_date"], "expireAfterSeconds": 0},
+        ],
+    }
     token = fields.StringField(required=True)
+    token_digest = fields.StringField(max_length=64)
     user_id = fields.ObjectIdField(required=True)
     expiration_date = fields.DateTimeField(required=False)
 
-    def save(self):
+    def before_save(self):
         """
         Before saving the token, we need to add the expiration date based on the `EASY_FRAMEWORK_AUTH_TOKEN_EXPIRATION` attribute in the Flask's app config
         """
         self.expiration_date = (
             datetime.now() + cache.config.EASY_FRAMEWORK_AUTH_TOKEN_EXPIRATION
         )
-        return super().save()
+        self.token_digest = digest_token(self.token)
+
+    @classmethod
+    def delete_expired(cls, batch_size: int = 1000, now: datetime = None) -> int:
+        """
+        Delete up to `batch_size` expired (or logged out) sessions.
+        The TTL index already removes the expired ones, this also covers the logged out
+        sessions and deployments without the index.
+        Returns the number of deleted sessions.
+        """
+        now = now or datetime.now()
+        collection = cls._get_collection()
+        query = {"$or": [{"expiration_date": {"$lte": now}}, {"_deleted": True}]}
+        ids = [document["_id"] for document in collection.find(query, {"_id": 1}).limit(batch_size)]
+        if not ids:
+            return 0
+        return collection.delete_many({"_id": {"$in": ids}}).deleted_count
@@ -5,13 +5,13 @@ from easy_framework.view import GenericApiView
 from ..user import UserModel
 from . import AuthModel
 from . import AuthSerializer
-from ..exception import InvalidCredentials
+from ..exception import InvalidCredentials, AuthMissingError, InvalidSession
 from easy_framework._context import cache
 
 
 class AuthView(GenericApiView):
     """
-    Default view responsible for login the user.
+    Default view responsible for login (POST) and logout (DELETE) the user.
     Replace this default view by changing the attribute
     `FLASK_EASY_FRAMWORK_AUTH_DEFAULT_VIEW` in the Flask's app config, and passing a default GenericApiView child
     """
@@ -19,7 +19,7 @@ class AuthView(GenericApiView):
     field_lookup = None
     serializer: AuthSerializer = AuthSerializer
     model = AuthModel
-    methods = ["POST"]
+    methods = ["POST", "DELETE"]
     routes = ["/auth"]
     name = "FLASK_EASY_FRAMWORK_AUTH_DEFAULT_VIEW"
     auto_treat_request = False
@@ -40,5 +40,23 @@ class AuthView(GenericApiView):
         ):
             raise InvalidCredentials()
 
+        if passwordManager.needs_rehash(user.password):
+            # the hashing config changed since the password was stored
+            user.set_password(serialized_data["password"])
+            user.update()
+
         token = current_app.authManager.auth_method.generateSession(user)
         return {"auth_token": token}, 200
+
+    def delete(self):
+        """
+        The user logout process by using the Delete HTTP method.
+        Closes the session of the Authorization token
+        """
+        auth_method = current_app.authManager.auth_method
+        token = auth_method.token
+        if token is None:
+            raise AuthMissingError()
+        if auth_method.closeSession(token) is not True:
+            raise InvalidSession()
+        return {}, 204
@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
 import typing as t
-from flask import current_app, request
+from flask import current_app, request, g, has_request_context
 
 from ..user.userManager import UserManager
 from ..user.userModel import UserModel
 from ..exception import AuthMissingError
+from ._tokenCache import BaseTokenCache
 from easy_framework._context import cache
 
 if t.TYPE_CHECKING:
@@ -26,7 +27,16 @@ class BaseAuthMethod(ABC):
         you want to retrieve the token from a different place, or
         in a different way
         """
-        return self.getTokenFromRequest()
+        if not has_request_context():
+            return self.getTokenFromRequest()
+
+        # parsed once per request (and Authorization header)
+        header = request.headers.get("Authorization")
+        parsed = g.get("_easy_framework_auth_token")
+        if parsed is None or parsed[0] != header:
+            parsed = (header, self.getTokenFromRequest())
+            g._easy_framework_auth_token = parsed
+        return parsed[1]
 
     @property
     def userModel(self) -> UserModel:
@@ -42,6 +52,13 @@ class BaseAuthMethod(ABC):
         """
         return cache.config.EASY_FRAMEWORK_AUTH_MODEL
 
+    @property
+    def tokenCache(self) -> t.Optional["BaseTokenCache"]:
+        """
+        Get the token cache registered in the config, if any
+        """
+        return BaseTokenCache.get_current()
+
     @property
     def authManager(self) -> "AuthManager":
         """
@@ -80,6 +97,17 @@ class BaseAuthMethod(ABC):
         if self.token is None:
             raise AuthMissingError()
 
+    def validateTokenOnce(self) -> None:
+        """
+        Run `validateToken` only once per request and token.
+        """
+        token = self.token
+        if token is not None and has_request_context() and g.get("_easy_framework_valid_token") == token:
+            return
+        self.validateToken()
+        if has_request_context():
+            g._easy_framework_valid_token = token
+
     @abstractmethod
     def getUserFromToken(self) -> str:
         """
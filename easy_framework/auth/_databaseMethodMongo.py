@@ -1,9 +1,13 @@
 import secrets
+import typing as t
+from datetime import datetime
 
 from flask import request, current_app
+from mongoengine.queryset.visitor import Q
 
 from ._databaseMethodSql import DatabaseMethodSql
 from ._authModelMongo import AuthModelMongo
+from ._authModel import digest_token
 from ..exception import ValidationError, InvalidCredentials
 from easy_framework.user.userModelMongo import UserModelMongo
 
@@ -24,21 +28,13 @@ class DatabaseMethodMongo(DatabaseMethodSql):
         session.save()
         return token
 
-    def getUserFromToken(self):
+    def lookupSession(self, token: str) -> t.Tuple[t.Optional[UserModelMongo], t.Optional[datetime]]:
         '''
-        Analyzes the Authorization token in the request headers and retreive the user linked to the session token
+        Retrieve the user and the expiration date of a not expired session token
+        (the sessions without expiration date never expire)
         '''
-        if 'Authorization' in request.headers:
-            token = self.token
-            
-            if 'Bearer '.lower() in token:
-                token = token.split()[1]
-
-            userModel = self.userModel
-            token = self.authModel.get_one(token=token)
-            if not token:
-                return None
-
-            user = userModel.get_one(id = token.user_id)
-
-            return user
+        not_expired = Q(expiration_date=None) | Q(expiration_date__gt=datetime.now())
+        session = self.authModel.get_one(not_expired, token_digest=digest_token(token))
+        if not session:
+            return None, None
+        return self.userModel.get_one(id=session.user_id), session.expiration_date
@@ -1,9 +1,14 @@
 import secrets
+import typing as t
+from datetime import datetime
+
+import sqlalchemy as sa
 
 from flask import request, g
 
 from ._baseAuthMethod import BaseAuthMethod
-from ._authModel import AuthModel
+from ._authModel import AuthModel, digest_token
+from ._tokenCache import TokenCacheEntry
 from ..exception import ValidationError, InvalidCredentials
 from easy_framework.user.userModel import UserModel
 
@@ -33,28 +38,67 @@ class DatabaseMethodSql(BaseAuthMethod):
 
     def getUserFromToken(self):
         '''
-        Analyzes the Authorization token in the request headers and retreive the user linked to the session token
+        Analyzes the Authorization token in the request headers and retreive the user linked to the session token.
+        The token cache is checked first, so most of the requests don't hit the database
         '''
         
         if 'Authorization' in request.headers:
             
             token = self.token
 
-            if 'Bearer '.lower() in self.token:
-                token = token.split()[1]
-            
-            userModel = self.userModel
-            user = userModel.get_one(self.authModel.token==token, userModel.id == self.authModel.user_id)
-            
+            tokenCache = self.tokenCache
+            if tokenCache is not None:
+                entry = tokenCache.get(token)
+                if entry is not None:
+                    return self.userModel.from_snapshot(entry.user)
+
+            user, expiration_date = self.lookupSession(token)
+            if user is not None and tokenCache is not None:
+                tokenCache.set(token, TokenCacheEntry(user.id, expiration_date, user.to_snapshot()))
             return user
 
+    def lookupSession(self, token: str) -> t.Tuple[t.Optional[UserModel], t.Optional[datetime]]:
+        '''
+        Retrieve the user and the expiration date of a not expired session token,
+        in a single query joining the session (by its indexed token digest) and the user
+        '''
+        userModel = self.userModel
+        authModel = self.authModel
+        sqldb = userModel.get_databaseClass()
+        # a session created a moment ago may not be in the read replicas yet
+        with sqldb.usePrimary(), sqldb.getScopedSession() as dbSession:
+            row = dbSession.execute(
+                sa.select(userModel, authModel.expiration_date)
+                .join(authModel, authModel.user_id == userModel.id)
+                .where(
+                    authModel.token_digest == digest_token(token),
+                    authModel._deleted != True,
+                    sa.or_(authModel.expiration_date.is_(None), authModel.expiration_date > datetime.now()),
+                    userModel._deleted != True,
+                )
+                .limit(1)
+            ).first()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
+    def closeSession(self, token: str) -> bool:
+        '''
+        Delete the session of the token (logout) and remove it from the token cache.
+        Returns False if there was no session for the token.
+        '''
+        if self.tokenCache is not None:
+            self.tokenCache.delete(token)
+        return self.authModel.soft_delete_by(token_digest=digest_token(token)) > 0
+
     def validateToken(self):
         '''
         Validate the token to check if it's valid.
         This function checks if the token exists, and if it is a string. 
         '''
         super().validateToken()
-        if not isinstance(self.token, str):
+        token = self.token
+        if not isinstance(token, str):
             raise ValidationError('Invalid token type. Token is not a string', 498)
-        if len(self.token) != self.token_len:
+        if len(token) != self.token_len:
             raise ValidationError('Invalid token length', 498)
\ No newline at end of file
@@ -1,19 +1,111 @@
 import bcrypt
 import os
+import re
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import pbkdf2_hmac
 
+from ..exception import ServiceUnavailable
+from easy_framework._context import cache
+
+
+class PasswordHashingPool():
+    '''
+    Bounded pool of worker threads running the password hashing.
+
+    bcrypt and PBKDF2 release the GIL, so threads are enough to run them in parallel.
+    At most `workers` hashes run at the same time and `queue_size` more can wait
+    for a free worker. When the queue is full, a 503 ServiceUnavailable error is raised,
+    so a login burst can't take all the request threads.
+    '''
+    def __init__(self, workers: int, queue_size: int) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='easy_framework_password')
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+
+    def run(self, function: t.Callable, *args):
+        if not self.slots.acquire(blocking=False):
+            raise ServiceUnavailable({'msg': 'Too many password hashing requests. Try again later.'})
+
+        def task():
+            try:
+                return function(*args)
+            finally:
+                self.slots.release()
+
+        try:
+            future = self.executor.submit(task)
+        except BaseException:
+            self.slots.release()
+            raise
+        return future.result()
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
 class PasswordManager():
     '''
     Library that manages the user's password.
     This class is responsible for Hashing and comparing the password before and after storing in the database
+
+    ### Hash format
+    The password is stretched with PBKDF2-SHA256 (peppered with the `PASSWORD_SECRET_KEY` env var)
+    and then hashed with bcrypt. The PBKDF2 iterations are stored as a prefix: `$ef$<iterations>$<bcrypt hash>`.
+    Hashes without the prefix were created with 30000 iterations.
+
+    ### Flask Config Parameters:
+    `EASY_FRAMEWORK_AUTH_PASSWORD_ITERATIONS` PBKDF2 iterations of the new hashes
+    `EASY_FRAMEWORK_AUTH_PASSWORD_BCRYPT_ROUNDS` bcrypt cost of the new hashes
+    `EASY_FRAMEWORK_AUTH_PASSWORD_WORKERS` threads hashing passwords (0 to hash in the request thread)
+    `EASY_FRAMEWORK_AUTH_PASSWORD_QUEUE_SIZE` hashes waiting for a worker before answering 503
     '''
-    def hash(self, password: str) -> str:
+    prefix = b'$ef$'
+    legacy_iterations = 30000
+    hash_pattern = re.compile(rb'^\$ef\$(\d+)\$(.+)$')
+
+    _pools: t.Dict[t.Tuple[int, int], PasswordHashingPool] = {}
+    _pools_lock = threading.Lock()
+
+    @property
+    def iterations(self) -> int:
+        return getattr(cache.config, 'EASY_FRAMEWORK_AUTH_PASSWORD_ITERATIONS', self.legacy_iterations)
+
+    @property
+    def bcrypt_rounds(self) -> int:
+        return getattr(cache.config, 'EASY_FRAMEWORK_AUTH_PASSWORD_BCRYPT_ROUNDS', 12)
+
+    @property
+    def pool(self) -> t.Optional[PasswordHashingPool]:
+        '''
+        The worker pool shared by all the PasswordManager instances with the same config
+        '''
+        workers = getattr(cache.config, 'EASY_FRAMEWORK_AUTH_PASSWORD_WORKERS', 0)
+        queue_size = getattr(cache.config, 'EASY_FRAMEWORK_AUTH_PASSWORD_QUEUE_SIZE', 0)
+        if not workers:
+            return None
+        key = (workers, queue_size)
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = self._pools[key] = PasswordHashingPool(workers, queue_size)
+        return pool
+
+    def run(self, function: t.Callable, *args):
+        pool = self.pool
+        if pool is None:
+            return function(*args)
+        return pool.run(function, *args)
+
+    def hash(self, password: str) -> bytes:
         '''
         Hashes the password that will be stored in the database
         '''
-        prepared_password = self._prepare_password(password)
-        hash = bcrypt.hashpw(prepared_password, bcrypt.gensalt())
-        return hash
+        return self.run(self._hash, password, self.iterations, self.bcrypt_rounds)
 
     def compare(self, password: str, hash:str) -> bool:
         '''
@@ -21,14 +113,48 @@ class PasswordManager():
         '''
         if isinstance(hash, str):
             hash = hash.encode()
-        prepared_password = self._prepare_password(password)
-        return bcrypt.checkpw(prepared_password, hash)
-    
-    def _prepare_password(self, password:str)-> str:
+        iterations, bcrypt_hash = self.parse_hash(bytes(hash))
+        return self.run(self._compare, password, iterations, bcrypt_hash)
+
+    def needs_rehash(self, hash: str) -> bool:
+        '''
+        Check if the stored hash was created with different parameters
+        than the configured ones, so it can be replaced after a successful login
+        '''
+        if isinstance(hash, str):
+            hash = hash.encode()
+        iterations, bcrypt_hash = self.parse_hash(bytes(hash))
+        try:
+            rounds = int(bcrypt_hash.split(b'$')[2])
+        except (IndexError, ValueError):
+            return True
+        return iterations != self.iterations or rounds != self.bcrypt_rounds
+
+    def parse_hash(self, hash: bytes) -> t.Tuple[int, bytes]:
+        '''
+        Split the stored hash into the PBKDF2 iterations and the bcrypt hash
+        '''
+        match = self.hash_pattern.match(hash)
+        if match is None:
+            return self.legacy_iterations, hash
+        return int(match.group(1)), match.group(2)
+
+    def _hash(self, password: str, iterations: int, rounds: int) -> bytes:
+        prepared_password = self._prepare_password(password, iterations)
+        bcrypt_hash = bcrypt.hashpw(prepared_password, bcrypt.gensalt(rounds))
+        if iterations == self.legacy_iterations:
+            return bcrypt_hash
+        return self.prefix + str(iterations).encode() + b'$' + bcrypt_hash
+
+    def _compare(self, password: str, iterations: int, bcrypt_hash: bytes) -> bool:
+        prepared_password = self._prepare_password(password, iterations)
+        return bcrypt.checkpw(prepared_password, bcrypt_hash)
+
+    def _prepare_password(self, password:str, iterations: t.Optional[int] = None)-> str:
         '''
         Prepare the password by adding pepper and salt
         to it, before it's final hashed and stored.
         '''
         pepper=os.getenv("PASSWORD_SECRET_KEY","")
-        iterations = 30000
-        return pbkdf2_hmac('sha256', password.encode(), pepper.encode(), iterations).hex().encode()
\ No newline at end of file
+        iterations = iterations or self.legacy_iterations
+        return pbkdf2_hmac('sha256', password.encode(), pepper.encode(), iterations).hex().encode()
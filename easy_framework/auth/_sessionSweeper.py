@@ -0,0 +1,140 @@
+from __future__ import annotations
+import typing as t
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from flask import Flask
+from loguru import logger
+
+from easy_framework._context import cache
+
+
+@dataclass
+class SweepReport:
+    '''
+    Result of a sweep: sessions deleted and seconds spent per batch
+    '''
+
+    batches: t.List[t.Tuple[int, float]] = field(default_factory=list)
+
+    @property
+    def deleted(self) -> int:
+        return sum(deleted for deleted, _ in self.batches)
+
+    @property
+    def seconds(self) -> float:
+        return sum(seconds for _, seconds in self.batches)
+
+
+class SessionSweeper:
+    """
+    Deletes the expired (and logged out) sessions of the auth model.
+
+    The sessions are deleted in batches of `batch_size`, each one in its own
+    short transaction, with a `pause` (seconds) between them so the sweep
+    doesn't hold locks or saturate the database for long.
+
+    ### Usage
+    - `flask sweep-sessions` CLI command, registered by the EasyFramework
+    - In-process background thread, started by the EasyFramework on the first request
+    of each process (`ensure_started`, so pre-fork servers start it in each worker and
+    not in the master) if the `EASY_FRAMEWORK_AUTH_SESSION_SWEEPER` config is True. It sweeps every
+    `EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_INTERVAL`, plus a random jitter
+    (up to `EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_JITTER`) so several workers
+    don't sweep at the same time.
+    """
+
+    def __init__(
+        self,
+        flaskApp: Flask,
+        batch_size: t.Optional[int] = None,
+        pause: t.Optional[float] = None,
+        interval: t.Optional[timedelta] = None,
+        jitter: t.Optional[timedelta] = None,
+    ) -> None:
+        config = cache.config
+        self.app = flaskApp
+        self.batch_size = batch_size or config.EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_BATCH_SIZE
+        self.pause = config.EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_BATCH_PAUSE if pause is None else pause
+        self.interval = interval or config.EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_INTERVAL
+        self.jitter = config.EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_JITTER if jitter is None else jitter
+        self._stop = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+        self._pid: t.Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def authModel(self):
+        return cache.config.EASY_FRAMEWORK_AUTH_MODEL
+
+    def sweep(self, max_batches: t.Optional[int] = None) -> SweepReport:
+        """
+        Delete the expired sessions, batch by batch, until there are no more
+        (or `max_batches` batches were deleted)
+        """
+        report = SweepReport()
+        now = datetime.now()
+        while max_batches is None or len(report.batches) < max_batches:
+            start = time.perf_counter()
+            deleted = self.authModel.delete_expired(self.batch_size, now)
+            seconds = time.perf_counter() - start
+            report.batches.append((deleted, seconds))
+            logger.info(f"Session sweeper: batch {len(report.batches)} deleted {deleted} sessions in {seconds:.3f}s")
+
+            if deleted < self.batch_size or self._stop.is_set():
+                break
+            if self.pause:
+                self._stop.wait(self.pause)
+
+        logger.info(f"Session sweeper: deleted {report.deleted} sessions in {report.seconds:.3f}s")
+        return report
+
+    def next_wait(self) -> float:
+        """
+        Seconds until the next sweep
+        """
+        return self.interval.total_seconds() + random.uniform(0, self.jitter.total_seconds())
+
+    def run(self) -> None:
+        """
+        Background thread loop
+        """
+        while not self._stop.wait(self.next_wait()):
+            try:
+                with self.app.app_context():
+                    self.sweep()
+            except Exception:
+                logger.exception("Session sweeper failed")
+
+    def is_running(self) -> bool:
+        """
+        True if the thread runs in this process (threads are not copied by a fork)
+        """
+        return self._pid == os.getpid() and self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.is_running():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run, name="easy_framework_session_sweeper", daemon=True)
+            self._pid = os.getpid()
+            self._thread.start()
+
+    def ensure_started(self) -> None:
+        """
+        Start the thread if it's not running in this process yet.
+        Registered as a `before_request` function, so each worker starts its own
+        """
+        if not self.is_running():
+            self.start()
+
+    def stop(self, timeout: t.Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
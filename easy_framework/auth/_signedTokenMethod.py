@@ -0,0 +1,254 @@
+from __future__ import annotations
+import typing as t
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from flask import g, has_request_context
+
+from ._baseAuthMethod import BaseAuthMethod
+from ..exception import ValidationError, InvalidCredentials
+from ..user.userMixin import UserMixin
+from easy_framework._context import cache
+
+
+class TokenUser(UserMixin):
+    """
+    User loaded from a signed token, without querying the database.
+    It only knows the user id and the token claims: call `get_user`
+    to load the full user model when needed.
+    """
+
+    def __init__(self, id: t.Any, claims: t.Dict[str, t.Any]) -> None:
+        self.id = id
+        self.claims = claims
+
+    def get_user(self):
+        return cache.config.EASY_FRAMEWORK_USER_MODEL.get_one(id=self.id)
+
+    def __repr__(self) -> str:
+        return f"<TokenUser {self.id}>"
+
+
+class BaseRevocationList(ABC):
+    """
+    Base class of the revocation lists used by the SignedTokenMethod, so the
+    logout still works with stateless tokens.
+    Only the token id (`jti`) is stored, until the token expires.
+
+    To use a shared backend (EG. redis), inherit from this class and set it
+    in the `EASY_FRAMEWORK_AUTH_REVOCATION_LIST` config.
+    """
+
+    @classmethod
+    def get_current(cls) -> t.Optional["BaseRevocationList"]:
+        """
+        Return the revocation list registered by the EasyFramework, if any
+        """
+        return getattr(cache.config, "EASY_FRAMEWORK_AUTH_REVOCATION_LIST_STORE", None)
+
+    @abstractmethod
+    def revoke(self, jti: str, expiration: float) -> None:
+        pass
+
+    @abstractmethod
+    def is_revoked(self, jti: str) -> bool:
+        pass
+
+
+class MemoryRevocationList(BaseRevocationList):
+    """
+    Default revocation list, local to the process.
+    The expired tokens are removed every time a new token is revoked.
+    """
+
+    def __init__(self) -> None:
+        self.revoked: t.Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expiration: float) -> None:
+        now = time.time()
+        with self._lock:
+            self.revoked = {key: exp for key, exp in self.revoked.items() if exp > now}
+            self.revoked[jti] = expiration
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self.revoked
+
+
+class SignedTokenMethod(BaseAuthMethod):
+    """
+    Stateless Auth system using HMAC-SHA256 signed tokens (JWT compatible, HS256).
+
+    The token carries the user id (`sub`), the expiration (`exp`), a token id (`jti`)
+    and, in the header, the id of the signing key (`kid`). Validating it doesn't
+    need any I/O, and nothing is stored in the database.
+
+    ### Config
+    `EASY_FRAMEWORK_AUTH_SIGNING_KEYS` dict of `{key id: secret}`. All of them are
+    accepted when validating a token, so keys can be rotated by adding the new one,
+    signing with it, and removing the old one after `EASY_FRAMEWORK_AUTH_TOKEN_EXPIRATION`.
+
+    `EASY_FRAMEWORK_AUTH_SIGNING_KEY_ID` id of the key used to sign the new tokens
+    (the last one of the dict if not set).
+
+    `EASY_FRAMEWORK_AUTH_REVOCATION_LIST` revocation list class used by the logout.
+    Set it to None to disable it (logout won't invalidate the tokens).
+    """
+
+    algorithm = "HS256"
+
+    @property
+    def signingKeys(self) -> t.Dict[str, t.Union[str, bytes]]:
+        keys = cache.config.EASY_FRAMEWORK_AUTH_SIGNING_KEYS
+        if not keys:
+            raise RuntimeError("No signing key set in the EASY_FRAMEWORK_AUTH_SIGNING_KEYS config")
+        return keys
+
+    @property
+    def signingKeyId(self) -> str:
+        return cache.config.EASY_FRAMEWORK_AUTH_SIGNING_KEY_ID or list(self.signingKeys)[-1]
+
+    @property
+    def revocationList(self) -> t.Optional[BaseRevocationList]:
+        return BaseRevocationList.get_current()
+
+    def generateSession(self, user: UserMixin) -> str:
+        """
+        Generates a signed token for the user
+        """
+        if user is None:
+            raise InvalidCredentials("User not found or password is invalid")
+        user_id = user.id if isinstance(user.id, (int, str)) else str(user.id)
+        expiration = time.time() + cache.config.EASY_FRAMEWORK_AUTH_TOKEN_EXPIRATION.total_seconds()
+        return self.sign(
+            {"sub": user_id, "exp": int(expiration), "jti": self.generateHashToken()}
+        )
+
+    def generateHashToken(self) -> str:
+        """
+        Generates the token id (`jti`)
+        """
+        return secrets.token_urlsafe(16)
+
+    def sign(self, claims: t.Dict[str, t.Any], kid: t.Optional[str] = None) -> str:
+        """
+        Encode and sign the claims with the `kid` key (the signing key if not set)
+        """
+        kid = kid or self.signingKeyId
+        header = {"alg": self.algorithm, "typ": "JWT", "kid": kid}
+        signing_input = self.encode(header) + "." + self.encode(claims)
+        return signing_input + "." + self.signature(signing_input, self.signingKeys[kid])
+
+    def verify(self, token: str) -> t.Dict[str, t.Any]:
+        """
+        Check the signature, the expiration and the revocation of the token.
+        Returns the claims, or raises a 498 ValidationError if the token is invalid
+        """
+        try:
+            encoded_header, encoded_claims, signature = token.split(".")
+            header = self.decode(encoded_header)
+            claims = self.decode(encoded_claims)
+        except (ValueError, TypeError):
+            raise ValidationError("Invalid token", 498)
+
+        kid = header.get("kid") if isinstance(header, dict) else None
+        key = self.signingKeys.get(kid) if isinstance(kid, str) else None
+        if key is None or header.get("alg") != self.algorithm:
+            raise ValidationError("Invalid token", 498)
+
+        try:
+            expected = self.signature(encoded_header + "." + encoded_claims, key)
+            valid = hmac.compare_digest(signature.encode(), expected.encode())
+        except (ValueError, TypeError):
+            valid = False
+        if not valid:
+            raise ValidationError("Invalid token signature", 498)
+        if not isinstance(claims, dict) or not isinstance(claims.get("exp"), (int, float)):
+            raise ValidationError("Invalid token", 498)
+        if claims["exp"] <= time.time():
+            raise ValidationError("Token expired", 498)
+
+        revocationList = self.revocationList
+        if revocationList is not None and revocationList.is_revoked(claims.get("jti")):
+            raise ValidationError("Token revoked", 498)
+        return claims
+
+    def getClaims(self, token: str) -> t.Dict[str, t.Any]:
+        """
+        `verify` the token only once per request
+        """
+        if not has_request_context():
+            return self.verify(token)
+        verified = g.get("_easy_framework_token_claims")
+        if verified is None or verified[0] != token:
+            verified = (token, self.verify(token))
+            g._easy_framework_token_claims = verified
+        return verified[1]
+
+    def validateToken(self) -> None:
+        super().validateToken()
+        token = self.token
+        if not isinstance(token, str):
+            raise ValidationError("Invalid token type. Token is not a string", 498)
+        self.getClaims(token)
+
+    def getUserFromToken(self) -> t.Optional[TokenUser]:
+        """
+        Build the user from the token claims, without querying the database.
+        Returns None if the token is missing or invalid
+        """
+        token = self.token
+        if token is None:
+            return None
+        try:
+            claims = self.getClaims(token)
+        except ValidationError:
+            return None
+        return TokenUser(self.parseUserId(claims["sub"]), claims)
+
+    def parseUserId(self, user_id: t.Any) -> t.Any:
+        """
+        Convert the `sub` claim back into the id type of the user model
+        """
+        userModel = self.userModel
+        fields = getattr(userModel, "_fields", None)
+        if fields is not None and "id" in fields:
+            return fields["id"].to_python(user_id)
+        return user_id
+
+    def closeSession(self, token: str) -> bool:
+        """
+        Revoke the token (logout). Returns False if the token is invalid,
+        or if there is no revocation list to revoke it
+        """
+        try:
+            claims = self.verify(token)
+        except ValidationError:
+            return False
+        revocationList = self.revocationList
+        if revocationList is None:
+            return False
+        revocationList.revoke(claims.get("jti"), claims["exp"])
+        return True
+
+    @staticmethod
+    def encode(data: t.Dict[str, t.Any]) -> str:
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode(data: str) -> t.Any:
+        return json.loads(base64.urlsafe_b64decode(data + "=" * (-len(data) % 4)))
+
+    @staticmethod
+    def signature(signing_input: str, key: t.Union[str, bytes]) -> str:
+        if isinstance(key, str):
+            key = key.encode()
+        digest = hmac.new(key, signing_input.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).decode().rstrip("=")
@@ -0,0 +1,169 @@
+from __future__ import annotations
+import typing as t
+import hashlib
+import itertools
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from easy_framework._ttlCache import TTLCache
+from easy_framework._context import cache
+
+
+@dataclass(frozen=True)
+class TokenCacheEntry:
+    '''
+    What the token cache keeps for a session token: the id of the user,
+    the expiration date of the session and a snapshot of the user
+    (see `to_snapshot` in the models) used to rebuild it without a query.
+    '''
+
+    user_id: t.Any
+    expiration_date: t.Optional[datetime]
+    user: t.Dict[str, t.Any]
+
+    def is_expired(self) -> bool:
+        return self.expiration_date is not None and self.expiration_date <= datetime.now()
+
+
+class BaseTokenCache(ABC):
+    """
+    Base class of the caches used by the database auth methods to resolve
+    a session token into its user without querying the database.
+
+    To use a shared backend (EG. redis), inherit from this class and set it
+    in the `EASY_FRAMEWORK_AUTH_TOKEN_CACHE` config. Set the config to None to
+    disable the cache.
+
+    ### Invalidation
+    The cache must drop the entries of a token when the session is closed
+    (`delete`) and all the entries of an user when it's updated or deleted
+    (`delete_user`), EG. when the password changes. The invalidations must
+    reach all the processes of the app.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: timedelta = timedelta(minutes=5)) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    @classmethod
+    def get_current(cls) -> t.Optional["BaseTokenCache"]:
+        """
+        Return the token cache registered by the EasyFramework, if any
+        """
+        return getattr(cache.config, "EASY_FRAMEWORK_AUTH_TOKEN_CACHE_STORE", None)
+
+    @staticmethod
+    def key(token: str) -> str:
+        """
+        Tokens are never stored as they are, only their digest
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get_ttl(self, expiration_date: t.Optional[datetime]) -> float:
+        """
+        Seconds an entry can stay in the cache: the cache TTL,
+        but never beyond the expiration date of the session
+        """
+        ttl = self.ttl.total_seconds()
+        if expiration_date is not None:
+            ttl = min(ttl, (expiration_date - datetime.now()).total_seconds())
+        return ttl
+
+    @abstractmethod
+    def get(self, token: str) -> t.Optional[TokenCacheEntry]:
+        pass
+
+    @abstractmethod
+    def set(self, token: str, entry: TokenCacheEntry) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, token: str) -> None:
+        pass
+
+    @abstractmethod
+    def delete_user(self, user_id: t.Any) -> None:
+        pass
+
+    def delete_users(self, user_ids: t.Iterable[t.Any]) -> None:
+        """
+        `delete_user` for many users, EG. after a bulk update
+        """
+        for user_id in user_ids:
+            self.delete_user(user_id)
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class MemoryTokenCache(BaseTokenCache):
+    """
+    A bounded LRU cache with TTL, **local to the process**.
+
+    Each process (EG. each gunicorn worker) has its own copy, and the invalidations
+    (`delete`, `delete_user`) only reach the process where they happen: the other
+    workers keep resolving a closed session, or an user whose password changed,
+    until the entry expires (`EASY_FRAMEWORK_AUTH_TOKEN_CACHE_TTL`).
+    Only use it with a single process, or when that delay is acceptable;
+    otherwise use a shared backend (see `BaseTokenCache`).
+
+    The invalidation of an user records when it happened, so all the
+    entries cached before that are ignored without having to find them.
+    The invalidations are kept for the cache TTL (the entries can't live longer),
+    and at most `maxsize` of them: when there are more, the whole cache is dropped.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: timedelta = timedelta(minutes=5)) -> None:
+        super().__init__(maxsize, ttl)
+        self.entries = TTLCache(maxsize, ttl.total_seconds())
+        self.generations: t.Dict[str, t.Tuple[int, float]] = {}
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def get_generation(self, user_id: t.Any) -> int:
+        return self.generations.get(str(user_id), (0, 0))[0]
+
+    def get(self, token: str) -> t.Optional[TokenCacheEntry]:
+        item = self.entries.get(self.key(token))
+        if item is None:
+            return None
+        generation, entry = item
+        if entry.is_expired() or generation <= self.get_generation(entry.user_id):
+            self.delete(token)
+            return None
+        return entry
+
+    def set(self, token: str, entry: TokenCacheEntry) -> None:
+        generation = next(self._counter)
+        self.entries.set(self.key(token), (generation, entry), self.get_ttl(entry.expiration_date))
+
+    def delete(self, token: str) -> None:
+        self.entries.pop(self.key(token))
+
+    def delete_user(self, user_id: t.Any) -> None:
+        with self._lock:
+            if len(self.generations) >= self.maxsize:
+                self.prune_generations()
+            self.generations[str(user_id)] = (next(self._counter), time.monotonic())
+
+    def prune_generations(self) -> None:
+        """
+        Forget the invalidations older than the TTL. If the cache is still full,
+        drop all the entries, so no invalidation is lost
+        """
+        expired = time.monotonic() - self.ttl.total_seconds()
+        self.generations = {
+            user_id: item for user_id, item in self.generations.items() if item[1] > expired
+        }
+        if len(self.generations) >= self.maxsize:
+            self.entries.clear()
+            self.generations.clear()
+
+    def clear(self) -> None:
+        self.entries.clear()
+        with self._lock:
+            self.generations.clear()
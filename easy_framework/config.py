@@ -2,24 +2,50 @@ import typing as t
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+from sqlalchemy.pool import Pool
+
 from easy_framework.auth import AuthManager
 from easy_framework.auth import AuthView
-from easy_framework.database.sql import Sqldb
+from easy_framework.database.sql import Sqldb, AsyncSqldb
 from easy_framework.database.mongo import Mongodb
 from easy_framework.auth._authModel import AuthModel
 from easy_framework.user.userManager import UserManager
 from easy_framework.user.userModel import UserModel
 from easy_framework.auth import PasswordManager
+from easy_framework.auth import BaseTokenCache
+from easy_framework.auth import BaseRevocationList, MemoryRevocationList
 
 
 @dataclass
 class Config:
     # ----- EASY FRAMEWORK BASIC CONFIGS -----
     EASY_FRAMEWORK_ENVIRONMENT: t.Optional[str] = "dev"
+    EASY_FRAMEWORK_STARTUP_TRACE_MEMORY: t.Optional[bool] = False
 
     # ----- SQL DATABASE CONFIG -----
+    # Engine and pool parameters (per environment): the ones set to None use the SQLAlchemy defaults.
+    # POOL_CLASS is a pool class, or its name in sqlalchemy.pool (EG. "NullPool" behind pgbouncer).
+    # POOL_PING_IDLE_AFTER (seconds) replaces POOL_PRE_PING: only the connections idle for longer are
+    # pinged, and the checkout is retried with a new connection if the ping fails.
+    # ENGINE_OPTIONS are extra create_engine parameters.
     EASY_FRAMEWORK_DB_SQL_ACTIVATE: t.Optional[bool] = True
     EASY_FRAMEWORK_DB_SQLDB: Sqldb = field(init=False)
+    EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK: t.Optional[bool] = False
+
+    # Read replicas: REPLICA_URIS (per environment) are SQLAlchemy urls. The reads of GET requests (and of
+    # Sqldb.readOnly scopes) go to a replica (round_robin or least_connections), except during
+    # READ_YOUR_WRITES after a write in the same request. Failing replicas are ejected for EJECT_TIME.
+    EASY_FRAMEWORK_DB_SQL_REPLICA_SELECTION: t.Optional[str] = "round_robin"
+    EASY_FRAMEWORK_DB_SQL_READ_YOUR_WRITES: t.Optional[timedelta] = timedelta(seconds=5)
+    EASY_FRAMEWORK_DB_SQL_REPLICA_EJECT_TIME: t.Optional[timedelta] = timedelta(seconds=30)
+    EASY_FRAMEWORK_DB_SQL_REPLICA_HEALTH_CHECK_INTERVAL: t.Optional[timedelta] = None
+
+    # Async engine (AsyncSqldb) for `async def` views: same database, through the asyncio driver of the
+    # dialect (ASYNC_DIALECT per environment overrides it, EG. "postgresql+psycopg_async").
+    # Flask runs each async view in its own event loop, so the async engine doesn't pool by default.
+    EASY_FRAMEWORK_DB_SQL_ASYNC_ACTIVATE: t.Optional[bool] = False
+    EASY_FRAMEWORK_DB_ASYNC_SQLDB: AsyncSqldb = field(init=False)
+    EASY_FRAMEWORK_DB_SQL_ASYNC_POOL_CLASS: t.Optional[t.Union[str, t.Type[Pool]]] = "NullPool"
 
     # Production Database
     EASY_FRAMEWORK_DB_PROD_SQL_DIALECT: t.Optional[str] = "sqlite"
@@ -29,6 +55,18 @@ class Config:
     EASY_FRAMEWORK_DB_PROD_SQL_USERNAME: t.Optional[str] = ""
     EASY_FRAMEWORK_DB_PROD_SQL_PASSWORD: t.Optional[str] = ""
     EASY_FRAMEWORK_DB_PROD_SQL_CREATE_ALL: t.Optional[str] = False
+    EASY_FRAMEWORK_DB_PROD_SQL_ECHO: t.Optional[bool] = False
+    EASY_FRAMEWORK_DB_PROD_SQL_POOL_CLASS: t.Optional[t.Union[str, t.Type[Pool]]] = None
+    EASY_FRAMEWORK_DB_PROD_SQL_POOL_SIZE: t.Optional[int] = None
+    EASY_FRAMEWORK_DB_PROD_SQL_POOL_MAX_OVERFLOW: t.Optional[int] = None
+    EASY_FRAMEWORK_DB_PROD_SQL_POOL_TIMEOUT: t.Optional[float] = None
+    EASY_FRAMEWORK_DB_PROD_SQL_POOL_RECYCLE: t.Optional[int] = 300
+    EASY_FRAMEWORK_DB_PROD_SQL_POOL_USE_LIFO: t.Optional[bool] = None
+    EASY_FRAMEWORK_DB_PROD_SQL_POOL_PRE_PING: t.Optional[bool] = True
+    EASY_FRAMEWORK_DB_PROD_SQL_POOL_PING_IDLE_AFTER: t.Optional[float] = None
+    EASY_FRAMEWORK_DB_PROD_SQL_ENGINE_OPTIONS: t.Dict[str, t.Any] = field(default_factory=dict)
+    EASY_FRAMEWORK_DB_PROD_SQL_REPLICA_URIS: t.List[str] = field(default_factory=list)
+    EASY_FRAMEWORK_DB_PROD_SQL_ASYNC_DIALECT: t.Optional[str] = None
 
     # Development Database
     EASY_FRAMEWORK_DB_DEV_SQL_DIALECT: t.Optional[str] = "sqlite"
@@ -38,6 +76,18 @@ class Config:
     EASY_FRAMEWORK_DB_DEV_SQL_USERNAME: t.Optional[str] = ""
     EASY_FRAMEWORK_DB_DEV_SQL_PASSWORD: t.Optional[str] = ""
     EASY_FRAMEWORK_DB_DEV_SQL_CREATE_ALL: t.Optional[str] = False
+    EASY_FRAMEWORK_DB_DEV_SQL_ECHO: t.Optional[bool] = False
+    EASY_FRAMEWORK_DB_DEV_SQL_POOL_CLASS: t.Optional[t.Union[str, t.Type[Pool]]] = None
+    EASY_FRAMEWORK_DB_DEV_SQL_POOL_SIZE: t.Optional[int] = None
+    EASY_FRAMEWORK_DB_DEV_SQL_POOL_MAX_OVERFLOW: t.Optional[int] = None
+    EASY_FRAMEWORK_DB_DEV_SQL_POOL_TIMEOUT: t.Optional[float] = None
+    EASY_FRAMEWORK_DB_DEV_SQL_POOL_RECYCLE: t.Optional[int] = 300
+    EASY_FRAMEWORK_DB_DEV_SQL_POOL_USE_LIFO: t.Optional[bool] = None
+    EASY_FRAMEWORK_DB_DEV_SQL_POOL_PRE_PING: t.Optional[bool] = True
+    EASY_FRAMEWORK_DB_DEV_SQL_POOL_PING_IDLE_AFTER: t.Optional[float] = None
+    EASY_FRAMEWORK_DB_DEV_SQL_ENGINE_OPTIONS: t.Dict[str, t.Any] = field(default_factory=dict)
+    EASY_FRAMEWORK_DB_DEV_SQL_REPLICA_URIS: t.List[str] = field(default_factory=list)
+    EASY_FRAMEWORK_DB_DEV_SQL_ASYNC_DIALECT: t.Optional[str] = None
 
     # Test database
     EASY_FRAMEWORK_DB_TEST_SQL_DIALECT: t.Optional[str] = "sqlite"
@@ -47,6 +97,18 @@ class Config:
     EASY_FRAMEWORK_DB_TEST_SQL_USERNAME: t.Optional[str] = ""
     EASY_FRAMEWORK_DB_TEST_SQL_PASSWORD: t.Optional[str] = ""
     EASY_FRAMEWORK_DB_TEST_SQL_CREATE_ALL: t.Optional[str] = False
+    EASY_FRAMEWORK_DB_TEST_SQL_ECHO: t.Optional[bool] = False
+    EASY_FRAMEWORK_DB_TEST_SQL_POOL_CLASS: t.Optional[t.Union[str, t.Type[Pool]]] = None
+    EASY_FRAMEWORK_DB_TEST_SQL_POOL_SIZE: t.Optional[int] = None
+    EASY_FRAMEWORK_DB_TEST_SQL_POOL_MAX_OVERFLOW: t.Optional[int] = None
+    EASY_FRAMEWORK_DB_TEST_SQL_POOL_TIMEOUT: t.Optional[float] = None
+    EASY_FRAMEWORK_DB_TEST_SQL_POOL_RECYCLE: t.Optional[int] = 300
+    EASY_FRAMEWORK_DB_TEST_SQL_POOL_USE_LIFO: t.Optional[bool] = None
+    EASY_FRAMEWORK_DB_TEST_SQL_POOL_PRE_PING: t.Optional[bool] = True
+    EASY_FRAMEWORK_DB_TEST_SQL_POOL_PING_IDLE_AFTER: t.Optional[float] = None
+    EASY_FRAMEWORK_DB_TEST_SQL_ENGINE_OPTIONS: t.Dict[str, t.Any] = field(default_factory=dict)
+    EASY_FRAMEWORK_DB_TEST_SQL_REPLICA_URIS: t.List[str] = field(default_factory=list)
+    EASY_FRAMEWORK_DB_TEST_SQL_ASYNC_DIALECT: t.Optional[str] = None
 
     # ----- MONGO DATABASE CONFIG -----
     EASY_FRAMEWORK_DB_MONGO_ACTIVATE: t.Optional[str] = False
@@ -67,7 +129,24 @@ class Config:
     EASY_FRAMEWORK_AUTH_METHOD: t.Optional[str] = "database_sql"
     EASY_FRAMEWORK_AUTH_TOKEN_EXPIRATION: t.Optional[datetime] = timedelta(days=1)
     EASY_FRAMEWORK_AUTH_PASSWORD_MANAGER: t.Optional[PasswordManager] = PasswordManager
+    EASY_FRAMEWORK_AUTH_PASSWORD_ITERATIONS: t.Optional[int] = 30000
+    EASY_FRAMEWORK_AUTH_PASSWORD_BCRYPT_ROUNDS: t.Optional[int] = 12
+    EASY_FRAMEWORK_AUTH_PASSWORD_WORKERS: t.Optional[int] = 4
+    EASY_FRAMEWORK_AUTH_PASSWORD_QUEUE_SIZE: t.Optional[int] = 16
     EASY_FRAMEWORK_AUTH_MODEL: t.Optional[AuthModel] = AuthModel
+    EASY_FRAMEWORK_AUTH_TOKEN_CACHE: t.Optional[t.Type[BaseTokenCache]] = None
+    EASY_FRAMEWORK_AUTH_TOKEN_CACHE_STORE: BaseTokenCache = field(init=False)
+    EASY_FRAMEWORK_AUTH_TOKEN_CACHE_SIZE: t.Optional[int] = 10000
+    EASY_FRAMEWORK_AUTH_TOKEN_CACHE_TTL: t.Optional[timedelta] = timedelta(minutes=5)
+    EASY_FRAMEWORK_AUTH_SIGNING_KEYS: t.Optional[t.Dict[str, str]] = field(default_factory=dict)
+    EASY_FRAMEWORK_AUTH_SIGNING_KEY_ID: t.Optional[str] = None
+    EASY_FRAMEWORK_AUTH_REVOCATION_LIST: t.Optional[t.Type[BaseRevocationList]] = MemoryRevocationList
+    EASY_FRAMEWORK_AUTH_REVOCATION_LIST_STORE: BaseRevocationList = field(init=False)
+    EASY_FRAMEWORK_AUTH_SESSION_SWEEPER: t.Optional[bool] = False
+    EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_INTERVAL: t.Optional[timedelta] = timedelta(hours=1)
+    EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_JITTER: t.Optional[timedelta] = timedelta(minutes=5)
+    EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_BATCH_SIZE: t.Optional[int] = 1000
+    EASY_FRAMEWORK_AUTH_SESSION_SWEEPER_BATCH_PAUSE: t.Optional[float] = 0.1
 
     # ----- USER CONFIG -----
     EASY_FRAMEWORK_USER_MODEL: t.Optional[UserModel] = UserModel
@@ -77,3 +156,15 @@ class Config:
     EASY_FRAMEWORK_VIEW_FOLDER: t.Optional[str] = "views"
     EASY_FRAMEWORK_VIEW_AUTO_IMPORT: t.Optional[bool] = False
     EASY_FRAMEWORK_VIEW_CLASS_NAME: t.Optional[str] = "View"
+    EASY_FRAMEWORK_VIEW_LAZY_IMPORT: t.Optional[bool] = False
+    EASY_FRAMEWORK_VIEW_PRELOAD_LAZY: t.Optional[bool] = False
+    EASY_FRAMEWORK_VIEW_MANIFEST_PATH: t.Optional[str] = None
+    EASY_FRAMEWORK_VIEW_PAGINATE: t.Optional[bool] = False
+    EASY_FRAMEWORK_VIEW_PAGE_SIZE: t.Optional[int] = 50
+    EASY_FRAMEWORK_VIEW_MAX_PAGE_SIZE: t.Optional[int] = 1000
+    EASY_FRAMEWORK_VIEW_COUNT_MODE: t.Optional[str] = "none"
+    EASY_FRAMEWORK_VIEW_COUNT_TTL: t.Optional[float] = 10
+    EASY_FRAMEWORK_VIEW_CONDITIONAL_GET: t.Optional[bool] = False
+    EASY_FRAMEWORK_VIEW_RESPONSE_CACHE: t.Optional[bool] = False
+    EASY_FRAMEWORK_VIEW_RESPONSE_CACHE_TTL: t.Optional[float] = 60
+    EASY_FRAMEWORK_VIEW_RESPONSE_CACHE_SIZE: t.Optional[int] = 1024
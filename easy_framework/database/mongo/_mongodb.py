@@ -4,6 +4,11 @@ from easy_framework._context import cache
 
 
 class Mongodb:
+    """
+    Mongo database connection (mongoengine default alias).
+    The client only connects on the first operation, so it's safe
+    to create it before forking the workers.
+    """
 
     def __init__(self):
         self.uri: str = cache.config.EASY_FRAMEWORK_DB_MONGO_URI
@@ -17,6 +22,7 @@ class Mongodb:
         self.client = connect(
             host=f"mongodb://{self.username}:{self.password}@{self.uri}:{self.port}/{self.database}?authMechanism={self.authMecanism}&authSource={self.authSource}",
             uuidrepresentation="standard",
+            connect=False,
         )
 
     def delete_all(self):
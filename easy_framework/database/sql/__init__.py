@@ -1,3 +1,7 @@
 from ._base import Base
 from ._sqldb import Sqldb
 from ._dbConfig import DbConfig
+from ._pool import PoolStatistics
+from ._replica import ReplicaSet, RoutingSession
+from ._asyncDbConfig import AsyncDbConfig
+from ._asyncSqldb import AsyncSqldb
@@ -0,0 +1,100 @@
+import asyncio
+import os
+import typing as t
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from ._dbConfig import DbConfig
+
+
+class AsyncDbConfig(DbConfig):
+    """
+    DbConfig of the asyncio engine (`create_async_engine`) and its `AsyncSession`s.
+
+    The url is the one of the DbConfig with the asyncio driver of the dialect
+    (EG. `sqlite` -> `sqlite+aiosqlite`, `postgresql` -> `postgresql+asyncpg`),
+    or `async_dialect` when given. The driver must be installed.
+
+    The sessions don't expire the entities on commit: they can't lazy load
+    their attributes after the session is closed.
+    """
+
+    async_drivers: t.Dict[str, str] = {
+        "sqlite": "sqlite+aiosqlite",
+        "postgresql": "postgresql+asyncpg",
+        "postgresql+psycopg2": "postgresql+asyncpg",
+        "mysql": "mysql+aiomysql",
+        "mariadb": "mariadb+aiomysql",
+    }
+    engine_factory = staticmethod(create_async_engine)
+
+    def __init__(self, *args, async_dialect: t.Optional[str] = None, **kwargs) -> None:
+        self.async_dialect = async_dialect
+        super().__init__(*args, **kwargs)
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return super().engine
+
+    def getStringUri(self) -> str:
+        """
+        returns the uri connection string, with the asyncio driver
+        """
+        url = make_url(super().getStringUri())
+        drivername = self.async_dialect or self.async_drivers.get(url.drivername, url.drivername)
+        return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+    def createSessionFactories(self, engine: AsyncEngine) -> t.Tuple[async_sessionmaker, async_scoped_session]:
+        """
+        returns the async session factory and the scoped session registry (one session per asyncio task)
+        """
+        return (
+            async_sessionmaker(engine, expire_on_commit=False),
+            async_scoped_session(
+                async_sessionmaker(engine, expire_on_commit=False),
+                scopefunc=asyncio.current_task,
+            ),
+        )
+
+    def dispose(self) -> None:
+        """
+        Drop the pooled connections of the current process without closing them:
+        they belong to the event loops that opened them. Use `adispose` inside the event loop
+        """
+        if self._engine is not None and self._pid == os.getpid():
+            self._engine.sync_engine.dispose(close=False)
+
+    async def adispose(self) -> None:
+        """
+        Close all the pooled connections of the current process
+        """
+        if self._engine is not None and self._pid == os.getpid():
+            await self._engine.dispose()
+
+    def create_all(self) -> None:
+        """
+        Create all tables for all models registered within the same base.
+        Don't call it from a running event loop, await `acreate_all` instead
+        """
+        asyncio.run(self.acreate_all())
+
+    def delete_all(self) -> None:
+        """
+        Drop all tables for all models registered within the same base.
+        Don't call it from a running event loop, await `adelete_all` instead
+        """
+        asyncio.run(self.adelete_all())
+
+    async def acreate_all(self) -> None:
+        async with self.engine.begin() as connection:
+            await connection.run_sync(self.base.metadata.create_all)
+
+    async def adelete_all(self) -> None:
+        async with self.engine.begin() as connection:
+            await connection.run_sync(self.base.metadata.drop_all)
@@ -0,0 +1,117 @@
+import asyncio
+import typing as t
+from contextvars import ContextVar
+
+from flask import Flask
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ._asyncDbConfig import AsyncDbConfig
+from ._sqldb import Sqldb
+from easy_framework._context import cache
+
+
+class AsyncSessionFactory:
+    """
+    Async session factory to be used within `async with` scope.
+
+    Nested scopes in the same asyncio task share the same session, and only the
+    outermost one closes it. Concurrent tasks (EG. `asyncio.gather`) get their own
+    sessions: an AsyncSession can't run two queries at the same time.
+    """
+
+    def __init__(self, cls: "AsyncSqldb"):
+        self.cls = cls
+        self.dbSession: t.Optional[AsyncSession] = None
+        self.token = None
+
+    async def __aenter__(self) -> AsyncSession:
+        task = asyncio.current_task()
+        current = self.cls._task_session.get()
+        if current is not None and current[0] is task:
+            return current[1]
+
+        self.dbSession = self.cls.getNewSession()
+        self.token = self.cls._task_session.set((task, self.dbSession))
+        return self.dbSession
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        if self.token is None:
+            return
+        self.cls._task_session.reset(self.token)
+        await self.dbSession.close()
+
+
+class AsyncSqldb(Sqldb):
+    """
+    Asyncio version of the Sqldb, for `async def` views (see AsyncGenericApiView)
+    and the `aget_one`, `aget_many`, `asave`... methods of the models.
+    It connects to the same database as the Sqldb, through the asyncio driver
+    of the dialect (EG. aiosqlite, asyncpg).
+
+    Enabled by the `EASY_FRAMEWORK_DB_SQL_ASYNC_ACTIVATE` config. The async sessions are
+    commited by each model call (there is no unit of work) and the reads always go to the primary.
+
+    Flask runs each async view in its own event loop, and the pooled asyncio connections
+    can't be shared by different loops: the engine uses the `EASY_FRAMEWORK_DB_SQL_ASYNC_POOL_CLASS`
+    (NullPool by default) instead of the POOL_CLASS of the environment.
+    """
+
+    dbConfigClass = AsyncDbConfig
+    config_key = "EASY_FRAMEWORK_DB_ASYNC_SQLDB"
+
+    def __init__(self, flaskApp: Flask = None) -> None:
+        self._task_session: ContextVar[t.Optional[t.Tuple[asyncio.Task, AsyncSession]]] = ContextVar(
+            "easy_framework.async_sql_session", default=None
+        )
+        super().__init__(flaskApp)
+        self.unit_of_work = False
+
+    def getDbConfigOptions(self, env: str) -> t.Dict[str, t.Any]:
+        """
+        get the parameters of the async database config class for the environment.
+        The tables are created by the Sqldb
+        """
+        options = super().getDbConfigOptions(env)
+        del options["replicas"], options["read_your_writes"]
+        options["create_all"] = False
+        options["async_dialect"] = getattr(cache.config, f"EASY_FRAMEWORK_DB_{env}_SQL_ASYNC_DIALECT", None)
+        return options
+
+    def getEngineOptions(self, env: str) -> t.Dict[str, t.Any]:
+        options = super().getEngineOptions(env)
+        poolclass = getattr(cache.config, "EASY_FRAMEWORK_DB_SQL_ASYNC_POOL_CLASS", "NullPool")
+        if poolclass is not None:
+            options["poolclass"] = poolclass
+        else:
+            options.pop("poolclass", None)
+        return options
+
+    def getReplicaSet(self, env: str) -> None:
+        return None
+
+    def getNewSession(self) -> AsyncSession:
+        """
+        retrieves a new async session. Don't forget to close it (`await dbSession.close()`)
+        """
+        return self.dbConfig.session()
+
+    def getUnscopedSession(self) -> AsyncSession:
+        return self.dbConfig.session()
+
+    def getScopedSession(self) -> AsyncSessionFactory:
+        """
+        retrieve an async session and close it automatically when finishing using it.
+
+        ### How to use:
+        ```
+        > async with database.getScopedSession() as dbSession:
+        >     result = await dbSession.scalars(select(Model))
+        ```
+        """
+        return AsyncSessionFactory(self)
+
+    async def commitSession(self, dbSession: AsyncSession) -> None:
+        await dbSession.commit()
+
+    async def closeSession(self) -> None:
+        await self.dbConfig.session_scoped.remove()
@@ -1,8 +1,16 @@
+import os
+import threading
+import typing as t
+from datetime import timedelta
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm.session import close_all_sessions, Engine
 
 from ._base import Base as DefaultBase
+from ._pool import PoolStatistics, get_pool_class, measured_pool_class, register_idle_ping
+from ._replica import ReplicaSet, RoutingSession
 
 
 class DbConfig:
@@ -10,6 +18,15 @@ class DbConfig:
     SQLAlchemy Database configuration class.
     Here we define the engine and prepare the sessions and scoped sessions
     to be used by the main database class
+
+    The engine (and its connection pool) is created lazily, on first use, by each
+    process: a worker forked after the setup never reuses the connections of its parent.
+
+    `engine_options` are the `create_engine` parameters (pool_size, max_overflow, poolclass, ...),
+    plus `pool_ping_idle_after`: see `register_idle_ping`.
+
+    With `replicas`, the sessions are RoutingSessions: the reads made inside `Sqldb.readOnly()`
+    go to the replicas, except during `read_your_writes` after a write (see RoutingSession).
     """
 
     __dialect: str
@@ -21,9 +38,10 @@ class DbConfig:
 
     echo: bool = False
     base: DefaultBase
-    engine: Engine
-    session: Session
-    session_scoped: scoped_session
+    default_engine_options: t.Dict[str, t.Any] = {"pool_recycle": 300, "pool_pre_ping": True}
+    engine_factory = staticmethod(create_engine)
+    # create_engine parameters that a NullPool doesn't accept
+    queue_pool_options = ("pool_size", "max_overflow", "pool_timeout", "pool_use_lifo")
 
     def __init__(
         self,
@@ -35,6 +53,9 @@ class DbConfig:
         password,
         create_all,
         base=DefaultBase,
+        engine_options: t.Optional[t.Dict[str, t.Any]] = None,
+        replicas: t.Optional[ReplicaSet] = None,
+        read_your_writes: timedelta = timedelta(seconds=5),
     ) -> None:
         self.__dialect = dialect
         self.__username = username
@@ -44,25 +65,118 @@ class DbConfig:
         self.__uri = uri
 
         self.base = base
+        self.engine_options = dict(self.default_engine_options if engine_options is None else engine_options)
+        self.statistics = PoolStatistics()
+        self.replicas = replicas
+        self.read_your_writes = read_your_writes
 
         self.string_url = self.getStringUri()
-        self.engine = self.createEngine()
-
-        self.session = sessionmaker(bind=self.engine)
-        self.session_scoped = scoped_session(sessionmaker(bind=self.engine))
+        self._pid = None
+        self._engine = None
+        self._lock = threading.Lock()
         if create_all:
             self.create_all()
 
-    def createEngine(self) -> Engine:
+    @property
+    def engine(self) -> Engine:
+        """
+        The engine of the current process, created on first use (and again after a fork)
+        """
+        if self._pid != os.getpid():
+            self.createProcessEngine()
+        return self._engine
+
+    @property
+    def session(self) -> sessionmaker:
+        if self._pid != os.getpid():
+            self.createProcessEngine()
+        return self._session
+
+    @property
+    def session_scoped(self) -> scoped_session:
+        if self._pid != os.getpid():
+            self.createProcessEngine()
+        return self._session_scoped
+
+    def createProcessEngine(self) -> None:
+        """
+        Create the engine and the session factories of the current process
+        """
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            if self._engine is not None:
+                # inherited from the parent process: drop its pool without closing the parent connections
+                getattr(self._engine, "sync_engine", self._engine).dispose(close=False)
+                self.statistics = PoolStatistics()
+            engine = self.createEngine()
+            self._session, self._session_scoped = self.createSessionFactories(engine)
+            self._engine = engine
+            self._pid = os.getpid()
+
+    def createSessionFactories(self, engine: Engine) -> t.Tuple[sessionmaker, scoped_session]:
+        """
+        returns the session factory and the scoped session registry of the engine
+        """
+        session_options = {}
+        if self.replicas is not None:
+            self.replicas.create_engines(self.createEngine)
+            session_options = {
+                "class_": RoutingSession,
+                "replicas": self.replicas,
+                "read_your_writes": self.read_your_writes,
+            }
+        return (
+            sessionmaker(bind=engine, **session_options),
+            scoped_session(sessionmaker(bind=engine, **session_options)),
+        )
+
+    def dispose(self) -> None:
+        """
+        Close all the pooled connections of the current process.
+        Call it before forking, so the workers don't inherit open connections
+        """
+        if self._engine is not None and self._pid == os.getpid():
+            self._engine.dispose()
+            if self.replicas is not None:
+                self.replicas.dispose()
+
+    def createEngine(self, url: t.Optional[str] = None, statistics: t.Optional[PoolStatistics] = None) -> Engine:
         """
-        returns the SQLAlchemy engine
+        returns the SQLAlchemy engine (of the primary, or of the replica `url`)
         """
-        return create_engine(
-            self.string_url,
-            pool_recycle=300,
-            pool_pre_ping=True,
-            echo=self.echo,
+        url = url or self.string_url
+        statistics = statistics or self.statistics
+        options = dict(self.engine_options)
+        options.setdefault("echo", self.echo)
+        ping_idle_after = options.pop("pool_ping_idle_after", None)
+        if ping_idle_after is not None:
+            options["pool_pre_ping"] = False
+
+        poolclass = get_pool_class(url, options.pop("poolclass", None))
+        if issubclass(poolclass, NullPool):
+            for key in self.queue_pool_options:
+                options.pop(key, None)
+        engine = self.engine_factory(
+            url,
+            poolclass=measured_pool_class(poolclass, statistics),
+            **options,
         )
+        if ping_idle_after is not None:
+            register_idle_ping(getattr(engine, "sync_engine", engine), ping_idle_after, statistics)
+        return engine
+
+    def pool_statistics(self) -> t.Dict[str, t.Any]:
+        """
+        Statistics of the connection pool of the current process, for metrics scraping:
+        checkouts, timeouts, disconnects, wait time, and the pool size,
+        checked in and out connections and overflow (when the pool class has them)
+        """
+        current = self._engine is not None and self._pid == os.getpid()
+        statistics = self.statistics.to_dict(self._engine.pool if current else None)
+        if self.replicas is not None:
+            statistics["replicas"] = self.replicas.to_dict() if current else []
+        return statistics
 
     def getStringUri(self) -> str:
         """
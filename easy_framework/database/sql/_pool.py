@@ -0,0 +1,122 @@
+from __future__ import annotations
+import typing as t
+import threading
+import time
+
+import sqlalchemy.pool
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import Pool
+
+
+class PoolStatistics:
+    """
+    Counters of the connection pool of a DbConfig, for metrics scraping
+    (see `DbConfig.pool_statistics`).
+
+    `wait_seconds` is the time spent getting a connection from the pool:
+    waiting for a free one, connecting or pinging it.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.disconnects = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add_checkout(self, seconds: float, timeout: bool = False) -> None:
+        with self._lock:
+            if timeout:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def add_disconnect(self) -> None:
+        with self._lock:
+            self.disconnects += 1
+
+    def to_dict(self, pool: t.Optional[Pool] = None) -> t.Dict[str, t.Any]:
+        """
+        The counters, plus the current state of the pool (when it has one)
+        """
+        data: t.Dict[str, t.Any] = {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "disconnects": self.disconnects,
+            "wait_seconds": self.wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+        if pool is not None:
+            data["pool_class"] = type(pool).__name__
+            for key, method in (
+                ("size", "size"),
+                ("checked_in", "checkedin"),
+                ("checked_out", "checkedout"),
+                ("overflow", "overflow"),
+            ):
+                if callable(getattr(pool, method, None)):
+                    data[key] = getattr(pool, method)()
+        return data
+
+
+def get_pool_class(url: str, poolclass: t.Union[str, t.Type[Pool], None] = None) -> t.Type[Pool]:
+    """
+    The pool class to use: the given one (class or name from `sqlalchemy.pool`,
+    EG. "NullPool"), or the default pool class of the dialect
+    """
+    if isinstance(poolclass, str):
+        poolclass = getattr(sqlalchemy.pool, poolclass)
+    if poolclass is None:
+        url = make_url(url)
+        poolclass = url.get_dialect().get_pool_class(url)
+    return poolclass
+
+
+def measured_pool_class(poolclass: t.Type[Pool], statistics: PoolStatistics) -> t.Type[Pool]:
+    """
+    Subclass of the pool class that counts the checkouts and their wait time.
+    Recreated pools (EG. after `engine.dispose()`) keep the same class, and the same statistics
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = poolclass.connect(self)
+        except exc.TimeoutError:
+            statistics.add_checkout(time.perf_counter() - start, timeout=True)
+            raise
+        statistics.add_checkout(time.perf_counter() - start)
+        return connection
+
+    return type(poolclass.__name__, (poolclass,), {"connect": connect, "statistics": statistics})
+
+
+def register_idle_ping(engine: Engine, idle_after: float, statistics: t.Optional[PoolStatistics] = None) -> None:
+    """
+    Ping the pooled connections on checkout, but only the ones that stayed idle in the
+    pool for more than `idle_after` seconds, instead of pinging all of them (`pool_pre_ping`).
+    When the ping fails, the pool discards the connection and retries
+    the checkout with a new one.
+    """
+
+    @event.listens_for(engine, "checkin")
+    def checkin(dbapi_connection, connection_record):
+        connection_record.info["easy_framework_checkin"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        checkin_time = connection_record.info.get("easy_framework_checkin")
+        if checkin_time is None or time.monotonic() - checkin_time < idle_after:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except engine.dialect.loaded_dbapi.Error as error:
+            if not engine.dialect.is_disconnect(error, dbapi_connection, None):
+                raise
+            if statistics is not None:
+                statistics.add_disconnect()
+            raise exc.DisconnectionError() from error
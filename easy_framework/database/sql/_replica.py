@@ -0,0 +1,287 @@
+from __future__ import annotations
+import typing as t
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+
+from flask import g, has_app_context
+from loguru import logger
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session
+
+from ._pool import PoolStatistics
+
+READ_ONLY = "read_only"
+PRIMARY = "primary"
+
+_routing: ContextVar[t.Optional[str]] = ContextVar("easy_framework.sql_routing", default=None)
+_local = threading.local()
+
+
+@contextmanager
+def read_only() -> t.Iterator[None]:
+    """
+    The reads inside the `with` scope can be routed to a replica.
+    It doesn't override an outer `use_primary`
+    """
+    if _routing.get() == PRIMARY:
+        yield
+        return
+    token = _routing.set(READ_ONLY)
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+@contextmanager
+def use_primary() -> t.Iterator[None]:
+    """
+    All the queries inside the `with` scope go to the primary
+    """
+    token = _routing.set(PRIMARY)
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+def mark_write() -> None:
+    """
+    Remember when the current request (or thread, outside requests) wrote to the primary
+    """
+    if has_app_context():
+        g._easy_framework_sql_last_write = time.monotonic()
+    else:
+        _local.last_write = time.monotonic()
+
+
+def last_write() -> t.Optional[float]:
+    if has_app_context():
+        return g.get("_easy_framework_sql_last_write")
+    return getattr(_local, "last_write", None)
+
+
+class ReplicaNode:
+    """
+    A read replica: its engine, the connections in use and its health
+    """
+
+    def __init__(self, url: str, engine: Engine, statistics: PoolStatistics) -> None:
+        self.url = url
+        self.engine = engine
+        self.statistics = statistics
+        self.active = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+
+    @property
+    def name(self) -> str:
+        return make_url(self.url).render_as_string(hide_password=True)
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.ejected_until
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        return {
+            "url": self.name,
+            "healthy": self.healthy,
+            "active": self.active,
+            "failures": self.failures,
+            **self.statistics.to_dict(self.engine.pool),
+        }
+
+
+class ReplicaSet:
+    """
+    The read replicas of a DbConfig.
+
+    ### Selection
+    `round_robin` or `least_connections` (the healthy replica with fewer connections in use).
+
+    ### Health
+    A replica is ejected for `eject_time` when a connection to it fails (or `check_health`
+    can't reach it), and it's used again after that. When there is no healthy replica,
+    the reads go to the primary. With `health_check_interval`, each process checks the
+    replicas in a background thread.
+    """
+
+    selections = ("round_robin", "least_connections")
+
+    def __init__(
+        self,
+        urls: t.List[str],
+        selection: str = "round_robin",
+        eject_time: timedelta = timedelta(seconds=30),
+        health_check_interval: t.Optional[timedelta] = None,
+    ) -> None:
+        if selection not in self.selections:
+            raise ValueError(f"Invalid replica selection {selection!r}, use one of {self.selections}")
+        self.urls = list(urls)
+        self.selection = selection
+        self.eject_time = eject_time
+        self.health_check_interval = health_check_interval
+        self.nodes: t.List[ReplicaNode] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+
+    def create_engines(self, create_engine: t.Callable[[str, PoolStatistics], Engine]) -> None:
+        """
+        Create the replica engines of the current process
+        """
+        for node in self.nodes:
+            node.engine.dispose(close=False)
+        self.nodes = []
+        for url in self.urls:
+            statistics = PoolStatistics()
+            node = ReplicaNode(url, create_engine(url, statistics), statistics)
+            self.register_events(node)
+            self.nodes.append(node)
+
+        self._thread = None
+        if self.health_check_interval:
+            self.start_health_checks()
+
+    def register_events(self, node: ReplicaNode) -> None:
+        @event.listens_for(node.engine, "checkout")
+        def checkout(dbapi_connection, connection_record, connection_proxy):
+            with self._lock:
+                node.active += 1
+
+        @event.listens_for(node.engine, "checkin")
+        def checkin(dbapi_connection, connection_record):
+            with self._lock:
+                node.active = max(node.active - 1, 0)
+
+        @event.listens_for(node.engine, "handle_error")
+        def handle_error(context):
+            if context.is_disconnect or context.connection is None:
+                self.eject(node, context.original_exception)
+
+    def choose(self) -> t.Optional[Engine]:
+        """
+        The engine of the replica that should answer the next read, or None if no replica is healthy
+        """
+        nodes = [node for node in self.nodes if node.healthy]
+        if not nodes:
+            return None
+        if self.selection == "least_connections":
+            return min(nodes, key=lambda node: node.active).engine
+        return nodes[next(self._counter) % len(nodes)].engine
+
+    def eject(self, node: ReplicaNode, error: t.Optional[BaseException] = None) -> None:
+        with self._lock:
+            node.failures += 1
+            node.ejected_until = time.monotonic() + self.eject_time.total_seconds()
+        logger.warning(f"Read replica {node.name} ejected for {self.eject_time.total_seconds():.0f}s: {error}")
+
+    def check_health(self) -> t.Dict[str, bool]:
+        """
+        Ping every replica: the failing ones are ejected, the others are used again
+        """
+        health = {}
+        for node in self.nodes:
+            try:
+                with node.engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+            except Exception as error:
+                if node.healthy:
+                    self.eject(node, error)
+                health[node.name] = False
+            else:
+                node.ejected_until = 0.0
+                health[node.name] = True
+        return health
+
+    def start_health_checks(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_health_checks, name="easy_framework_replica_health", daemon=True)
+        self._thread.start()
+
+    def run_health_checks(self) -> None:
+        while not self._stop.wait(self.health_check_interval.total_seconds()):
+            try:
+                self.check_health()
+            except Exception:
+                logger.exception("Read replica health check failed")
+
+    def stop_health_checks(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def dispose(self) -> None:
+        for node in self.nodes:
+            node.engine.dispose()
+
+    def to_dict(self) -> t.List[t.Dict[str, t.Any]]:
+        return [node.to_dict() for node in self.nodes]
+
+
+class RoutingSession(Session):
+    """
+    Session that sends the reads to the replicas and everything else to the primary.
+
+    A read (SELECT) goes to a replica (the same one for the whole transaction) when it runs inside `Sqldb.readOnly()` (or the
+    session was created with `info={"easy_framework_read_only": True}`), unless:
+    - it's inside `Sqldb.usePrimary()`
+    - the session already wrote in the current transaction
+    - the current request (or thread) wrote less than `read_your_writes` ago
+    """
+
+    wrote_key = "easy_framework_wrote"
+    replica_key = "easy_framework_replica"
+    read_only_key = "easy_framework_read_only"
+
+    def __init__(
+        self,
+        *args,
+        replicas: t.Optional[ReplicaSet] = None,
+        read_your_writes: timedelta = timedelta(seconds=5),
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.read_your_writes = read_your_writes.total_seconds()
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.info[self.wrote_key] = True
+            mark_write()
+        elif self.replicas is not None and self.can_use_replica(clause):
+            # the same replica answers all the reads of a transaction
+            engine = self.info.get(self.replica_key) or self.replicas.choose()
+            if engine is not None:
+                self.info[self.replica_key] = engine
+                return engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def can_use_replica(self, clause) -> bool:
+        routing = _routing.get()
+        if routing == PRIMARY:
+            return False
+        if routing != READ_ONLY and not self.info.get(self.read_only_key):
+            return False
+        if not getattr(clause, "is_select", False) or getattr(clause, "_for_update_arg", None) is not None:
+            return False
+        if self.info.get(self.wrote_key):
+            return False
+        written = last_write()
+        return written is None or time.monotonic() - written >= self.read_your_writes
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _forget_writes(session: RoutingSession, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(RoutingSession.wrote_key, None)
+        session.info.pop(RoutingSession.replica_key, None)
@@ -1,24 +1,44 @@
-from flask import Flask
-from flask import current_app
+import threading
+import typing as t
+from datetime import timedelta
+
+from flask import Flask, Response
+from flask import current_app, g, has_app_context
 from sqlalchemy.orm import Session
 
 from ._dbConfig import DbConfig
+from ._replica import ReplicaSet, read_only, use_primary
 from easy_framework._context import cache
 
 
 class SessionFactory:
     """
-    Session factory to be used within `with` scope
+    Session factory to be used within `with` scope.
+
+    Nested scopes in the same thread share the same session, and only the
+    outermost one closes it. If the unit of work mode is active, the session
+    bound to the current app context is used and it's never closed here.
     """
 
     def __init__(self, cls: "Sqldb"):
         self.cls = cls
+        self.requestSession = None
 
     def __enter__(self):
+        self.requestSession = self.cls.getRequestSession()
+        if self.requestSession is not None:
+            return self.requestSession
+
+        self.cls._local.depth = getattr(self.cls._local, "depth", 0) + 1
         return self.cls.getNewSession()
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self.cls.closeSession()
+        if self.requestSession is not None:
+            return
+
+        self.cls._local.depth -= 1
+        if self.cls._local.depth == 0:
+            self.cls.closeSession()
 
 
 class Sqldb:
@@ -40,13 +60,103 @@ class Sqldb:
         DbConfig  # the class responsible for configurating the db connection
     )
     dbSession: Session = None
+    request_session_key = "_easy_framework_sql_session"
+    config_key = "EASY_FRAMEWORK_DB_SQLDB"  # where the EasyFramework registers it
 
     def __init__(self, flaskApp: Flask = None) -> None:
         if not flaskApp:
             flaskApp = current_app
         self.app = flaskApp
+        self.unit_of_work: bool = bool(
+            getattr(cache.config, "EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK", False)
+        )
+        self._local = threading.local()
         self.dbConfig = self.getDbConfig()
 
+    @classmethod
+    def get_current(cls) -> "Sqldb":
+        """
+        Return the Sqldb registered by the EasyFramework (`EASY_FRAMEWORK_DB_SQLDB`),
+        or a new one if there is none registered yet
+        """
+        sqldb = getattr(cache.config, cls.config_key, None)
+        if isinstance(sqldb, cls):
+            return sqldb
+        return cls()
+
+    def register_request_session(self, flaskApp: Flask) -> None:
+        """
+        Register the unit of work hooks in the flask app. If the
+        `EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK` config is True, a single session is bound to
+        each app context (and so, to each request), shared by all the model calls,
+        and commited once: after the request if the response is not an error, or when
+        the app context is torn down without exceptions. Otherwise it's rolled back.
+        """
+        if not self.unit_of_work:
+            return
+        flaskApp.after_request(self.commitRequestSession)
+        flaskApp.teardown_appcontext(self.teardownRequestSession)
+
+    def getRequestSession(self) -> Session | None:
+        """
+        Return the session bound to the current app context, creating it
+        if needed. Returns None if the unit of work mode is not active.
+        """
+        if not self.unit_of_work or not has_app_context():
+            return None
+
+        dbSession = g.get(self.request_session_key)
+        if dbSession is None:
+            dbSession = self.dbConfig.session()
+            setattr(g, self.request_session_key, dbSession)
+        return dbSession
+
+    def isRequestSession(self, dbSession: Session) -> bool:
+        """
+        Return True if the session is the one bound to the current app context
+        """
+        return has_app_context() and g.get(self.request_session_key) is dbSession
+
+    def commitSession(self, dbSession: Session) -> None:
+        """
+        Commit the session. The session bound to the app context is only flushed:
+        it will be commited once at the end of the request.
+        """
+        if self.isRequestSession(dbSession):
+            dbSession.flush()
+        else:
+            dbSession.commit()
+
+    def commitRequestSession(self, response: Response) -> Response:
+        """
+        `after_request` hook. Commit the request session if the response is not an error
+        (so a failing commit still becomes an error response), or roll it back otherwise.
+        """
+        dbSession: Session = g.get(self.request_session_key)
+        if dbSession is None:
+            return response
+        if response.status_code >= 400:
+            dbSession.rollback()
+        else:
+            dbSession.commit()
+        return response
+
+    def teardownRequestSession(self, exception: BaseException = None) -> None:
+        """
+        `teardown_appcontext` hook. Commit whatever is still pending in the
+        app context session (or roll it back if there was an exception) and close it.
+        """
+        dbSession: Session = g.pop(self.request_session_key, None)
+        if dbSession is None:
+            return
+        try:
+            if exception is None:
+                dbSession.commit()
+            else:
+                dbSession.rollback()
+        finally:
+            dbSession.close()
+
     def getDbConfig(self) -> DbConfig:
         """
         get the database config class by passing all the configs defined
@@ -54,7 +164,13 @@ class Sqldb:
         """
         env: str = cache.config.EASY_FRAMEWORK_ENVIRONMENT.upper()
 
-        return self.dbConfigClass(
+        return self.dbConfigClass(**self.getDbConfigOptions(env))
+
+    def getDbConfigOptions(self, env: str) -> t.Dict[str, t.Any]:
+        """
+        get the parameters of the database config class for the environment
+        """
+        return dict(
             create_all=getattr(cache.config, f"EASY_FRAMEWORK_DB_{env}_SQL_CREATE_ALL"),
             dialect=getattr(cache.config, f"EASY_FRAMEWORK_DB_{env}_SQL_DIALECT"),
             uri=getattr(cache.config, f"EASY_FRAMEWORK_DB_{env}_SQL_URI"),
@@ -62,8 +178,70 @@ class Sqldb:
             databaseName=getattr(cache.config, f"EASY_FRAMEWORK_DB_{env}_SQL_DBNAME"),
             username=getattr(cache.config, f"EASY_FRAMEWORK_DB_{env}_SQL_USERNAME"),
             password=getattr(cache.config, f"EASY_FRAMEWORK_DB_{env}_SQL_PASSWORD"),
+            engine_options=self.getEngineOptions(env),
+            replicas=self.getReplicaSet(env),
+            read_your_writes=getattr(cache.config, "EASY_FRAMEWORK_DB_SQL_READ_YOUR_WRITES", timedelta(seconds=5)),
+        )
+
+    def getReplicaSet(self, env: str) -> t.Optional[ReplicaSet]:
+        """
+        get the read replicas of the environment (None if there is none)
+        """
+        urls = getattr(cache.config, f"EASY_FRAMEWORK_DB_{env}_SQL_REPLICA_URIS", None)
+        if not urls:
+            return None
+        return ReplicaSet(
+            urls,
+            selection=getattr(cache.config, "EASY_FRAMEWORK_DB_SQL_REPLICA_SELECTION", "round_robin"),
+            eject_time=getattr(cache.config, "EASY_FRAMEWORK_DB_SQL_REPLICA_EJECT_TIME", timedelta(seconds=30)),
+            health_check_interval=getattr(cache.config, "EASY_FRAMEWORK_DB_SQL_REPLICA_HEALTH_CHECK_INTERVAL", None),
         )
 
+    def readOnly(self) -> t.ContextManager:
+        """
+        The reads inside the `with` scope can be answered by a read replica (if there is any).
+
+        ### How to use:
+        ```
+        > with database.readOnly(), database.getScopedSession() as dbSession:
+        >     ... # the queries of dbSession can go to a replica
+        ```
+        """
+        return read_only()
+
+    def usePrimary(self) -> t.ContextManager:
+        """
+        All the queries inside the `with` scope go to the primary, even inside `readOnly`
+        """
+        return use_primary()
+
+    def getEngineOptions(self, env: str) -> t.Dict[str, t.Any]:
+        """
+        get the engine and pool parameters of the environment. The ones
+        set to None are not passed, so the SQLAlchemy defaults are used
+        """
+        prefix = f"EASY_FRAMEWORK_DB_{env}_SQL_"
+        options = {
+            "echo": getattr(cache.config, prefix + "ECHO", None),
+            "poolclass": getattr(cache.config, prefix + "POOL_CLASS", None),
+            "pool_size": getattr(cache.config, prefix + "POOL_SIZE", None),
+            "max_overflow": getattr(cache.config, prefix + "POOL_MAX_OVERFLOW", None),
+            "pool_timeout": getattr(cache.config, prefix + "POOL_TIMEOUT", None),
+            "pool_recycle": getattr(cache.config, prefix + "POOL_RECYCLE", 300),
+            "pool_use_lifo": getattr(cache.config, prefix + "POOL_USE_LIFO", None),
+            "pool_pre_ping": getattr(cache.config, prefix + "POOL_PRE_PING", True),
+            "pool_ping_idle_after": getattr(cache.config, prefix + "POOL_PING_IDLE_AFTER", None),
+        }
+        options = {key: value for key, value in options.items() if value is not None}
+        options.update(getattr(cache.config, prefix + "ENGINE_OPTIONS", None) or {})
+        return options
+
+    def pool_statistics(self) -> t.Dict[str, t.Any]:
+        """
+        Statistics of the connection pool (see DbConfig.pool_statistics)
+        """
+        return self.dbConfig.pool_statistics()
+
     # session = getNewSession()
     def getNewSession(self) -> Session:
         """
@@ -71,6 +249,15 @@ class Sqldb:
         """
         return self.dbConfig.session_scoped()
 
+    def getUnscopedSession(self) -> Session:
+        """
+        retrieves a new session that is not shared through the scoped session registry.
+        Useful for long lived iterations (EG. streaming responses) that must not be
+        closed by other `getScopedSession` calls in the same thread.
+        Don't forget to close it after using it.
+        """
+        return self.dbConfig.session()
+
     # with getScopedSession() as dbSession:
     def getScopedSession(self) -> SessionFactory:
         """
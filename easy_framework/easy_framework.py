@@ -1,13 +1,16 @@
 import typing as t
 from pathlib import Path
 import os
+import click
 from flask import Flask
 
 from .database.sql import Base
-from .database.sql import Sqldb
+from .database.sql import Sqldb, AsyncSqldb
 from .database.mongo import Mongodb
 from .view._viewHandler import ViewHandler
 from .config import Config
+from .auth import SessionSweeper
+from ._startupReport import StartupReport
 from easy_framework._context import cache
 
 
@@ -27,6 +30,12 @@ class EasyFramework:
     app = Flask(__name__)
     EasyFramework(app)
     ```
+
+    ### Pre-fork servers
+    The setup runs when `app.run` is called. With a pre-fork server (EG. gunicorn with
+    `--preload`), call `prepare()` when creating the app instead: the setup (views, routes,
+    compiled serializers and validator plans, create_all) runs once in the master process,
+    and the database connections are only opened by each worker, after the fork.
     """
 
     exceptionList: t.List[BaseException] = cache.api_exception_list
@@ -35,24 +44,74 @@ class EasyFramework:
 
     def __init__(self, flaskApp: Flask) -> None:
         self.app = flaskApp
+        self.prepared = False
+        self.startup_report: t.Optional[StartupReport] = None
 
         self.run_server = self.app.run
         self.app.run = self._before_run_server
         self.setupCache()
 
     def _before_run_server(self, *args, **kwargs):
-        self.run_all_configs()
+        self.prepare(preload_views=self.config.EASY_FRAMEWORK_VIEW_PRELOAD_LAZY is True)
         self.run_server(*args, **kwargs)
 
-    def run_all_configs(self):
-        self.database_register()
-        self.database_create_all()
-        self.exceptions_register()
-        self.authView_register()
-        self.userManager_register()
-        self.authManager_register()
-        self.passwordManager_register()
-        self.auto_import_view()
+    def prepare(self, preload_views: bool = True) -> StartupReport:
+        """
+        Run the setup once, before the workers are forked.
+        With `preload_views`, the lazy views (`EASY_FRAMEWORK_VIEW_LAZY_IMPORT`) are
+        imported and prepared now, so the workers share them instead of importing them again.
+        `app.run` only preloads them with `EASY_FRAMEWORK_VIEW_PRELOAD_LAZY`.
+        The connections opened by the setup are closed: each process opens its own.
+        """
+        if self.prepared:
+            return self.startup_report
+
+        report = self.create_startup_report()
+        with report.activate():
+            self.run_all_configs(report)
+            if preload_views:
+                with report.phase("preload_views"):
+                    ViewHandler.load_lazy_views(self.app)
+        self.database_dispose()
+        self.prepared = True
+
+        report.log()
+        return report
+
+    def run_all_configs(self, report: t.Optional[StartupReport] = None) -> StartupReport:
+        """
+        Run all the setup phases, measuring each one in the startup report
+        (a new one, logged at the end, if not given)
+        """
+        standalone = report is None
+        if standalone:
+            report = self.create_startup_report()
+        self.startup_report = report
+        self.app.startup_report = report
+
+        with report.activate():
+            for phase in (
+                self.database_register,
+                self.database_create_all,
+                self.exceptions_register,
+                self.authView_register,
+                self.userManager_register,
+                self.authManager_register,
+                self.passwordManager_register,
+                self.tokenCache_register,
+                self.revocationList_register,
+                self.sessionSweeper_register,
+                self.auto_import_view,
+            ):
+                with report.phase(phase.__name__):
+                    phase()
+
+        if standalone:
+            report.log()
+        return report
+
+    def create_startup_report(self) -> StartupReport:
+        return StartupReport(trace_memory=self.config.EASY_FRAMEWORK_STARTUP_TRACE_MEMORY is True)
 
     def setupCache(self):
         cache.app = self.app
@@ -66,6 +125,7 @@ class EasyFramework:
         """
         if self.config.EASY_FRAMEWORK_AUTH_VIEW_AUTO_REGISTER is True:
             view = self.config.EASY_FRAMEWORK_AUTH_VIEW
+            view.prepare_view()
             for route in view.routes:
                 self.app.add_url_rule(
                     route, view_func=view.as_view(view.name + "/" + route)
@@ -96,16 +156,78 @@ class EasyFramework:
         """
         self.app.passwordManager = self.config.EASY_FRAMEWORK_AUTH_PASSWORD_MANAGER()
 
+    def tokenCache_register(self):
+        """
+        Register the token cache specified in the config (`EASY_FRAMEWORK_AUTH_TOKEN_CACHE`).
+        It's disabled (None) by default. `MemoryTokenCache` is local to each process: with
+        many workers, a closed session or a changed password is only seen by the other
+        workers when their entries expire (`EASY_FRAMEWORK_AUTH_TOKEN_CACHE_TTL`)
+        """
+        tokenCache = self.config.EASY_FRAMEWORK_AUTH_TOKEN_CACHE
+        self.config.EASY_FRAMEWORK_AUTH_TOKEN_CACHE_STORE = (
+            tokenCache(
+                self.config.EASY_FRAMEWORK_AUTH_TOKEN_CACHE_SIZE,
+                self.config.EASY_FRAMEWORK_AUTH_TOKEN_CACHE_TTL,
+            )
+            if tokenCache is not None
+            else None
+        )
+
+    def revocationList_register(self):
+        """
+        Register the revocation list of the signed tokens specified in the
+        config (`EASY_FRAMEWORK_AUTH_REVOCATION_LIST`). Set the config to None to disable it
+        """
+        revocationList = self.config.EASY_FRAMEWORK_AUTH_REVOCATION_LIST
+        self.config.EASY_FRAMEWORK_AUTH_REVOCATION_LIST_STORE = (
+            revocationList() if revocationList is not None else None
+        )
+
+    def sessionSweeper_register(self):
+        """
+        Register the expired sessions sweeper: the `flask sweep-sessions` CLI command and,
+        if the config `EASY_FRAMEWORK_AUTH_SESSION_SWEEPER` is set to True, the background thread.
+        The thread is started by the first request of each process, never by the
+        pre-fork master (`prepare`), whose threads are not copied to the workers
+        """
+        sweeper = SessionSweeper(self.app)
+        self.app.sessionSweeper = sweeper
+
+        if "sweep-sessions" not in self.app.cli.commands:
+
+            @self.app.cli.command("sweep-sessions")
+            def sweep_sessions():
+                """Delete the expired sessions."""
+                report = self.app.sessionSweeper.sweep()
+                click.echo(f"{report.deleted} sessions deleted in {report.seconds:.3f}s")
+
+        if self.config.EASY_FRAMEWORK_AUTH_SESSION_SWEEPER is True:
+            self.app.before_request(sweeper.ensure_started)
+
     def database_register(self):
         """
-        Initializes and register the Sqldb in the config
+        Initializes and register the Sqldb (and the AsyncSqldb, if activated) in the config
         """
         if self.config.EASY_FRAMEWORK_DB_SQL_ACTIVATE:
             self.config.EASY_FRAMEWORK_DB_SQLDB = Sqldb(self.app)
+            self.config.EASY_FRAMEWORK_DB_SQLDB.register_request_session(self.app)
+            if self.config.EASY_FRAMEWORK_DB_SQL_ASYNC_ACTIVATE:
+                self.config.EASY_FRAMEWORK_DB_ASYNC_SQLDB = AsyncSqldb(self.app)
 
         if self.config.EASY_FRAMEWORK_DB_MONGO_ACTIVATE:
             self.config.EASY_FRAMEWORK_DB_MONGODB = Mongodb()
 
+    def database_dispose(self):
+        """
+        Close the pooled connections of the Sqldb (the engine is created again on first use)
+        """
+        database: t.Optional[Sqldb] = getattr(self.config, "EASY_FRAMEWORK_DB_SQLDB", None)
+        if self.config.EASY_FRAMEWORK_DB_SQL_ACTIVATE and database is not None:
+            database.dbConfig.dispose()
+        async_database: t.Optional[AsyncSqldb] = getattr(self.config, "EASY_FRAMEWORK_DB_ASYNC_SQLDB", None)
+        if self.config.EASY_FRAMEWORK_DB_SQL_ASYNC_ACTIVATE and async_database is not None:
+            async_database.dbConfig.dispose()
+
     def database_create_all(self):
         env: str = self.config.EASY_FRAMEWORK_ENVIRONMENT
         if getattr(self.config, f"EASY_FRAMEWORK_DB_{env.upper()}_SQL_CREATE_ALL"):
@@ -113,9 +235,20 @@ class EasyFramework:
             Base.metadata.create_all(database.dbConfig.engine)
 
     def auto_import_view(self):
+        """
+        Register the views of the `EASY_FRAMEWORK_VIEW_FOLDER` if the config `EASY_FRAMEWORK_VIEW_AUTO_IMPORT`
+        is set to True. With `EASY_FRAMEWORK_VIEW_LAZY_IMPORT`, the routes come from the cached view manifest
+        and each view module is imported on the first request to one of its routes
+        """
         if self.config.EASY_FRAMEWORK_VIEW_AUTO_IMPORT is True:
 
             view_folder = self.config.EASY_FRAMEWORK_VIEW_FOLDER
             view_class_name = self.config.EASY_FRAMEWORK_VIEW_CLASS_NAME
 
-            ViewHandler.register_views(view_folder, self.app, view_class_name)
+            ViewHandler.register_views(
+                view_folder,
+                self.app,
+                view_class_name,
+                lazy_import=self.config.EASY_FRAMEWORK_VIEW_LAZY_IMPORT is True,
+                manifest_path=self.config.EASY_FRAMEWORK_VIEW_MANIFEST_PATH,
+            )
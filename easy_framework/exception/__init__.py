@@ -3,4 +3,5 @@ from .apiExceptions import ValidationError
 from .apiExceptions import AuthMissingError
 from .apiExceptions import InvalidCredentials
 from .apiExceptions import InvalidSession
-from .apiExceptions import NotTheOwner
\ No newline at end of file
+from .apiExceptions import NotTheOwner
+from .apiExceptions import ServiceUnavailable
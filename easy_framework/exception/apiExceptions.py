@@ -46,3 +46,13 @@ class InvalidCredentials(BaseException):
 class NotTheOwner(BaseException):
     message: t.Dict[str, t.Any] = {"msg": "User does not have permission"}
     status_code: int = 401
+
+
+@register_api_exception
+class ServiceUnavailable(BaseException):
+    message: t.Dict[str, t.Any] = {"msg": "Service unavailable. Try again later."}
+    status_code: int = 503
+
+    def __init__(self, message: t.Dict[str, t.Any] = None) -> None:
+        if message:
+            self.message = message
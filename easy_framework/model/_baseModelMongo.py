@@ -1,13 +1,22 @@
 from __future__ import annotations
+import functools
+import operator
 import typing as t
 from abc import ABC, abstractmethod
 
+from datetime import datetime, timezone
+
 import bson
 
 from easy_framework.user.utils import current_user
 from easy_framework.user.userMixin import UserMixin
 from mongoengine import Document
 from mongoengine import fields
+from mongoengine.queryset.visitor import Q
+from pymongo import UpdateOne
+
+from easy_framework.model._utils import parse_query_value
+from easy_framework.model._writeGeneration import bump_write_generation
 
 
 class BaseModelMongo(Document):
@@ -16,24 +25,341 @@ class BaseModelMongo(Document):
     id: bson.ObjectId
     _deleted = fields.BooleanField(required=True, default=False)
     _owner_id = fields.DynamicField(default=lambda: current_user.id if isinstance(current_user, UserMixin) else "")
+    _updated_at = fields.DateTimeField(default=lambda: datetime.now(timezone.utc))
 
     @classmethod
-    def get_one(cls, *args, **kwargs)-> t.Self:
+    def get_queryset(cls, *args: Q, **kwargs) -> t.Any:
+        '''
+        Queryset of the not deleted documents matching all the `args` Q objects and the `kwargs`
+        '''
+        queryset = cls.objects(**{**kwargs, '_deleted': False})
         if args:
-            res: t.Self = cls.objects(*args, **{"_deleted":False}).first()
-        else: 
-            res: t.Self = cls.objects(**{**kwargs, '_deleted':False}).first()
+            queryset = queryset.filter(functools.reduce(operator.and_, args))
+        return queryset
+
+    @classmethod
+    def get_one(cls, *args, only: t.Optional[t.Iterable[str]] = None, **kwargs)-> t.Self:
+        queryset = cls.get_queryset(*args, **kwargs)
+        res: t.Self = cls.apply_only(queryset, only).first()
         return res
     
     @classmethod
-    def get_many(cls: t.Type[t.Self], *args, **kwargs)-> t.List[t.Self]:
-        return cls.objects(*args, **{**kwargs, '_deleted':False})
+    def get_many(
+        cls: t.Type[t.Self],
+        *args,
+        only: t.Optional[t.Iterable[str]] = None,
+        order_by: t.Optional[str] = None,
+        **kwargs,
+    )-> t.List[t.Self]:
+        '''
+        `only` limits the loaded fields (see `apply_only`).
+        `order_by` sorts by a field (prefix it with `-` for descending order), and by the `id` as tie breaker
+        '''
+        queryset = cls.apply_only(cls.get_queryset(*args, **kwargs), only)
+        if order_by is not None:
+            queryset = cls.seek_queryset(queryset, order_by, None)
+        return queryset
+
+    @classmethod
+    def apply_only(cls, queryset, only: t.Optional[t.Iterable[str]]):
+        '''
+        Project the queryset on the `only` fields (`.only()`, the id is always loaded),
+        so the other ones never leave the database. Returns the queryset unchanged if `only`
+        is None or has a name that is not a field of the document (EG. a `fields.Method`
+        of the serializer), as it could need any field
+        '''
+        if only is None:
+            return queryset
+        only = list(only)
+        if any(key not in cls._fields for key in only):
+            return queryset
+        return queryset.only(*only or ['id'])
     
+    @classmethod
+    def get_page(
+        cls,
+        *args,
+        filters: t.Optional[t.Dict[str, t.Any]] = None,
+        after: t.Optional[t.Sequence[t.Any]] = None,
+        limit: t.Optional[int] = None,
+        order_by: str = 'id',
+        only: t.Optional[t.Iterable[str]] = None,
+    ) -> t.List[t.Self]:
+        '''
+        Keyset (seek) pagination. Returns up to `limit` documents ordered by `order_by`
+        (prefix it with `-` for descending order) and the `id` as tie breaker.
+
+        `after` is the sort key of the last document of the previous page: `(id,)` when
+        ordering by id, or `(value, id)` for any other field.
+        `only` limits the loaded fields (the sort key is always loaded).
+        '''
+        if only is not None:
+            only = [*only, order_by.lstrip('-+')]
+        queryset = cls.get_queryset(*args, **(filters or {}))
+        queryset = cls.apply_only(queryset, only)
+        queryset = cls.seek_queryset(queryset, order_by, after)
+        if limit is not None:
+            queryset = queryset.limit(limit)
+        return list(queryset)
+
+    @classmethod
+    def iter_many(
+        cls,
+        *args,
+        filters: t.Optional[t.Dict[str, t.Any]] = None,
+        batch_size: int = 1000,
+        only: t.Optional[t.Iterable[str]] = None,
+        order_by: str = 'id',
+    ) -> t.Iterator[t.Self]:
+        '''
+        Iterate over all the documents, ordered by `order_by` (the id by default), fetching `batch_size`
+        documents per cursor batch. The queryset cache is disabled so the
+        memory stays flat regardless of the result size.
+        `only` limits the loaded fields.
+        '''
+        queryset = cls.apply_only(cls.get_queryset(*args, **(filters or {})), only)
+        queryset = cls.seek_queryset(queryset, order_by, None)
+        yield from queryset.batch_size(batch_size).no_cache()
+
+    @classmethod
+    def count(cls, *args, **kwargs) -> int:
+        '''
+        Number of documents matching the filters
+        '''
+        return cls.get_queryset(*args, **kwargs).count()
+
+    @classmethod
+    def get_version(cls, *args, **kwargs) -> t.Tuple[int, t.Optional[datetime]]:
+        '''
+        The number of documents matching the filters and their last `_updated_at`.
+        Used as the version of a list (see `GenericApiView.conditional_get`)
+        '''
+        queryset = cls.get_queryset(*args, **kwargs)
+        last = queryset.order_by('-_updated_at').scalar('_updated_at').first()
+        return queryset.count(), last
+
+    @classmethod
+    def estimate_count(cls) -> t.Optional[int]:
+        '''
+        Estimated number of documents of the collection, from its metadata
+        (`estimated_document_count`, the soft deleted ones are included)
+        '''
+        return cls._get_collection().estimated_document_count()
+
+    @classmethod
+    def seek_queryset(cls, queryset, order_by: str, after: t.Optional[t.Sequence[t.Any]]):
+        '''
+        Apply the sort and the keyset filter used by `get_page`.
+        MongoDB sorts the null (and missing) values as the smallest ones:
+        first in ascending order, last in descending order.
+        '''
+        descending = order_by.startswith('-')
+        key = order_by.lstrip('-+')
+        operator = 'lt' if descending else 'gt'
+        sign = '-' if descending else '+'
+
+        if key == 'id':
+            if after:
+                queryset = queryset.filter(**{f'id__{operator}': after[0]})
+            return queryset.order_by(f'{sign}id')
+
+        if after:
+            value, last_id = after
+            # `key > null` is never true: the nulls are seeked explicitly
+            if value is None:
+                condition = Q(**{key: None, f'id__{operator}': last_id})
+                if not descending:
+                    condition |= Q(**{f'{key}__ne': None})
+            else:
+                condition = Q(**{f'{key}__{operator}': value}) | Q(**{key: value, f'id__{operator}': last_id})
+                if descending:
+                    condition |= Q(**{key: None})
+            queryset = queryset.filter(condition)
+        return queryset.order_by(f'{sign}{key}', f'{sign}id')
+
+    @classmethod
+    def filter_expression(cls, field: str, operator: str, value: t.Any) -> Q:
+        '''
+        Q object of a list endpoint filter (see `FilterSpec`):
+        `eq`, `in` (a list of values), `gt`, `gte`, `lt`, `lte` or `prefix`
+        '''
+        if operator == 'eq':
+            return Q(**{field: value})
+        if operator == 'prefix':
+            return Q(**{f'{field}__startswith': value})
+        if operator in ('in', 'gt', 'gte', 'lt', 'lte'):
+            return Q(**{f'{field}__{operator}': value})
+        raise ValueError(f'Unknown filter operator {operator!r}')
+
+    @classmethod
+    def get_filter_parser(cls, field: str) -> t.Optional[t.Callable[[str], t.Any]]:
+        '''
+        Function converting a query string value to the type of the `field`,
+        or None if `field` is not a field of the document
+        '''
+        document_field = cls._fields.get(field)
+        if document_field is None:
+            return None
+        if isinstance(document_field, fields.BooleanField):
+            return functools.partial(parse_query_value, bool)
+
+        def parse(value: str) -> t.Any:
+            return document_field.prepare_query_value(None, document_field.to_python(value))
+        return parse
+
+    @classmethod
+    def is_indexed_field(cls, field: str) -> bool:
+        '''
+        Return True if the `field` is the first key of an index (or the id)
+        '''
+        document_field = cls._fields.get(field)
+        if document_field is None:
+            return False
+        if field == 'id' or document_field.primary_key or document_field.unique:
+            return True
+        return any(
+            spec['fields'][0][0] == document_field.db_field
+            for spec in cls._meta.get('index_specs') or []
+        )
+
+    @classmethod
+    def parse_cursor_values(cls, order_by: str, values: t.Sequence[t.Any]) -> t.Tuple:
+        '''
+        Convert the values decoded from a pagination cursor back to
+        the python type of the sort key fields
+        '''
+        keys = [order_by.lstrip('-+')]
+        if keys[0] != 'id':
+            keys.append('id')
+        if len(values) != len(keys):
+            raise ValueError('cursor does not match the sort key')
+
+        parsed = []
+        for key, value in zip(keys, values):
+            field = cls._fields[key]
+            if value is not None and isinstance(field, fields.BooleanField) and not isinstance(value, bool):
+                raise ValueError(f'invalid boolean {value!r}')
+            parsed.append(value if value is None else field.to_python(value))
+        return tuple(parsed)
+
+    @classmethod
+    def get_many_in(cls, field: str, values: t.Iterable[t.Any], **kwargs) -> t.List[t.Self]:
+        '''
+        Return all the documents whose `field` value is one of `values`, in a single query.
+        The `kwargs` are added to the query (EG. `_owner_id=current_user.id`)
+        '''
+        return cls.get_many(**{f'{field}__in': list(values)}, **kwargs)
+
+    @classmethod
+    def bulk_save(cls, instances: t.List[t.Self], chunk_size: int = 500) -> t.List[t.Self]:
+        '''
+        Insert many new documents, `chunk_size` documents per `insert_many`.
+        The `before_save` hook of each document runs as in `save`
+        and the generated ids are set on the documents.
+        '''
+        now = datetime.now(timezone.utc)
+        for instance in instances:
+            instance.before_save()
+            instance._updated_at = now
+        for start in range(0, len(instances), chunk_size):
+            cls.objects.insert(instances[start:start + chunk_size], load_bulk=False)
+        bump_write_generation(cls)
+        return instances
+
+    @classmethod
+    def bulk_update(cls, mappings: t.List[t.Dict[str, t.Any]], chunk_size: int = 500, **kwargs) -> int:
+        '''
+        Update many documents with one unordered `bulk_write` per `chunk_size` mappings.
+        Each mapping must contain the `id` of the document and the fields to be updated.
+        Soft deleted documents are not updated.
+        The `kwargs` (field: value) are added to the filter of each update (EG. `_owner_id=current_user.id`).
+        Returns the number of modified documents.
+        '''
+        collection = cls._get_collection()
+        modified = 0
+        for start in range(0, len(mappings), chunk_size):
+            operations = [cls.bulk_update_operation(mapping, **kwargs) for mapping in mappings[start:start + chunk_size]]
+            if operations:
+                modified += collection.bulk_write(operations, ordered=False).modified_count
+        bump_write_generation(cls)
+        return modified
+
+    @classmethod
+    def bulk_update_operation(cls, mapping: t.Dict[str, t.Any], **kwargs) -> UpdateOne:
+        '''
+        Convert an update mapping into a pymongo UpdateOne operation,
+        using the database names and values of the fields
+        '''
+        mapping = dict(mapping)
+        pk = cls._fields['id'].to_mongo(mapping.pop('id'))
+        values = {cls._fields['_updated_at'].db_field: datetime.now(timezone.utc)}
+        for key, value in mapping.items():
+            field = cls._fields[key]
+            values[field.db_field] = field.to_mongo(value) if value is not None else None
+        query = {'_id': pk, '_deleted': False}
+        for key, value in kwargs.items():
+            field = cls._fields[key]
+            query[field.db_field] = field.to_mongo(value) if value is not None else None
+        return UpdateOne(query, {'$set': values})
+
+    @classmethod
+    def bulk_soft_delete(cls, ids: t.Iterable[t.Any], chunk_size: int = 500, **kwargs) -> int:
+        '''
+        Soft delete all the documents with the received ids (and matching the `kwargs` filters),
+        one update per `chunk_size` ids.
+        Returns the number of soft deleted documents.
+        '''
+        ids = list(ids)
+        deleted = 0
+        for start in range(0, len(ids), chunk_size):
+            deleted += cls.soft_delete_by(id__in=ids[start:start + chunk_size], **kwargs)
+        return deleted
+
+    @classmethod
+    def soft_delete_by(cls, *args, **kwargs) -> int:
+        '''
+        Soft delete all the documents matching the filters with a single
+        update, without loading them first.
+        Returns the number of soft deleted documents.
+        '''
+        deleted = cls.get_queryset(*args, **kwargs).update(
+            set___deleted=True, set___updated_at=datetime.now(timezone.utc)
+        )
+        bump_write_generation(cls)
+        return deleted
+
+    def to_snapshot(self) -> t.Dict[str, t.Any]:
+        '''
+        Plain dict with the database values of the document,
+        used to cache it (see `from_snapshot`)
+        '''
+        return self.to_mongo().to_dict()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: t.Dict[str, t.Any]) -> t.Self:
+        '''
+        Rebuild a document from `to_snapshot`, without querying the database
+        '''
+        return cls._from_son(dict(snapshot))
+
     def update(self)-> t.Self:
         self.save()
 
+    def before_save(self) -> None:
+        '''
+        Hook called before inserting a new document, both by `save` and `bulk_save`.
+        Overwrite it to prepare the document data (EG. hashing a password).
+        '''
+        pass
+
     def save(self, *args, **kwargs)-> t.Self:
-        return super().save(*args, **kwargs)
+        if self.pk is None:
+            self.before_save()
+        self._updated_at = datetime.now(timezone.utc)
+        try:
+            return super().save(*args, **kwargs)
+        finally:
+            bump_write_generation(type(self))
 
     def delete(self, method='soft'):
         if method == 'hard':
@@ -44,6 +370,7 @@ class BaseModelMongo(Document):
     
     def hard_delete_procedure(self):
         super().delete()
+        bump_write_generation(type(self))
 
     def soft_delete_procedure(self):
         self._deleted = True
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import functools
 import typing as t
 from datetime import datetime
 
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Session
 from sqlalchemy import orm
+import sqlalchemy as sa
 
 from easy_framework.user.userMixin import UserMixin
 from easy_framework.user.utils import current_user
-from easy_framework.database.sql import Sqldb, Base
+from easy_framework.database.sql import Sqldb, AsyncSqldb, Base, RoutingSession
+from easy_framework.model._utils import parse_query_value
+from easy_framework.model import _writeGeneration  # noqa: F401 (tracks the writes of the sessions)
 
 
 class BaseModelSql(orm.MappedAsDataclass, Base):
@@ -27,63 +31,733 @@ class BaseModelSql(orm.MappedAsDataclass, Base):
         init=False, server_default=func.now()
     )
     _updated_at: orm.Mapped[datetime] = orm.mapped_column(
-        init=False, server_default=func.now(), server_onupdate=func.now()
+        init=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        server_onupdate=func.now(),
     )
     _deleted: orm.Mapped[bool] = orm.mapped_column(init=False, insert_default=False)
 
     @classmethod
     def get_databaseClass(self) -> Sqldb:
-        return Sqldb()
+        return Sqldb.get_current()
 
     @classmethod
-    def get_one(cls, *args, **kwargs) -> t.Self:
-        with cls.get_databaseClass().getScopedSession() as dbSession:
-            if args:
-                return (
-                    cls.get_one_base_query(dbSession, cls)
-                    .filter(*args, **kwargs)
-                    .first()
+    def get_asyncDatabaseClass(cls) -> AsyncSqldb:
+        return AsyncSqldb.get_current()
+
+    @classmethod
+    def get_one(cls, *args, only: t.Optional[t.Iterable[str]] = None, **kwargs) -> t.Self:
+        """
+        `only` limits the loaded columns (see `get_load_only`)
+        """
+        sqldb = cls.get_databaseClass()
+        options = cls.get_load_options(only)
+        with sqldb.getScopedSession() as dbSession:
+            if not args and kwargs.keys() == {"id"} and cls.can_get_by_identity():
+                # primary key lookups can be answered by the session identity map
+                entity = dbSession.get(cls, cls.coerce_primary_key(kwargs["id"]), options=options)
+                return entity if entity is not None and not entity._deleted else None
+            return (
+                cls.get_one_base_query(dbSession, cls)
+                .options(*options)
+                .filter(*args)
+                .filter_by(**kwargs)
+                .first()
+            )
+
+    @classmethod
+    def get_many(
+        cls,
+        *args,
+        only: t.Optional[t.Iterable[str]] = None,
+        order_by: t.Optional[str] = None,
+        **kwargs,
+    ) -> t.List[t.Self]:
+        """
+        `only` limits the loaded columns (see `get_load_only`).
+        `order_by` sorts by a field (prefix it with `-` for descending order), and by the `id` as tie breaker
+        """
+        sqldb = cls.get_databaseClass()
+        options = cls.get_load_options(only)
+        with sqldb.getScopedSession() as dbSession:
+            query = (
+                cls.get_many_base_query(dbSession, cls)
+                .options(*options)
+                .filter(*args)
+                .filter_by(**kwargs)
+            )
+            if order_by is not None:
+                query = cls.seek_query(query, order_by, None)
+            return query.all()
+
+    @classmethod
+    def can_get_by_identity(cls) -> bool:
+        """
+        True if the `id` lookups of `get_one` can use `Session.get` (the identity map).
+        Not when `get_one_base_query` is overridden (EG. tenant filters): its filters must apply
+        """
+        return cls.get_one_base_query.__func__ is BaseModelSql.get_one_base_query.__func__
+
+    @classmethod
+    def coerce_primary_key(cls, value: t.Any) -> t.Any:
+        """
+        Convert an id received as text (EG. from the query string) to the type of the primary key,
+        so it matches the identity map keys
+        """
+        if not isinstance(value, str):
+            return value
+        try:
+            python_type = sa.inspect(cls).primary_key[0].type.python_type
+        except NotImplementedError:
+            return value
+        if python_type is str:
+            return value
+        try:
+            return python_type(value)
+        except (TypeError, ValueError):
+            return value
+
+    @classmethod
+    def get_load_only(cls, only: t.Optional[t.Iterable[str]]) -> t.Optional[t.Any]:
+        """
+        `load_only` option that SELECTs only the `only` columns (plus the primary key and `_deleted`),
+        so the other ones (EG. big TEXT/JSON columns) never leave the database. Their attributes
+        are not loaded: don't access them after the session is closed.
+
+        Returns None (load everything) when `only` is None or has a name that is not a column
+        (a property, a relationship, a `fields.Method` of the serializer...): it could need any column.
+        """
+        if only is None:
+            return None
+        column_keys = set(sa.inspect(cls).column_attrs.keys())
+        keys = {key for key in ("id", "_deleted") if key in column_keys}
+        for key in only:
+            if key not in column_keys:
+                return None
+            keys.add(key)
+        return orm.load_only(*[getattr(cls, key) for key in sorted(keys)])
+
+    @classmethod
+    def get_load_options(cls, only: t.Optional[t.Iterable[str]]) -> t.List[t.Any]:
+        load_only = cls.get_load_only(only)
+        return [] if load_only is None else [load_only]
+
+    @classmethod
+    async def aget_one(cls, *args, only: t.Optional[t.Iterable[str]] = None, **kwargs) -> t.Optional[t.Self]:
+        """
+        Async `get_one`, through the AsyncSqldb
+        """
+        options = cls.get_load_options(only)
+        async with cls.get_asyncDatabaseClass().getScopedSession() as dbSession:
+            if not args and kwargs.keys() == {"id"} and cls.can_get_by_identity():
+                entity = await dbSession.get(cls, cls.coerce_primary_key(kwargs["id"]), options=options)
+                return entity if entity is not None and not entity._deleted else None
+            stmt = cls.get_base_select().options(*options).filter(*args).filter_by(**kwargs).limit(1)
+            return (await dbSession.scalars(stmt)).first()
+
+    @classmethod
+    async def aget_many(
+        cls,
+        *args,
+        only: t.Optional[t.Iterable[str]] = None,
+        order_by: t.Optional[str] = None,
+        **kwargs,
+    ) -> t.List[t.Self]:
+        """
+        Async `get_many`, through the AsyncSqldb
+        """
+        options = cls.get_load_options(only)
+        async with cls.get_asyncDatabaseClass().getScopedSession() as dbSession:
+            stmt = cls.get_base_select().options(*options).filter(*args).filter_by(**kwargs)
+            if order_by is not None:
+                stmt = cls.seek_query(stmt, order_by, None)
+            return list((await dbSession.scalars(stmt)).all())
+
+    @classmethod
+    def get_page(
+        cls,
+        *args,
+        filters: t.Optional[t.Dict[str, t.Any]] = None,
+        after: t.Optional[t.Sequence[t.Any]] = None,
+        limit: t.Optional[int] = None,
+        order_by: str = "id",
+        only: t.Optional[t.Iterable[str]] = None,
+    ) -> t.List[t.Self]:
+        """
+        Keyset (seek) pagination. Returns up to `limit` entities ordered by `order_by`
+        (prefix it with `-` for descending order) and the `id` as tie breaker.
+
+        `after` is the sort key of the last entity of the previous page: `(id,)` when
+        ordering by id, or `(value, id)` for any other field. The query seeks
+        with a WHERE clause instead of an OFFSET, so deep pages cost the same as the first one.
+
+        `only` limits the loaded columns (the sort key is always loaded).
+        """
+        sqldb = cls.get_databaseClass()
+        if only is not None:
+            only = [*only, order_by.lstrip("-+")]
+        with sqldb.getScopedSession() as dbSession:
+            query = (
+                cls.get_many_base_query(dbSession, cls)
+                .options(*cls.get_load_options(only))
+                .filter(*args)
+                .filter_by(**(filters or {}))
+            )
+            query = cls.seek_query(query, order_by, after)
+            if limit is not None:
+                query = query.limit(limit)
+            return query.all()
+
+    @classmethod
+    def iter_many(
+        cls,
+        *args,
+        filters: t.Optional[t.Dict[str, t.Any]] = None,
+        batch_size: int = 1000,
+        only: t.Optional[t.Iterable[str]] = None,
+        order_by: str = "id",
+        read_only: bool = False,
+    ) -> t.Iterator[t.Self]:
+        """
+        Iterate over all the entities, ordered by `order_by` (the id by default), loading `batch_size` rows
+        at a time (`yield_per`) so the memory stays flat regardless of the result size.
+        The session stays open until the iteration finishes.
+        `only` limits the loaded columns. With `read_only`, the rows can be read from a replica
+        (the iteration usually runs after `Sqldb.readOnly` scopes are left, EG. in a streamed response).
+        """
+        dbSession = cls.get_databaseClass().getUnscopedSession()
+        dbSession.info[RoutingSession.read_only_key] = read_only
+        try:
+            query = (
+                cls.get_many_base_query(dbSession, cls)
+                .options(*cls.get_load_options(only))
+                .filter(*args)
+                .filter_by(**(filters or {}))
+            )
+            query = cls.seek_query(query, order_by, None)
+            yield from query.yield_per(batch_size)
+        finally:
+            dbSession.close()
+
+    @classmethod
+    def count(cls, *args, **kwargs) -> int:
+        """
+        Number of entities matching the filters, with a direct `SELECT count(id)`
+        (`Query.count()` wraps the whole query in a subquery)
+        """
+        sqldb = cls.get_databaseClass()
+        stmt = sa.select(func.count(cls.id)).where(cls._deleted != True).filter(*args).filter_by(**kwargs)
+        with sqldb.getScopedSession() as dbSession:
+            return dbSession.scalar(stmt)
+
+    @classmethod
+    def get_version(cls, *args, **kwargs) -> t.Tuple[int, t.Optional[datetime]]:
+        """
+        The number of entities matching the filters and their last `_updated_at`,
+        in a single query. Used as the version of a list (see `GenericApiView.conditional_get`)
+        """
+        sqldb = cls.get_databaseClass()
+        with sqldb.getScopedSession() as dbSession:
+            return tuple(dbSession.execute(cls.get_version_select(*args, **kwargs)).one())
+
+    @classmethod
+    async def aget_version(cls, *args, **kwargs) -> t.Tuple[int, t.Optional[datetime]]:
+        """
+        Async `get_version`, through the AsyncSqldb
+        """
+        async with cls.get_asyncDatabaseClass().getScopedSession() as dbSession:
+            return tuple((await dbSession.execute(cls.get_version_select(*args, **kwargs))).one())
+
+    @classmethod
+    def get_version_select(cls, *args, **kwargs) -> sa.Select:
+        return (
+            sa.select(func.count(cls.id), func.max(cls._updated_at))
+            .where(cls._deleted != True)
+            .filter(*args)
+            .filter_by(**kwargs)
+        )
+
+    @classmethod
+    def estimate_count(cls) -> t.Optional[int]:
+        """
+        Estimated number of rows of the table, read from the database statistics without
+        scanning it (the soft deleted rows are included). Returns None if there are no statistics:
+        - postgresql: `pg_class.reltuples` (updated by VACUUM and ANALYZE)
+        - mysql / mariadb: `information_schema.tables.table_rows`
+        - sqlite: the `sqlite_stat1` table (created by ANALYZE)
+        """
+        sqldb = cls.get_databaseClass()
+        table = cls.__table__
+        dialect = sqldb.dbConfig.engine.dialect.name
+        with sqldb.getScopedSession() as dbSession:
+            if dialect == "postgresql":
+                value = dbSession.scalar(
+                    sa.text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+                    {"name": table.fullname},
                 )
-            else:
-                return (
-                    cls.get_one_base_query(dbSession, cls).filter_by(**kwargs).first()
+            elif dialect in ("mysql", "mariadb"):
+                value = dbSession.scalar(
+                    sa.text(
+                        "SELECT table_rows FROM information_schema.tables"
+                        " WHERE table_schema = COALESCE(:schema, DATABASE()) AND table_name = :name"
+                    ),
+                    {"schema": table.schema, "name": table.name},
+                )
+            elif dialect == "sqlite":
+                if not dbSession.scalar(sa.text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")):
+                    return None
+                # the first number of each stat is the number of rows of the table
+                value = dbSession.scalar(
+                    sa.text("SELECT stat FROM sqlite_stat1 WHERE tbl = :name LIMIT 1"), {"name": table.name}
                 )
+                value = value.split()[0] if value else None
+            else:
+                return None
+        if value is None or int(value) < 0:
+            return None
+        return int(value)
 
     @classmethod
-    def get_many(cls, *args, **kwargs) -> t.List[t.Self]:
-        with cls.get_databaseClass().getScopedSession() as dbSession:
-            if args:
-                return (
-                    cls.get_many_base_query(dbSession, cls)
-                    .filter(*args, **kwargs)
-                    .all()
+    def seek_query(cls, query, order_by: str, after: t.Optional[t.Sequence[t.Any]]):
+        """
+        Apply the ORDER BY and the keyset WHERE clause used by `get_page`.
+        The NULL values of a nullable sort key are sorted as the biggest ones
+        (last in ascending order, first in descending order) on every database.
+        """
+        descending = order_by.startswith("-")
+        key = order_by.lstrip("-+")
+        column = getattr(cls, key)
+
+        def direction(col):
+            return col.desc() if descending else col.asc()
+
+        def seek(col, value):
+            return col < value if descending else col > value
+
+        if key == "id":
+            query = query.order_by(direction(cls.id))
+            if after:
+                query = query.filter(seek(cls.id, after[0]))
+            return query
+
+        if not column.nullable:
+            query = query.order_by(direction(column), direction(cls.id))
+            if after:
+                query = query.filter(
+                    sa.or_(
+                        seek(column, after[0]),
+                        sa.and_(column == after[0], seek(cls.id, after[1])),
+                    )
                 )
+            return query
+
+        # `col > NULL` is never true: the NULLs are seeked explicitly
+        query = query.order_by(direction(column.is_(None)), direction(column), direction(cls.id))
+        if after:
+            value, last_id = after
+            if value is None:
+                condition = sa.and_(column.is_(None), seek(cls.id, last_id))
+                if descending:
+                    condition = sa.or_(condition, column.is_not(None))
+            else:
+                condition = sa.or_(
+                    seek(column, value),
+                    sa.and_(column == value, seek(cls.id, last_id)),
+                )
+                if not descending:
+                    condition = sa.or_(condition, column.is_(None))
+            query = query.filter(condition)
+        return query
+
+    @classmethod
+    def filter_expression(cls, field: str, operator: str, value: t.Any) -> sa.ColumnElement[bool]:
+        """
+        SQLAlchemy expression of a list endpoint filter (see `FilterSpec`):
+        `eq`, `in` (a list of values), `gt`, `gte`, `lt`, `lte` or `prefix`
+        """
+        column = getattr(cls, field)
+        if operator == "eq":
+            return column == value
+        if operator == "in":
+            return column.in_(value)
+        if operator == "prefix":
+            return column.startswith(value, autoescape=True)
+        if operator == "gt":
+            return column > value
+        if operator == "gte":
+            return column >= value
+        if operator == "lt":
+            return column < value
+        if operator == "lte":
+            return column <= value
+        raise ValueError(f"Unknown filter operator {operator!r}")
+
+    @classmethod
+    def get_filter_parser(cls, field: str) -> t.Optional[t.Callable[[str], t.Any]]:
+        """
+        Function converting a query string value to the python type of the `field` column,
+        or None if `field` is not a column
+        """
+        column = sa.inspect(cls).columns.get(field)
+        if column is None:
+            return None
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            python_type = None
+        return functools.partial(parse_query_value, python_type)
+
+    @classmethod
+    def is_indexed_field(cls, field: str) -> bool:
+        """
+        Return True if the `field` column is the first column of an index (or of the primary key),
+        so filtering and sorting by it doesn't scan the whole table
+        """
+        column = sa.inspect(cls).columns.get(field)
+        if column is None:
+            return False
+        if column.index or column.unique:
+            return True
+        constraints = [column.table.primary_key, *column.table.indexes, *column.table.constraints]
+        return any(
+            isinstance(constraint, (sa.Index, sa.UniqueConstraint, sa.PrimaryKeyConstraint))
+            and next(iter(constraint.columns), None) is column
+            for constraint in constraints
+        )
+
+    @classmethod
+    def parse_cursor_values(cls, order_by: str, values: t.Sequence[t.Any]) -> t.Tuple:
+        """
+        Convert the values decoded from a pagination cursor back to
+        the python type of the sort key columns
+        """
+        keys = [order_by.lstrip("-+")]
+        if keys[0] != "id":
+            keys.append("id")
+        if len(values) != len(keys):
+            raise ValueError("cursor does not match the sort key")
+
+        parsed = []
+        for key, value in zip(keys, values):
+            python_type = getattr(cls, key).type.python_type
+            if value is None or isinstance(value, python_type):
+                parsed.append(value)
+            elif python_type is bool:
+                raise ValueError(f"invalid boolean {value!r}")
+            elif isinstance(value, str):
+                parsed.append(parse_query_value(python_type, value))
             else:
-                return cls.get_many_base_query(dbSession, cls).filter_by(**kwargs).all()
+                parsed.append(python_type(value))
+        return tuple(parsed)
+
+    def before_save(self) -> None:
+        """
+        Hook called before inserting a new entity, both by `save` and `bulk_save`.
+        Overwrite it to prepare the entity data (EG. hashing a password).
+        """
+        pass
 
     def save(self):
-        with self.get_databaseClass().getScopedSession() as dbSession:
+        self.before_save()
+        sqldb = self.get_databaseClass()
+        with sqldb.usePrimary(), sqldb.getScopedSession() as dbSession:
             self.save_procedure(dbSession)
             return self
 
+    async def asave(self):
+        """
+        Async `save`, through the AsyncSqldb
+        """
+        self.before_save()
+        sqldb = self.get_asyncDatabaseClass()
+        async with sqldb.getScopedSession() as dbSession:
+            dbSession.add(self)
+            await sqldb.commitSession(dbSession)
+            await dbSession.refresh(self)
+            return self
+
+    async def aupdate(self):
+        """
+        Async `update`, through the AsyncSqldb
+        """
+        sqldb = self.get_asyncDatabaseClass()
+        async with sqldb.getScopedSession() as dbSession:
+            state = sa.inspect(self)
+            if state.key is None or state.session is dbSession.sync_session:
+                await dbSession.merge(self)
+                await sqldb.commitSession(dbSession)
+                return self
+
+            changes = self.get_changed_columns()
+            if not changes:
+                return self
+            stmt = self.get_update_changed_columns_stmt(changes)
+            if dbSession.get_bind().dialect.update_returning:
+                updated_at = (await dbSession.execute(stmt.returning(type(self)._updated_at))).scalar()
+                orm.attributes.set_committed_value(self, "_updated_at", updated_at)
+            else:
+                await dbSession.execute(stmt)
+            await sqldb.commitSession(dbSession)
+
+            for key, value in changes.items():
+                orm.attributes.set_committed_value(self, key, value)
+            return self
+
+    async def adelete(self, method="soft"):
+        """
+        Async `delete`, through the AsyncSqldb
+        """
+        if method != "hard":
+            self._deleted = True
+            return await self.aupdate()
+        sqldb = self.get_asyncDatabaseClass()
+        async with sqldb.getScopedSession() as dbSession:
+            await dbSession.delete(await dbSession.merge(self))
+            await sqldb.commitSession(dbSession)
+            return self
+
     def update(self):
-        with self.get_databaseClass().getScopedSession() as dbSession:
+        sqldb = self.get_databaseClass()
+        with sqldb.usePrimary(), sqldb.getScopedSession() as dbSession:
             self.update_procedure(dbSession)
             return self
 
     def delete(self, method="soft"):
-        with self.get_databaseClass().getScopedSession() as dbSession:
+        sqldb = self.get_databaseClass()
+        with sqldb.usePrimary(), sqldb.getScopedSession() as dbSession:
             if method == "hard":
                 self.hard_delete_procedure(dbSession)
             else:
                 self.soft_delete_procedure(dbSession)
             return self
 
+    @classmethod
+    def get_many_in(cls, field: str, values: t.Iterable[t.Any], **kwargs) -> t.List[t.Self]:
+        """
+        Return all the entities whose `field` value is one of `values`, in a single query.
+        The `kwargs` are added to the WHERE clause (EG. `_owner_id=current_user.id`)
+        """
+        return cls.get_many(getattr(cls, field).in_(list(values)), **kwargs)
+
+    @classmethod
+    def bulk_save(cls, instances: t.List[t.Self], chunk_size: int = 500) -> t.List[t.Self]:
+        """
+        Insert many new entities in a single transaction, `chunk_size` rows per
+        executemany INSERT (batched by SQLAlchemy's insertmanyvalues).
+
+        The `before_save` hook of each entity runs as in `save`, the `_owner_id`
+        default (the current user) is evaluated once for the whole batch, and the
+        generated columns (id, `_created_at`...) are read back with RETURNING.
+        The entities are returned detached, as if they were loaded by `get_one`.
+        """
+        if not instances:
+            return instances
+        for instance in instances:
+            instance.before_save()
+
+        sqldb = cls.get_databaseClass()
+        with sqldb.getScopedSession() as dbSession:
+            if not dbSession.get_bind().dialect.insert_executemany_returning:
+                return cls.bulk_save_orm(dbSession, instances, chunk_size)
+
+            rows = cls.get_bulk_insert_rows(instances)
+            columns = [getattr(cls, attr.key) for attr in sa.inspect(cls).column_attrs]
+
+            for start in range(0, len(instances), chunk_size):
+                chunk = instances[start : start + chunk_size]
+                for keys, group in cls.group_rows_by_keys(chunk, rows[start : start + chunk_size]):
+                    result = dbSession.execute(
+                        sa.insert(cls).returning(*columns, sort_by_parameter_order=True),
+                        [row for _, row in group],
+                    )
+                    for (instance, _), values in zip(group, result.all()):
+                        for column, value in zip(columns, values):
+                            orm.attributes.set_committed_value(instance, column.key, value)
+                        orm.make_transient_to_detached(instance)
+
+            sqldb.commitSession(dbSession)
+        return instances
+
+    @classmethod
+    def bulk_save_orm(cls, dbSession: Session, instances: t.List[t.Self], chunk_size: int) -> t.List[t.Self]:
+        """
+        `bulk_save` fallback for databases without RETURNING on executemany:
+        let the session flush `chunk_size` entities at a time
+        """
+        sqldb = cls.get_databaseClass()
+        for start in range(0, len(instances), chunk_size):
+            dbSession.add_all(instances[start : start + chunk_size])
+            dbSession.flush()
+        if not sqldb.isRequestSession(dbSession):
+            # keep the flushed values, instead of expiring them on commit
+            for instance in instances:
+                dbSession.expunge(instance)
+        sqldb.commitSession(dbSession)
+        return instances
+
+    @classmethod
+    def get_bulk_insert_rows(cls, instances: t.List[t.Self]) -> t.List[t.Dict[str, t.Any]]:
+        """
+        Convert the entities into INSERT parameters. Columns left empty are omitted
+        so their insert/server defaults apply, except for `_owner_id`, whose default
+        is evaluated only once for all the rows.
+        """
+        mapper = sa.inspect(cls)
+        owner_column = mapper.columns.get("_owner_id")
+        owner_id = None
+        if owner_column is not None and owner_column.default is not None:
+            owner_id = owner_column.default.arg(None) if owner_column.default.is_callable else owner_column.default.arg
+
+        rows = []
+        for instance in instances:
+            row = {}
+            for attr in mapper.column_attrs:
+                value = instance.__dict__.get(attr.key)
+                if value is not None:
+                    row[attr.key] = value
+            if owner_column is not None and "_owner_id" not in row:
+                row["_owner_id"] = owner_id
+            rows.append(row)
+        return rows
+
+    @classmethod
+    def group_rows_by_keys(cls, instances: t.List[t.Self], rows: t.List[t.Dict[str, t.Any]]):
+        """
+        executemany needs the same columns in every row: group the consecutive
+        rows (and their entities) that have the same keys
+        """
+        groups = []
+        for instance, row in zip(instances, rows):
+            keys = tuple(sorted(row))
+            if groups and groups[-1][0] == keys:
+                groups[-1][1].append((instance, row))
+            else:
+                groups.append((keys, [(instance, row)]))
+        return groups
+
+    @classmethod
+    def bulk_update(cls, mappings: t.List[t.Dict[str, t.Any]], chunk_size: int = 500, **kwargs) -> int:
+        """
+        Update many entities in a single transaction, `chunk_size` rows per
+        executemany UPDATE. Each mapping must contain the `id` of the entity
+        and the columns to be updated. `_updated_at` is set by the `onupdate`
+        of the column and soft deleted entities are not updated.
+        The `kwargs` are added to the WHERE clause (EG. `_owner_id=current_user.id`).
+        Returns the number of updated entities.
+
+        Entities already loaded in the session are not synchronized.
+        """
+        if not mappings:
+            return 0
+        sqldb = cls.get_databaseClass()
+        mapper = sa.inspect(cls)
+        columns = {attr.key: attr.columns[0] for attr in mapper.column_attrs}
+        # Core executemany UPDATEs (the ORM bulk update by primary key doesn't report the rowcount)
+        criteria = [
+            columns["id"] == sa.bindparam("bulk_id"),
+            columns["_deleted"] != True,
+            *[columns[key] == value for key, value in kwargs.items()],
+        ]
+        updated = 0
+        with sqldb.getScopedSession() as dbSession:
+            for start in range(0, len(mappings), chunk_size):
+                chunk = mappings[start : start + chunk_size]
+                for keys, group in cls.group_rows_by_keys(chunk, chunk):
+                    stmt = (
+                        sa.update(cls.__table__)
+                        .where(*criteria)
+                        .values({columns[key]: sa.bindparam(f"bulk_{key}") for key in keys if key != "id"})
+                    )
+                    params = [{f"bulk_{key}": value for key, value in row.items()} for _, row in group]
+                    updated += dbSession.execute(stmt, params, bind_arguments={"mapper": mapper}).rowcount
+            sqldb.commitSession(dbSession)
+        return updated
+
+    @classmethod
+    def bulk_soft_delete(cls, ids: t.Iterable[t.Any], chunk_size: int = 500, **kwargs) -> int:
+        """
+        Soft delete all the entities with the received ids in a single transaction,
+        one UPDATE per `chunk_size` ids. Returns the number of soft deleted entities.
+        The `kwargs` are added to the WHERE clause (EG. `_owner_id=current_user.id`).
+        """
+        ids = list(ids)
+        sqldb = cls.get_databaseClass()
+        deleted = 0
+        with sqldb.getScopedSession() as dbSession:
+            for start in range(0, len(ids), chunk_size):
+                stmt = (
+                    sa.update(cls)
+                    .where(cls._deleted != True, cls.id.in_(ids[start : start + chunk_size]))
+                    .filter_by(**kwargs)
+                    .values({cls._deleted: True, cls._updated_at: func.now()})
+                )
+                deleted += dbSession.execute(stmt).rowcount
+            sqldb.commitSession(dbSession)
+        return deleted
+
+    @classmethod
+    def soft_delete_by(cls, *args, **kwargs) -> int:
+        """
+        Soft delete all the entities matching the filters with a single
+        UPDATE statement, without loading them first.
+        Returns the number of soft deleted entities.
+        """
+        with cls.get_databaseClass().getScopedSession() as dbSession:
+            stmt = (
+                sa.update(cls)
+                .where(cls._deleted != True, *args)
+                .filter_by(**kwargs)
+                .values({cls._deleted: True, cls._updated_at: func.now()})
+            )
+            result = dbSession.execute(stmt)
+            cls.get_databaseClass().commitSession(dbSession)
+            return result.rowcount
+
+    def get_changed_columns(self) -> t.Dict[str, t.Any]:
+        """
+        Return the columns changed since the entity was loaded or last saved
+        (attribute name: new value). The changes are tracked by SQLAlchemy even
+        while the entity is detached from any session.
+        """
+        state = sa.inspect(self)
+        changes = {}
+        for attr in state.mapper.column_attrs:
+            history = state.attrs[attr.key].history
+            if history.added:
+                changes[attr.key] = history.added[0]
+        return changes
+
+    def to_snapshot(self) -> t.Dict[str, t.Any]:
+        """
+        Plain dict with the loaded column values of the entity,
+        used to cache it outside the session (see `from_snapshot`)
+        """
+        return {attr.key: self.__dict__.get(attr.key) for attr in sa.inspect(type(self)).column_attrs}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: t.Dict[str, t.Any]) -> t.Self:
+        """
+        Rebuild a detached entity from `to_snapshot`, without querying the database
+        """
+        instance = sa.inspect(cls).class_manager.new_instance()
+        for key, value in snapshot.items():
+            orm.attributes.set_committed_value(instance, key, value)
+        orm.make_transient_to_detached(instance)
+        return instance
+
     @classmethod
     def get_one_by_unique_field(self, model, field, value):
         with self.get_databaseClass().getScopedSession() as dbSession:
             return dbSession.query(model).filter_by(**{field: value})
 
+    @classmethod
+    def get_base_select(cls) -> sa.Select:
+        """
+        SELECT of the entities that are not soft deleted (the base query of the async methods)
+        """
+        return sa.select(cls).where(cls._deleted != True)
+
     @classmethod
     def get_one_base_query(self, dbSession: Session, model):
         return dbSession.query(model).filter(model._deleted != True)
@@ -94,21 +768,61 @@ class BaseModelSql(orm.MappedAsDataclass, Base):
 
     def save_procedure(self, dbSession: Session):
         dbSession.add(self)
-        dbSession.commit()
+        self.get_databaseClass().commitSession(dbSession)
         dbSession.refresh(self)
 
     def update_procedure(self, dbSession: Session):
-        dbSession.merge(self)
-        dbSession.commit()
+        state = sa.inspect(self)
+        if state.key is None or state.session is dbSession:
+            # new entities, or entities already tracked by this session,
+            # are flushed by the session itself
+            dbSession.merge(self)
+            self.get_databaseClass().commitSession(dbSession)
+            return
+
+        changes = self.get_changed_columns()
+        if not changes:
+            return
+
+        self.update_changed_columns(dbSession, changes)
+        self.get_databaseClass().commitSession(dbSession)
+
+        for key, value in changes.items():
+            orm.attributes.set_committed_value(self, key, value)
+
+    def update_changed_columns(self, dbSession: Session, changes: t.Dict[str, t.Any]):
+        """
+        Emit a single `UPDATE ... SET <changed columns> WHERE id = ?` for a detached
+        entity, instead of merging it (that would SELECT it before updating
+        every column). The new `_updated_at` is read back with RETURNING when the
+        database supports it.
+        """
+        model = type(self)
+        stmt = self.get_update_changed_columns_stmt(changes)
+
+        if dbSession.get_bind().dialect.update_returning:
+            updated_at = dbSession.execute(stmt.returning(model._updated_at)).scalar()
+            orm.attributes.set_committed_value(self, "_updated_at", updated_at)
+        else:
+            dbSession.execute(stmt)
+
+    def get_update_changed_columns_stmt(self, changes: t.Dict[str, t.Any]) -> sa.Update:
+        model = type(self)
+        return (
+            sa.update(model)
+            .where(model.id == self.id)
+            .values({getattr(model, key): value for key, value in changes.items()})
+            .values({model._updated_at: func.now()})
+            .execution_options(synchronize_session=False)
+        )
 
     def hard_delete_procedure(self, dbSession: Session):
         dbSession.delete(self)
-        dbSession.commit()
+        self.get_databaseClass().commitSession(dbSession)
 
     def soft_delete_procedure(self, dbSession: Session):
         self._deleted = True
-        dbSession.merge(self)
-        dbSession.commit()
+        self.update_procedure(dbSession)
 
     """
     # if needed, model can be self updated by merging after making the changes
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import typing as t
 from abc import ABC, abstractmethod
+from datetime import date, datetime
 
 if t.TYPE_CHECKING:
     from ._baseModelMongo import BaseModelMongo
@@ -34,4 +35,22 @@ class ModelConstructor(ABC):
 
             fields_value[i] = self.Meta.__dict__[i]
 
-        return fields_value
\ No newline at end of file
+        return fields_value
+
+
+def parse_query_value(python_type: t.Optional[type], value: str) -> t.Any:
+    '''
+    Convert a query string value to the python type of a field.
+    Raises ValueError (or TypeError) if the value is invalid
+    '''
+    if python_type is None or python_type is str:
+        return value
+    if python_type is bool:
+        if value.lower() in ('true', '1'):
+            return True
+        if value.lower() in ('false', '0'):
+            return False
+        raise ValueError(f'invalid boolean {value!r}')
+    if python_type in (datetime, date):
+        return python_type.fromisoformat(value)
+    return python_type(value)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+import itertools
+import threading
+import typing as t
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, ORMExecuteState
+
+WRITTEN_MODELS_KEY = 'easy_framework_written_models'
+
+_generations: t.Dict[type, int] = {}
+_counter = itertools.count(1)
+_lock = threading.Lock()
+
+
+def get_write_generation(model: type) -> int:
+    '''
+    Generation of the last write to the `model` in this process (0 if it was never written).
+    Caches keep the generation they were filled with, and ignore their entries when it changes.
+    '''
+    return _generations.get(model, 0)
+
+
+def bump_write_generation(*models: type) -> None:
+    '''
+    Mark the `models` as written. The SQL models are marked when the session
+    commits, the Mongo models by their write methods.
+    '''
+    with _lock:
+        for model in models:
+            _generations[model] = next(_counter)
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_flush(session: Session, flush_context) -> None:
+    written = session.info.setdefault(WRITTEN_MODELS_KEY, set())
+    for instance in itertools.chain(session.new, session.dirty, session.deleted):
+        written.add(type(instance))
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _track_statement(state: ORMExecuteState) -> None:
+    # bulk INSERT / UPDATE / DELETE statements don't go through the flush
+    if (state.is_insert or state.is_update or state.is_delete) and state.bind_mapper is not None:
+        state.session.info.setdefault(WRITTEN_MODELS_KEY, set()).add(state.bind_mapper.class_)
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_after_commit(session: Session) -> None:
+    written = session.info.pop(WRITTEN_MODELS_KEY, None)
+    if written:
+        bump_write_generation(*written)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_after_rollback(session: Session) -> None:
+    session.info.pop(WRITTEN_MODELS_KEY, None)
@@ -1,4 +1,5 @@
 from marshmallow import fields
 
+from ._serializerRegistry import SerializerRegistry
 from ._baseSerializerSql import BaseSerializerSql
 from ._baseSerializerMongo import BaseSerializerMongo
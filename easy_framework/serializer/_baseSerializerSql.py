@@ -1,8 +1,9 @@
 from abc import abstractmethod
-import types
+import typing as t
 from flask import request
 from marshmallow import Schema, fields
 
+from ._serializerRegistry import SerializerRegistry
 
 
 class BaseSerializerSql(Schema):
@@ -29,6 +30,9 @@ class BaseSerializerSql(Schema):
         all existent HTTP request methods
         EG. GetMeta will run only for GET request
         "
+
+    The merged class for each request method is built only once
+    and kept in the `SerializerRegistry`.
     '''
 
     @abstractmethod
@@ -44,13 +48,28 @@ class BaseSerializerSql(Schema):
         deleted = fields.Integer(dump_only=True)
 
     def __new__(cls, *args, **kwargs):
-        cls = cls.selectMeta(cls)
-        return super().__new__(cls, *args, **kwargs)
-
-    def selectMeta(cls):
-        look_for = request.method.capitalize()+'Meta'
-        try:
-            requestedMeta = getattr(cls,look_for)
-            return types.new_class(str(cls.__name__), (cls, cls.MainMeta, requestedMeta), dict())
-        except AttributeError:
-            return types.new_class(str(cls.__name__), (cls, cls.MainMeta, cls.Meta), dict())
+        if not cls.__dict__.get('_compiled_serializer'):
+            cls = cls.selectMeta(cls)
+        return super().__new__(cls)
+
+    def selectMeta(cls, method: t.Optional[str] = None):
+        '''
+        Return the compiled serializer class for the HTTP method
+        (the current request method if not informed)
+        '''
+        return SerializerRegistry.get(cls, method or request.method)
+
+    @classmethod
+    def compile(cls, methods: t.Iterable[str]) -> None:
+        '''
+        Eagerly compile this serializer for the received HTTP methods
+        '''
+        SerializerRegistry.compile(cls, methods)
+
+    @classmethod
+    def invalidate_compiled(cls) -> None:
+        '''
+        Drop the compiled classes of this serializer. Call it after
+        changing any of its Meta classes.
+        '''
+        SerializerRegistry.invalidate(cls)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+import typing as t
+import types
+import threading
+
+if t.TYPE_CHECKING:
+    from ._baseSerializerSql import BaseSerializerSql
+
+
+class SerializerRegistry:
+    '''
+    Registry of the compiled serializer classes.
+
+    The BaseSerializerSql merges the `MainMeta` with the `Meta` class
+    of the requested HTTP method (`GetMeta`, `PostMeta`...) into a new
+    Schema class. Building that class makes marshmallow collect all the
+    declared fields again, so the compiled classes are kept here,
+    keyed by (serializer class, HTTP method), and built only once.
+
+    ### Invalidation
+    If a Meta class is changed after the serializer was compiled (EG. tests
+    monkeypatching fields), call `SerializerRegistry.invalidate(MySerializer)`
+    or `MySerializer.invalidate_compiled()` to rebuild it on the next use.
+    '''
+
+    _compiled: t.Dict[t.Tuple[type, str], type] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, serializer: t.Type[BaseSerializerSql], method: str) -> type:
+        '''
+        Return the compiled serializer class for the HTTP method,
+        building it on the first use
+        '''
+        key = (serializer, method.capitalize())
+        compiled = cls._compiled.get(key)
+        if compiled is None:
+            with cls._lock:
+                compiled = cls._compiled.get(key)
+                if compiled is None:
+                    compiled = cls.build(serializer, key[1])
+                    cls._compiled[key] = compiled
+        return compiled
+
+    @classmethod
+    def compile(cls, serializer: t.Type[BaseSerializerSql], methods: t.Iterable[str]) -> None:
+        '''
+        Eagerly compile the serializer for every HTTP method in `methods`.
+        Used when registering the views, so the first request doesn't pay for it
+        '''
+        for method in methods:
+            cls.get(serializer, method)
+
+    @classmethod
+    def build(cls, serializer: t.Type[BaseSerializerSql], method: str) -> type:
+        '''
+        Merge the `MainMeta` and the requested Meta into a new serializer class
+        '''
+        requestedMeta = getattr(serializer, method + 'Meta', None)
+        if requestedMeta is None:
+            requestedMeta = serializer.Meta
+        return types.new_class(
+            str(serializer.__name__),
+            (serializer, serializer.MainMeta, requestedMeta),
+            dict(),
+            lambda namespace: namespace.update({'_compiled_serializer': True}),
+        )
+
+    @classmethod
+    def invalidate(cls, serializer: t.Optional[t.Type[BaseSerializerSql]] = None) -> None:
+        '''
+        Remove the compiled classes of `serializer` (or all of them if no serializer is given)
+        '''
+        with cls._lock:
+            if serializer is None:
+                cls._compiled.clear()
+                return
+            for key in [key for key in cls._compiled if key[0] is serializer]:
+                del cls._compiled[key]
@@ -16,6 +16,54 @@ class UserModelMongo(UserMixin, BaseModelMongo):
     def passwordManager(self):
         return cache.config.EASY_FRAMEWORK_AUTH_PASSWORD_MANAGER()
 
-    def save(self):
-        self.password = self.passwordManager.hash(self.password)
-        return super().save()
+    def before_save(self):
+        self.set_password(self.password)
+
+    def set_password(self, password: str):
+        """
+        Hash and set the raw password. Call `update` to store it
+        """
+        self.password = self.passwordManager.hash(password)
+
+    def update(self):
+        self.invalidate_sessions_cache()
+        return super().update()
+
+    def delete(self, method="soft"):
+        self.invalidate_sessions_cache()
+        return super().delete(method)
+
+    def invalidate_sessions_cache(self):
+        """
+        Drop the cached sessions of the user, so the next requests see
+        the changes (EG. a new password or a deleted user)
+        """
+        from easy_framework.auth._tokenCache import BaseTokenCache
+
+        tokenCache = BaseTokenCache.get_current()
+        if tokenCache is not None and self.id is not None:
+            tokenCache.delete_user(self.id)
+
+    @classmethod
+    def invalidate_users_sessions_cache(cls, user_ids):
+        """
+        Drop the cached sessions of many users, for the bulk updates and deletes
+        """
+        from easy_framework.auth._tokenCache import BaseTokenCache
+
+        tokenCache = BaseTokenCache.get_current()
+        if tokenCache is not None:
+            tokenCache.delete_users(user_ids)
+
+    @classmethod
+    def bulk_update(cls, mappings, chunk_size: int = 500, **kwargs):
+        result = super().bulk_update(mappings, chunk_size, **kwargs)
+        cls.invalidate_users_sessions_cache(mapping["id"] for mapping in mappings)
+        return result
+
+    @classmethod
+    def soft_delete_by(cls, *args, **kwargs) -> int:
+        user_ids = [user.id for user in cls.get_many(*args, only=["id"], **kwargs)]
+        deleted = super().soft_delete_by(*args, **kwargs)
+        cls.invalidate_users_sessions_cache(user_ids)
+        return deleted
@@ -1,3 +1,3 @@
 from ._login_required import Login_required
-from ._baseValidator import BaseValidator
-from ._self_required import Self_required
\ No newline at end of file
+from ._baseValidator import BaseValidator, ValidatorCall
+from ._self_required import Self_required
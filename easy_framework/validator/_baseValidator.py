@@ -3,12 +3,15 @@ import typing as t
 import inspect
 from abc import ABC, abstractmethod
 import functools
+from enum import Enum
 
 from easy_framework._meta import GenericApiViewMeta
 
 if t.TYPE_CHECKING:
     from easy_framework.view import GenericApiView
 
+DECORATOR_ARGUMENT_TYPES = (str, bytes, int, float, Enum, list, tuple, set, frozenset, dict)
+
 class BaseValidator(ABC):
     '''
     Base validator class, that needs to be inherited by all
@@ -20,6 +23,9 @@ class BaseValidator(ABC):
     method to be protected (user can GET, but not POST to an endpoint for example)
     '''
 
+    DECORATOR = 'decorator'
+    DIRECT_CALL = 'direct_call'
+
     def __init__(self, *args, **kwargs) -> None:
         '''
         BaseValidator init. When overwriting this, always call super init passing the received parameters.
@@ -46,6 +52,14 @@ class BaseValidator(ABC):
         in the `validator_list` param letting the View to handle the
         validation process
 
+        # Decorator or direct call
+        A call is a direct call when its first argument is the validated object: a
+        GenericApiView instance, a class, a function or a method. It is used as a decorator
+        when called without arguments or when its first argument is a plain value (string,
+        number, bool, None, enum or a collection). Any other first argument raises `TypeError`,
+        so nothing is left unvalidated. If a decorator argument is a class or a function, use
+        the explicit entry points instead: `MyValidator.decorator(...)` and `MyValidator.run(view, ...)`.
+
         # Parameters
 
         - `view` - required when using direct call instead of decorator.
@@ -54,15 +68,78 @@ class BaseValidator(ABC):
         - `methods_to_validate` - is a list of HTTP methods which the validator should validate
         By default, POST is out of the list due to the data not existing yet.
         '''  
-        
-        lines = inspect.stack(context=2)[1].code_context
-        decorated = any(line.strip().startswith('@') for line in lines)
-        
-        if decorated:
+        mode = self.__dict__.pop('_mode', None)
+        if mode is None:
+            mode = self.get_call_mode(args)
+
+        if mode == self.DECORATOR:
             self._run_as_decorator(*args, **kwargs)
         else:
             self._run_as_direct_call(*args, **kwargs)
 
+    @classmethod
+    def run(cls, view, *args, **kwargs) -> t.Self:
+        '''
+        Validate the view right away (direct call).
+        While a GenericApiView is validating a request, the same validation
+        (same validator and arguments) runs only once for it.
+        '''
+        validated = getattr(view, '_validated', None) if not isinstance(view, type) else None
+        if validated is not None:
+            key = ValidatorCall.make_key(cls, args, kwargs)
+            if key is not None:
+                if key in validated:
+                    # already validated for this request
+                    return None
+                validated.add(key)
+        return cls._build(cls.DIRECT_CALL, view, *args, **kwargs)
+
+    @classmethod
+    def decorator(cls, *args, **kwargs) -> t.Self:
+        '''
+        Build the validator to be used as a decorator
+        '''
+        return cls._build(cls.DECORATOR, *args, **kwargs)
+
+    @classmethod
+    def _build(cls, mode: str, *args, **kwargs) -> t.Self:
+        validator = cls.__new__(cls)
+        validator._mode = mode
+        validator.__init__(*args, **kwargs)
+        return validator
+
+    @classmethod
+    def get_call_mode(cls, args: tuple) -> str:
+        '''
+        Tell if the validator was called directly or to build a decorator,
+        raising `TypeError` when the first argument is neither a validation target nor a decorator argument
+        '''
+        if not args or cls.is_decorator_argument(args[0]):
+            return cls.DECORATOR
+        if cls.is_validation_target(args[0]):
+            return cls.DIRECT_CALL
+        raise TypeError(
+            f'{cls.__name__} can not validate {args[0]!r}: use {cls.__name__}.run(view, ...) '
+            f'to validate it or {cls.__name__}.decorator(...) to build a decorator'
+        )
+
+    @staticmethod
+    def is_validation_target(obj) -> bool:
+        '''
+        Check if `obj` is something to be validated, instead of a validator argument
+        '''
+        return (
+            isinstance(obj, type) or inspect.isfunction(obj) or inspect.ismethod(obj)
+            or isinstance(type(obj), GenericApiViewMeta)
+        )
+
+    @staticmethod
+    def is_decorator_argument(obj) -> bool:
+        '''
+        Check if `obj` is a plain value, only accepted as a decorator argument
+        '''
+        return obj is None or isinstance(obj, DECORATOR_ARGUMENT_TYPES)
+
     def _run_as_direct_call(self, *args, **kwargs):
         args = list(args)
         self.view = args.pop(0)
@@ -114,31 +191,62 @@ class BaseValidator(ABC):
         return True
     
     def register_validator_in_view(self):
-        if not hasattr(self.view, 'validator_list'):
-            self.view.validator_list = {}
+        '''
+        Add the validator to the `validator_list` of the decorated view class.
+        The view gets its own copy of the list, so the parent views are not changed
+        '''
+        validator_list = self.view.__dict__.get('validator_list', getattr(self.view, 'validator_list', None))
+        if isinstance(validator_list, property) or not validator_list:
+            validator_list = {}
+        elif isinstance(validator_list, list):
+            validator_list = {'*': validator_list}
+        validator_list = {method: list(validators) for method, validators in validator_list.items()}
+
+        methods = ['*'] if self.methods_to_validate == '*' else self.methods_to_validate
+        for method in methods:
+            validator_list.setdefault(method, []).append(self.view_validator())
+
+        self.view.validator_list = validator_list
+        if hasattr(self.view, 'invalidate_validator_plans'):
+            self.view.invalidate_validator_plans()
+
+    def view_validator(self) -> ValidatorCall:
+        '''
+        The callable registered in the view `validator_list`, called with the view on every request
+        '''
+        return ValidatorCall(self.__class__, self.args, self.kwargs)
 
-        if isinstance(self.view.validator_list, list):
-            self.view.validator_list = {'*':self.view.validator_list}
 
-        if isinstance(self.view.validator_list, property):
-            self.view.validator_list = {}
-        
-        if self.methods_to_validate == '*':
-            if '*' in self.view.validator_list:
-                if not isinstance(self.view.validator_list, list):
-                    self.view.validator_list['*'] = [self.view.validator_list['*']]
-            else:
-                self.view.validator_list['*'] = []
-
-            self.view.validator_list['*'].append(functools.partial(lambda view: self.__class__(view, *self.args, **self.kwargs)))
-            return
-        
-        if isinstance(self.methods_to_validate, list):
-            for method in self.methods_to_validate:
-                if method in self.view.validator_list:
-                    if not isinstance(method, list):
-                        self.view.validator_list[method] = [self.view.validator_list[method]]
-                else:
-                    self.view.validator_list[method] = []
-                
-                self.view.validator_list[method].append(functools.partial(lambda view: self.__class__(view, *self.args, **self.kwargs)))
\ No newline at end of file
+class ValidatorCall:
+    '''
+    A validator registered in a view, with its decorator arguments.
+    Calling it with the view runs the validation (`Validator.run(view, *args, **kwargs)`).
+
+    Two calls of the same validator with the same arguments have the same `key`,
+    so the view runs them only once per request.
+    '''
+    __slots__ = ('validator', 'args', 'kwargs', 'key')
+
+    def __init__(self, validator: t.Type[BaseValidator], args: tuple = (), kwargs: t.Optional[dict] = None) -> None:
+        self.validator = validator
+        self.args = tuple(args)
+        self.kwargs = dict(kwargs or {})
+        self.key = self.make_key(validator, self.args, self.kwargs)
+
+    @staticmethod
+    def make_key(validator: t.Type[BaseValidator], args: tuple, kwargs: dict) -> t.Optional[t.Hashable]:
+        '''
+        Hashable identity of the validation, or None if the arguments are not hashable
+        '''
+        try:
+            key = (validator, tuple(args), tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def __call__(self, view):
+        return self.validator.run(view, *self.args, **self.kwargs)
+
+    def __repr__(self) -> str:
+        return f"ValidatorCall({self.validator.__name__}, {self.args}, {self.kwargs})"
@@ -15,7 +15,7 @@ class Login_required(BaseValidator):
             raise AuthMissingError()
 
     def validateToken(self):
-        current_app.authManager.auth_method.validateToken()
+        current_app.authManager.validateToken()
 
     def checkUser(self):
         if current_user.is_authenticated is True:
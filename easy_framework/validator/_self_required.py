@@ -15,7 +15,7 @@ class Self_required(BaseValidator):
         if request.method == 'GET': self.request_data = request.args
         else: self.request_data = request.get_json()
 
-        Login_required(self.view)
+        Login_required.run(self.view)
 
         if not self.view.field_lookup_value:
             return
@@ -1,2 +1,3 @@
 from ._genericApiView import GenericApiView
-from ._utils import register_view
\ No newline at end of file
+from ._asyncGenericApiView import AsyncGenericApiView
+from ._utils import register_view
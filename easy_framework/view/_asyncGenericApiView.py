@@ -0,0 +1,151 @@
+import inspect
+import typing as t
+from typing import Dict, List, Literal
+
+from flask import request
+from marshmallow import ValidationError as MarshmallowValidationError
+
+from easy_framework.model._baseModelSql import BaseModelSql
+from ._genericApiView import GenericApiView
+
+
+class AsyncGenericApiView(GenericApiView):
+    """
+    GenericApiView answered by coroutines: the auto_{http_method} handlers await the
+    async model methods (`aget_one`, `aget_many`, `asave`...) through the AsyncSqldb,
+    so the queries of a request can overlap (EG. `asyncio.gather`) without blocking the worker.
+    Needs the `EASY_FRAMEWORK_DB_SQL_ASYNC_ACTIVATE` config and Flask's async extra (asgiref).
+
+    With `auto_treat_request` set to False, the http methods of the view can be either
+    `async def` or plain functions. The validators run before, synchronously.
+
+    Streamed, paginated and bulk requests are answered by the sync GenericApiView methods.
+    Sync and async views can be registered in the same app.
+    """
+
+    async def dispatch_request(self, *args: t.List, **kwargs: t.Dict):
+        """
+        Async entry point for the View (see GenericApiView.dispatch_request)
+        """
+        handler = self.get_handler(*args, **kwargs)
+        with self.get_read_routing(request.method):
+            response = handler()
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+
+    async def auto_get(self, *args, **kwargs):
+        cached = self.get_cached_response()
+        if cached is not None:
+            return cached
+
+        with self.get_cache_fill_routing():
+            if self.field_lookup_value:
+                response = await self.agetSingleEntity()
+            else:
+                response = await self.agetAllEntities()
+        return self.cache_response(response)
+
+    async def auto_post(self, *args, **kwargs):
+        if self.is_bulk_request():
+            return self.bulkCreateEntities()
+        return await self.acreateEntity()
+
+    async def auto_patch(self, *args, **kwargs):
+        if self.is_bulk_request():
+            return self.bulkUpdateEntities()
+        return await self.aupdateEntity()
+
+    async def auto_delete(self, *args, **kwargs):
+        if self.is_bulk_request():
+            return self.bulkDeleteEntities()
+        return await self.adeleteEntity("soft")
+
+    async def agetSingleEntity(self) -> Dict[str, any]:
+        """
+        Async `getSingleEntity`
+        """
+        lookup = {self.field_lookup: self.field_lookup_value}
+        conditional = self.is_conditional_get()
+        if conditional and self.has_conditional_headers():
+            current = await self.model.aget_one(**lookup, only=["_updated_at"])
+            if current is not None:
+                not_modified = self.get_not_modified_response(*self.get_entity_version(current))
+                if not_modified is not None:
+                    return not_modified
+
+        model = await self.model.aget_one(**lookup, **self.get_projection_kwargs())
+        body = self.get_serializer().dump(model)
+        if conditional and model is not None:
+            return body, 200, self.get_version_headers(*self.get_entity_version(model))
+        return body
+
+    async def agetAllEntities(self) -> List[Dict[str, any]]:
+        """
+        Async `getAllEntities`
+        """
+        if self.is_streamed() or self.is_paginated():
+            return self.getAllEntities()
+
+        headers = None
+        if self.is_conditional_get():
+            version = self.get_list_version(*await self.model.aget_version(*self.get_filter_args()))
+            not_modified = self.get_not_modified_response(*version)
+            if not_modified is not None:
+                return not_modified
+            headers = self.get_version_headers(*version)
+
+        entities = await self.model.aget_many(
+            *self.get_filter_args(), **self.get_sort_kwargs(), **self.get_projection_kwargs()
+        )
+        body = self.get_serializer().dump(entities, many=True)
+        return body if headers is None else (body, 200, headers)
+
+    async def acreateEntity(self) -> Dict[str, any]:
+        """
+        Async `createEntity`
+        """
+        json_data = request.get_json()
+        try:
+            serialized_data = self.get_serializer().load(json_data)
+        except MarshmallowValidationError as e:
+            return e.messages, 422
+        model: BaseModelSql = self.model(**serialized_data)
+        await model.asave()
+
+        return self.get_serializer().dump(model), 201
+
+    async def aupdateEntity(self) -> Dict[str, any]:
+        """
+        Async `updateEntity`
+        """
+        json_data = request.get_json()
+        try:
+            serialized_data = self.get_serializer().load(json_data)
+        except MarshmallowValidationError as e:
+            return e.messages, 422
+
+        model: BaseModelSql = await self.model.aget_one(
+            **{self.field_lookup: self.field_lookup_value}
+        )
+        if model is None:
+            return "entity not found", 404
+
+        for item in serialized_data:
+            if hasattr(model, item):
+                setattr(model, item, serialized_data[item])
+
+        await model.aupdate()
+        return self.get_serializer().dump(model), 204
+
+    async def adeleteEntity(self, deleteMethod: Literal["soft", "hard"]) -> Dict[str, any]:
+        """
+        Async `deleteEntity`
+        """
+        model: BaseModelSql = None
+        if self.field_lookup_value is not None:
+            model = await self.model.aget_one(**{self.field_lookup: self.field_lookup_value})
+        if model is None:
+            return "impossible delete: entity not found", 404
+        await model.adelete(deleteMethod)
+        return "", 204
@@ -0,0 +1,137 @@
+from __future__ import annotations
+import typing as t
+
+from loguru import logger
+
+from easy_framework.exception import ValidationError
+
+FILTER_OPERATORS = ('eq', 'in', 'range', 'prefix')
+RANGE_OPERATORS = ('gt', 'gte', 'lt', 'lte')
+
+
+class FilterClause:
+    '''
+    A single query string filter of a list endpoint, EG. `age__gte=18`
+    '''
+
+    def __init__(self, param: str, field: str, operator: str, parse: t.Callable[[str], t.Any]) -> None:
+        self.param = param
+        self.field = field
+        self.operator = operator
+        self.parse = parse
+
+    def value(self, raw: str) -> t.Any:
+        '''
+        Convert the query string value to the type of the field.
+        `in` values are comma separated.
+        '''
+        try:
+            if self.operator == 'in':
+                return [self.parse(item) for item in raw.split(',')]
+            return self.parse(raw)
+        except (ValueError, TypeError, ArithmeticError):
+            raise ValidationError({self.param: ['Invalid value.']}, 400)
+
+
+class FilterPlan:
+    '''
+    The compiled filters and sort of one shape of query string (the same params, any values)
+    '''
+
+    def __init__(self, clauses: t.Tuple[FilterClause, ...], order_by: t.Optional[str]) -> None:
+        self.clauses = clauses
+        self.order_by = order_by
+
+    def expressions(self, model: t.Any, args: t.Mapping[str, str]) -> t.List[t.Any]:
+        '''
+        The filter expressions of the request (SQLAlchemy expressions or mongoengine Q objects)
+        '''
+        return [
+            model.filter_expression(clause.field, clause.operator, clause.value(args[clause.param]))
+            for clause in self.clauses
+        ]
+
+
+class FilterSpec:
+    '''
+    Declarative filters and sort of a GenericApiView list endpoint (see `GenericApiView.filter_fields`).
+
+    The query string params are `{field}` (eq), `{field}__in` (comma separated values),
+    `{field}__gt|gte|lt|lte` (range) and `{field}__prefix`, and `sort={field}` or `sort=-{field}`.
+    Params naming a model field which is not allowed are rejected with a 400, so clients
+    can only filter and sort by the declared (indexed) fields.
+
+    The plans are cached per query string shape: the filter param names and the sort.
+    '''
+
+    def __init__(
+        self,
+        model: t.Any,
+        filter_fields: t.Mapping[str, t.Iterable[str]],
+        sort_fields: t.Iterable[str] = (),
+        view_name: str = '',
+    ) -> None:
+        self.model = model
+        self.parsers: t.Dict[str, t.Callable[[str], t.Any]] = {}
+        self.operators: t.Dict[str, t.Set[str]] = {}
+        self.sort_fields = {'id', *sort_fields}
+        self.plans: t.Dict[t.Tuple, FilterPlan] = {}
+
+        for field, operators in filter_fields.items():
+            operators = [operators] if isinstance(operators, str) else list(operators)
+            unknown = [operator for operator in operators if operator not in FILTER_OPERATORS]
+            if unknown:
+                raise ValueError(f'{view_name}: unknown filter operator(s) {unknown} for {field!r}')
+            allowed = {operator for operator in operators if operator != 'range'}
+            if 'range' in operators:
+                allowed.update(RANGE_OPERATORS)
+            self.operators[field] = allowed
+            self.parsers[field] = self.get_parser(field, view_name)
+
+        for field in self.sort_fields:
+            self.get_parser(field, view_name)
+
+    def get_parser(self, field: str, view_name: str) -> t.Callable[[str], t.Any]:
+        parser = self.model.get_filter_parser(field)
+        if parser is None:
+            raise ValueError(f'{view_name}: {field!r} is not a field of {self.model.__name__}')
+        if not self.model.is_indexed_field(field):
+            logger.warning(f'{view_name}: filtering or sorting by the not indexed field {field!r} scans the whole table')
+        return parser
+
+    def get_plan(self, args: t.Mapping[str, str], reserved: t.Iterable[str] = ()) -> FilterPlan:
+        '''
+        The filter plan of the query string `args`. The `reserved` params
+        (EG. `limit`, `cursor`, the `field_lookup`) are not filters, and
+        params that don't name a model field are ignored.
+        '''
+        reserved = {*reserved, 'sort'}
+        params = []
+        for param in args:
+            if param in reserved:
+                continue
+            field = param.partition('__')[0]
+            if field in self.operators:
+                params.append(param)
+            elif self.model.get_filter_parser(field) is not None:
+                raise ValidationError({param: ['Filter not allowed.']}, 400)
+
+        sort = args.get('sort') or None
+        key = (tuple(sorted(params)), sort)
+        plan = self.plans.get(key)
+        if plan is None:
+            plan = self.plans[key] = self.build_plan(*key)
+        return plan
+
+    def build_plan(self, params: t.Tuple[str, ...], sort: t.Optional[str]) -> FilterPlan:
+        clauses = []
+        for param in params:
+            field, _, operator = param.partition('__')
+            operator = operator or 'eq'
+            if operator not in self.operators[field]:
+                raise ValidationError({param: ['Filter not allowed.']}, 400)
+            clauses.append(FilterClause(param, field, operator, self.parsers[field]))
+
+        if sort is not None and sort.lstrip('-+') not in self.sort_fields:
+            raise ValidationError({'sort': ['Sort not allowed.']}, 400)
+        return FilterPlan(tuple(clauses), sort)
@@ -1,19 +1,30 @@
 import typing as t
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from datetime import datetime
 from typing import Dict, List, Literal
 
-from flask import request
+from flask import Response, current_app, request, stream_with_context
 from flask.views import View as FlaskView
-from marshmallow import ValidationError as MarshmallowValidationError
+from sqlalchemy.orm import object_session
+from marshmallow import Schema, ValidationError as MarshmallowValidationError
 from werkzeug.datastructures import ImmutableMultiDict
+from werkzeug.http import generate_etag, http_date, quote_etag
 
-from easy_framework.exception.apiExceptions import ValidationError
+from easy_framework.exception.apiExceptions import NotTheOwner, ValidationError
 from easy_framework.serializer import BaseSerializerSql
-from easy_framework.validator._baseValidator import BaseValidator
+from easy_framework.validator._baseValidator import BaseValidator, ValidatorCall
+from easy_framework.validator._self_required import Self_required
 from easy_framework.user.utils import current_user
 from easy_framework._meta import GenericApiViewMeta
+from easy_framework._context import cache
+from easy_framework._ttlCache import TTLCache
+from ._pagination import Cursor
+from ._filtering import FilterPlan, FilterSpec
+from ._responseCache import CachedResponse, as_utc, is_not_modified
 
 from easy_framework.model._baseModelSql import BaseModelSql
+from easy_framework.model._writeGeneration import get_write_generation
 
 
 class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
@@ -30,6 +41,139 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
     - `request` query string (for GET methods) or json (for all other methods)
     """
 
+    paginate: t.Optional[bool] = None
+    """
+    If True, `getAllEntities` returns a page of entities instead of the whole table,
+    in the envelope `{"results": [...], "next_cursor": "..."}`.
+    The client sends `limit` and the received `next_cursor` (as `cursor`) in the query string
+    to fetch the next page. If None, the `EASY_FRAMEWORK_VIEW_PAGINATE` config is used.
+    """
+
+    page_size: t.Optional[int] = None
+    """
+    Default page size when `limit` is not in the query string.
+    If None, the `EASY_FRAMEWORK_VIEW_PAGE_SIZE` config is used.
+    """
+
+    max_page_size: t.Optional[int] = None
+    """
+    The biggest `limit` a client can request. Bigger values are reduced to it.
+    If None, the `EASY_FRAMEWORK_VIEW_MAX_PAGE_SIZE` config is used.
+    """
+
+    pagination_key: str = "id"
+    """
+    The field used to sort and seek the pages. Prefix it with `-` for descending order.
+    The `id` is always used as tie breaker, so the key doesn't need to be unique.
+    """
+
+    count_mode: t.Optional[t.Literal["exact", "estimate", "none"]] = None
+    """
+    Total of the paginated list responses (`{"results": [...], "next_cursor": "...", "count": 123}`),
+    which the clients can choose with `?count=exact|estimate|none`:
+    - `exact` counts the entities matching the filters with a `SELECT count(id)`
+    - `estimate` reads the table statistics of the database, without scanning it (see `estimate_count`).
+    Filtered lists and databases without statistics are counted exactly.
+    - `none` doesn't count (no `count` in the response)
+
+    If None, the `EASY_FRAMEWORK_VIEW_COUNT_MODE` config is used.
+    """
+
+    count_ttl: t.Optional[float] = None
+    """
+    How many seconds the counts are cached, per filter signature.
+    If None, the `EASY_FRAMEWORK_VIEW_COUNT_TTL` config is used.
+    """
+
+    stream: bool = False
+    """
+    If True, `getAllEntities` streams all the entities instead of building
+    the whole response in memory: as NDJSON (one json per line) if the client accepts
+    `application/x-ndjson`, or as a chunked json array otherwise.
+    Clients can also request the NDJSON stream by sending the
+    `Accept: application/x-ndjson` header, even if this attribute is False.
+    """
+
+    stream_batch_size: int = 1000
+    """
+    How many entities are fetched from the database per batch while streaming
+    """
+
+    filter_fields: t.Dict[str, t.Iterable[str]] = {}
+    """
+    The fields the clients can filter the list endpoint by, with their allowed operators:
+    `eq` (`?name=x`), `in` (`?name__in=x,y`), `range` (`?age__gte=1&age__lt=9`, also gt and lte)
+    and `prefix` (`?name__prefix=x`). EG. `{"name": ["eq", "prefix"], "age": ["range"]}`.
+    Filtering by any other field of the model is rejected (400), so declare indexed fields only.
+    """
+
+    sort_fields: t.Iterable[str] = ()
+    """
+    The fields the clients can sort the list endpoint by, with `?sort=name` or `?sort=-name`
+    (descending). The `id` is always allowed. When paginated, the sort replaces the `pagination_key`.
+    """
+
+    conditional_get: t.Optional[bool] = None
+    """
+    If True, the GET responses have a weak `ETag` and a `Last-Modified` header, computed from
+    the `_updated_at` of the entity, or from the count and the last `_updated_at` of the list
+    (see `get_version` in the models). Requests with a matching `If-None-Match` (or `If-Modified-Since`)
+    are answered with a 304, without loading the entities nor serializing them.
+    The `_updated_at` has the resolution of the database clock (seconds on sqlite).
+    If None, the `EASY_FRAMEWORK_VIEW_CONDITIONAL_GET` config is used.
+    """
+
+    response_cache: t.Optional[bool] = None
+    """
+    If True, the GET responses (200) are cached in the process, per route and query string,
+    and dropped as soon as an entity of the `model` is written in this process (`save`, `update`,
+    `delete`, the bulk methods...). Writes of other processes are seen after `response_cache_ttl` seconds.
+    The responses that fill the cache are read from the primary, never from a read replica.
+    The validators still run on every request.
+    If None, the `EASY_FRAMEWORK_VIEW_RESPONSE_CACHE` config is used.
+    """
+
+    response_cache_ttl: t.Optional[float] = None
+    """
+    How many seconds a response can stay in the cache.
+    If None, the `EASY_FRAMEWORK_VIEW_RESPONSE_CACHE_TTL` config is used.
+    """
+
+    response_cache_per_user: bool = True
+    """
+    If True, the cached responses are also keyed by the current user. Set it to False
+    only when the responses are the same for every user (EG. the view is not owner scoped).
+    """
+
+    bulk: bool = False
+    """
+    If True, POST, PATCH and DELETE also accept a json array to create, update
+    or delete many entities at once. Each item is validated by the serializer and
+    the response contains one result per item:
+    `{"results": [{"status": 201, "data": {...}}, {"status": 422, "errors": {...}}]}`
+    - POST: array of entities
+    - PATCH: array of entities, each one with its `field_lookup` value
+    - DELETE: array of `field_lookup` values (or objects with the `field_lookup`)
+    """
+
+    bulk_chunk_size: int = 500
+    """
+    How many entities are sent to the database per statement in bulk requests
+    """
+
+    bulk_max_size: int = 1000
+    """
+    The max number of items accepted in a single bulk request
+    """
+
+    bulk_owned_only: t.Optional[bool] = None
+    """
+    If True, bulk PATCH and DELETE only reach the entities owned by the current user
+    (`_owner_id` is part of the WHERE clause of the bulk queries).
+    If None, it's True when the `Self_required` validator is registered for the request method:
+    the validators only check the `field_lookup` of single entity requests.
+    """
+
     @property
     @abstractmethod
     def routes(self) -> List[str]:
@@ -135,10 +279,16 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
         Will be used intead of the get function if the
         auto_treat_request is set to True.
         """
-        if self.field_lookup_value:
-            return self.getSingleEntity()
-        else:
-            return self.getAllEntities()
+        cached = self.get_cached_response()
+        if cached is not None:
+            return cached
+
+        with self.get_cache_fill_routing():
+            if self.field_lookup_value:
+                response = self.getSingleEntity()
+            else:
+                response = self.getAllEntities()
+        return self.cache_response(response)
 
     def auto_post(self, *args, **kwargs):
         """
@@ -147,6 +297,8 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
         Will be used intead of the get function if the
         auto_treat_request is set to True.
         """
+        if self.is_bulk_request():
+            return self.bulkCreateEntities()
         return self.createEntity()
 
     def auto_patch(self, *args, **kwargs):
@@ -156,6 +308,8 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
         Will be used intead of the get function if the
         auto_treat_request is set to True.
         """
+        if self.is_bulk_request():
+            return self.bulkUpdateEntities()
         return self.updateEntity()
 
     def auto_delete(self, *args, **kwargs):
@@ -165,6 +319,8 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
         Will be used intead of the get function if the
         auto_treat_request is set to True.
         """
+        if self.is_bulk_request():
+            return self.bulkDeleteEntities()
         return self.deleteEntity("soft")
 
     def set_field_lookup_value(self) -> any:
@@ -182,11 +338,127 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
         if self.field_lookup_method == "request":
             self.set_field_lookup_value()
 
+    @classmethod
+    def prepare_view(cls) -> None:
+        """
+        Prepare everything this view can build once, before receiving
+        requests (EG. the compiled serializer for each allowed HTTP method).
+        Called when the view is registered in the flask app.
+        """
+        if isinstance(cls.serializer, type) and issubclass(cls.serializer, BaseSerializerSql):
+            cls.serializer.compile(cls.methods)
+        cls.compile_validators()
+        cls.compile_filters()
+
     def get_serializer(self) -> BaseSerializerSql:
         """
-        Return the serializer function
+        Return the serializer function, limited to the
+        requested fields (see `get_requested_fields`) if any
+        """
+        fields = self.get_requested_fields()
+        if fields is None:
+            return self.serializer
+        serializer = self.__dict__.get("_fields_serializer")
+        if serializer is None:
+            serializer = self._fields_serializer = type(self.serializer)(only=fields)
+        return serializer
+
+    def get_requested_fields(self) -> t.Optional[t.Tuple[str, ...]]:
+        """
+        Sparse fieldsets: the serializer fields listed (comma separated) in the `fields`
+        query string param of GET requests, EG. `?fields=id,name`. They limit both the
+        serializer output and the columns loaded from the database (see `get_projection`).
+        Returns None if the param is not in the request.
+        """
+        if "_requested_fields" in self.__dict__:
+            return self._requested_fields
+
+        fields = None
+        value = request.args.get("fields")
+        if value is not None and request.method in ("GET", "HEAD") and isinstance(self.serializer, Schema):
+            fields = tuple(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+            unknown = [name for name in fields if name not in self.serializer.dump_fields]
+            if unknown:
+                raise ValidationError({"fields": [f"Unknown field(s): {', '.join(unknown)}."]}, 400)
+            if not fields:
+                raise ValidationError({"fields": ["Must not be empty."]}, 400)
+        self._requested_fields = fields
+        return fields
+
+    @classmethod
+    def compile_filters(cls) -> t.Optional[FilterSpec]:
+        """
+        Compile the `filter_fields` and `sort_fields` of the view (None if there are none).
+        Called once by `prepare_view`, or on the first list request.
+        """
+        spec = None
+        if cls.filter_fields or cls.sort_fields:
+            spec = FilterSpec(cls.model, cls.filter_fields, cls.sort_fields, view_name=cls.__name__)
+        cls._filter_spec = spec
+        return spec
+
+    def get_filter_plan(self) -> t.Optional[FilterPlan]:
+        """
+        Return the compiled filters and sort of the request query string
+        """
+        if "_filter_plan" in self.__dict__:
+            return self._filter_plan
+
+        cls = type(self)
+        if "_filter_spec" in cls.__dict__:
+            spec = cls._filter_spec
+        else:
+            spec = cls.compile_filters()
+        reserved = ("fields", "limit", "cursor", "count", self.field_lookup)
+        self._filter_plan = None if spec is None else spec.get_plan(request.args, reserved)
+        return self._filter_plan
+
+    def get_filter_args(self) -> t.List[t.Any]:
+        """
+        The filter expressions of the request, passed positionally to the model queries
+        """
+        plan = self.get_filter_plan()
+        if plan is None:
+            return []
+        return plan.expressions(self.model, request.args)
+
+    def get_sort(self) -> t.Optional[str]:
+        """
+        The requested `sort` (see `sort_fields`), or None
+        """
+        plan = self.get_filter_plan()
+        return None if plan is None else plan.order_by
+
+    def get_sort_kwargs(self) -> t.Dict[str, t.Any]:
         """
-        return self.serializer
+        The `order_by` parameter of the model queries, when a sort was requested
+        """
+        sort = self.get_sort()
+        return {} if sort is None else {"order_by": sort}
+
+    def get_pagination_key(self) -> str:
+        """
+        The sort key of the pages: the requested `sort`, or the `pagination_key`
+        """
+        return self.get_sort() or self.pagination_key
+
+    def get_projection(self) -> t.Optional[t.List[str]]:
+        """
+        The model attributes of the requested fields, passed as `only` to the model queries
+        """
+        fields = self.get_requested_fields()
+        if fields is None:
+            return None
+        dump_fields = self.serializer.dump_fields
+        return [dump_fields[name].attribute or name for name in fields]
+
+    def get_projection_kwargs(self) -> t.Dict[str, t.Any]:
+        """
+        The `only` parameter of the model queries, when fields were requested
+        (so models that don't support it keep working without them)
+        """
+        projection = self.get_projection()
+        return {} if projection is None else {"only": projection}
 
     def dispatch_request(self, *args: t.List, **kwargs: t.Dict):
         """
@@ -205,6 +477,15 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
         - `self.querystring_params`
         - `request.args`
         """
+        handler = self.get_handler(*args, **kwargs)
+        with self.get_read_routing(request.method):
+            return handler()
+
+    def get_handler(self, *args: t.List, **kwargs: t.Dict) -> t.Callable:
+        """
+        Read the request params, run the validations and return
+        the method that answers the request
+        """
         self.path_params = kwargs
         self.querystring_params = request.args
         self.args = args
@@ -219,9 +500,31 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
         method = request.method
         if self.auto_treat_request:
             method = "auto_" + method
-        return getattr(self, str(method).lower())()
+        return getattr(self, str(method).lower())
+
+    def get_read_routing(self, method: str) -> t.ContextManager:
+        """
+        The GET requests of SQL views can read from the read replicas (see `Sqldb.readOnly`).
+        The validators run before, on the primary
+        """
+        model = self.model
+        if method in ("GET", "HEAD") and isinstance(model, type) and issubclass(model, BaseModelSql):
+            return model.get_databaseClass().readOnly()
+        return nullcontext()
+
+    def get_stream_routing_kwargs(self) -> t.Dict[str, t.Any]:
+        """
+        The `read_only` parameter of `iter_many`: the streamed rows are read after
+        `get_read_routing` is left, so the routing is passed to the model
+        """
+        model = self.model
+        if request.method in ("GET", "HEAD") and isinstance(model, type) and issubclass(model, BaseModelSql):
+            return {"read_only": True}
+        return {}
 
     def _validate(self, *args, **kwargs):
+        # validations already run for this request (see `BaseValidator.run`)
+        self._validated = set()
 
         if self.validate_request:
             self.validateRequest()
@@ -235,23 +538,360 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
         """
         It will return a single entity from the database (normaly the lookup_field_value is defined)
         """
-        model = self.model.get_one(**{self.field_lookup: self.field_lookup_value})
-        return self.get_serializer().dump(model)
+        lookup = {self.field_lookup: self.field_lookup_value}
+        conditional = self.is_conditional_get()
+        if conditional and self.has_conditional_headers():
+            current = self.model.get_one(**lookup, only=["_updated_at"])
+            if current is not None:
+                not_modified = self.get_not_modified_response(*self.get_entity_version(current))
+                if not_modified is not None:
+                    return not_modified
+
+        model = self.model.get_one(**lookup, **self.get_projection_kwargs())
+        body = self.get_serializer().dump(model)
+        if conditional and model is not None:
+            return body, 200, self.get_version_headers(*self.get_entity_version(model))
+        return body
 
     def getAllEntities(self) -> List[Dict[str, any]]:
         """
         It will return all entities from the database (normaly if there is no lookup_field in the request)
         """
-        model: BaseModelSql = self.model()
-        res = model.get_many()
-        return self.get_serializer().dump(res, many=True)
+        if self.is_streamed():
+            return self.streamEntities()
+
+        headers = None
+        if self.is_conditional_get():
+            version = self.get_list_version(*self.model.get_version(*self.get_filter_args()))
+            not_modified = self.get_not_modified_response(*version)
+            if not_modified is not None:
+                return not_modified
+            headers = self.get_version_headers(*version)
+
+        if self.is_paginated():
+            body = self.getPaginatedEntities()
+        else:
+            model: BaseModelSql = self.model()
+            res = model.get_many(
+                *self.get_filter_args(), **self.get_sort_kwargs(), **self.get_projection_kwargs()
+            )
+            body = self.get_serializer().dump(res, many=True)
+        return body if headers is None else (body, 200, headers)
+
+    def getPaginatedEntities(self) -> Dict[str, any]:
+        """
+        It will return a single page of entities, using keyset pagination
+        over the `pagination_key`, and the cursor for the next page
+        """
+        limit = self.get_page_limit()
+        after = self.get_page_cursor()
+        pagination_key = self.get_pagination_key()
+
+        entities = list(
+            self.model.get_page(
+                *self.get_filter_args(),
+                after=after,
+                limit=limit + 1,
+                order_by=pagination_key,
+                **self.get_projection_kwargs(),
+            )
+        )
+
+        next_cursor = None
+        if len(entities) > limit:
+            entities = entities[:limit]
+            next_cursor = Cursor.encode(
+                pagination_key, Cursor.key_values(entities[-1], pagination_key)
+            )
+
+        response = {
+            "results": self.get_serializer().dump(entities, many=True),
+            "next_cursor": next_cursor,
+        }
+        if self.get_count_mode() != "none":
+            response["count"] = self.get_count()
+        return response
+
+    def streamEntities(self) -> Response:
+        """
+        It will stream all entities from the database, serializing them one by one
+        """
+        serializer = self.get_serializer()
+        entities = self.model.iter_many(
+            *self.get_filter_args(),
+            batch_size=self.stream_batch_size,
+            order_by=self.get_sort() or "id",
+            **self.get_projection_kwargs(),
+            **self.get_stream_routing_kwargs(),
+        )
+        dumps = current_app.json.dumps
+
+        if self.accepts_ndjson():
+
+            def generate_ndjson():
+                for entity in entities:
+                    yield dumps(serializer.dump(entity)) + "\n"
+
+            return Response(
+                stream_with_context(generate_ndjson()), mimetype="application/x-ndjson"
+            )
+
+        def generate_json_array():
+            separator = "["
+            for entity in entities:
+                yield separator + dumps(serializer.dump(entity))
+                separator = ","
+            yield "[]" if separator == "[" else "]"
+
+        return Response(
+            stream_with_context(generate_json_array()), mimetype="application/json"
+        )
+
+    def is_conditional_get(self) -> bool:
+        """
+        Return True if the GET responses of this view have validators (see `conditional_get`)
+        """
+        if self.conditional_get is None:
+            return bool(cache.config.EASY_FRAMEWORK_VIEW_CONDITIONAL_GET)
+        return self.conditional_get
+
+    def has_conditional_headers(self) -> bool:
+        return bool(request.if_none_match) or request.if_modified_since is not None
+
+    def get_entity_version(self, entity: BaseModelSql) -> t.Tuple[str, t.Optional[datetime]]:
+        """
+        The weak ETag and the Last-Modified of an entity, from its id and `_updated_at`
+        """
+        updated_at = getattr(entity, "_updated_at", None)
+        return generate_etag(repr(("entity", entity.id, updated_at)).encode()), updated_at
+
+    def get_list_version(
+        self, count: int, last_updated_at: t.Optional[datetime]
+    ) -> t.Tuple[str, t.Optional[datetime]]:
+        """
+        The weak ETag and the Last-Modified of a list, from the count and the last `_updated_at`
+        of the entities matching the filters. The ETag also changes with the deletions, the Last-Modified doesn't
+        """
+        return generate_etag(repr(("list", count, last_updated_at)).encode()), last_updated_at
+
+    def get_version_headers(self, etag: str, last_modified: t.Optional[datetime]) -> t.Dict[str, str]:
+        headers = {"ETag": quote_etag(etag, weak=True)}
+        if last_modified is not None:
+            headers["Last-Modified"] = http_date(as_utc(last_modified))
+        return headers
+
+    def get_not_modified_response(
+        self, etag: str, last_modified: t.Optional[datetime]
+    ) -> t.Optional[t.Tuple[str, int, t.Dict[str, str]]]:
+        """
+        The 304 response if the client already has this version, else None
+        """
+        if is_not_modified(etag, last_modified):
+            return "", 304, self.get_version_headers(etag, last_modified)
+        return None
+
+    def is_response_cached(self) -> bool:
+        """
+        Return True if the response of this request can be cached (see `response_cache`)
+        """
+        enabled = self.response_cache
+        if enabled is None:
+            enabled = bool(cache.config.EASY_FRAMEWORK_VIEW_RESPONSE_CACHE)
+        if not enabled or request.method != "GET":
+            return False
+        return bool(self.field_lookup_value) or not self.is_streamed()
+
+    def get_response_cache_key(self) -> t.Tuple:
+        user = getattr(current_user, "id", None) if self.response_cache_per_user else None
+        return request.path, tuple(sorted(request.args.items(multi=True))), user
+
+    def get_cached_response(self) -> t.Optional[Response]:
+        """
+        Return the cached response of the request (or a 304 if the client already has it),
+        if it was cached after the last write to the model
+        """
+        if not self.is_response_cached():
+            return None
+        self._response_generation = get_write_generation(self.model)
+        entry: t.Optional[CachedResponse] = self.get_response_cache().get(self.get_response_cache_key())
+        if entry is None or entry.generation != self._response_generation:
+            return None
+
+        if entry.etag is not None:
+            not_modified = self.get_not_modified_response(entry.etag, entry.last_modified)
+            if not_modified is not None:
+                return current_app.make_response(not_modified)
+        return current_app.response_class(entry.data, status=200, headers=entry.headers)
+
+    def get_cache_fill_routing(self) -> t.ContextManager:
+        """
+        The responses that fill the cache are read from the primary: a replica can still miss
+        the last write, and its stale body would be cached under the new generation
+        """
+        model = self.model
+        if "_response_generation" in self.__dict__ and isinstance(model, type) and issubclass(model, BaseModelSql):
+            return model.get_databaseClass().usePrimary()
+        return nullcontext()
+
+    def cache_response(self, response: t.Any) -> t.Any:
+        """
+        Keep the 200 responses of the cacheable requests (see `get_cached_response`)
+        """
+        if "_response_generation" not in self.__dict__:
+            return response
+        response = current_app.make_response(response)
+        if response.status_code != 200 or response.is_streamed:
+            return response
+
+        etag = response.get_etag()[0]
+        entry = CachedResponse(
+            generation=self._response_generation,
+            data=response.get_data(),
+            headers=[
+                (name, value) for name, value in response.headers
+                if name in ("Content-Type", "ETag", "Last-Modified")
+            ],
+            etag=etag,
+            last_modified=response.last_modified,
+        )
+        ttl = self.response_cache_ttl
+        if ttl is None:
+            ttl = cache.config.EASY_FRAMEWORK_VIEW_RESPONSE_CACHE_TTL or 0
+        self.get_response_cache().set(self.get_response_cache_key(), entry, ttl)
+        return response
+
+    @classmethod
+    def get_response_cache(cls) -> TTLCache:
+        """
+        The response cache of the view (each view class has its own)
+        """
+        response_cache = cls.__dict__.get("_response_cache")
+        if response_cache is None:
+            response_cache = cls._response_cache = TTLCache(
+                cache.config.EASY_FRAMEWORK_VIEW_RESPONSE_CACHE_SIZE or 0
+            )
+        return response_cache
+
+    def is_streamed(self) -> bool:
+        """
+        Return True if the list endpoint must be streamed
+        """
+        return self.stream or self.accepts_ndjson()
+
+    def accepts_ndjson(self) -> bool:
+        """
+        Return True if the client explicitly prefers NDJSON over json
+        """
+        return (
+            request.accept_mimetypes.best_match(
+                ["application/json", "application/x-ndjson"]
+            )
+            == "application/x-ndjson"
+        )
+
+    def is_paginated(self) -> bool:
+        """
+        Return True if the list endpoint of this view must be paginated
+        """
+        if self.paginate is None:
+            return bool(cache.config.EASY_FRAMEWORK_VIEW_PAGINATE)
+        return self.paginate
+
+    def get_page_limit(self) -> int:
+        """
+        Read the `limit` from the query string, falling back to the default page size
+        and never exceeding the max page size
+        """
+        page_size = self.page_size or cache.config.EASY_FRAMEWORK_VIEW_PAGE_SIZE
+        max_page_size = self.max_page_size or cache.config.EASY_FRAMEWORK_VIEW_MAX_PAGE_SIZE
+
+        limit = request.args.get("limit")
+        if limit is None:
+            return min(page_size, max_page_size)
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValidationError({"limit": ["Not a valid integer."]}, 400)
+        if limit < 1:
+            raise ValidationError({"limit": ["Must be greater than 0."]}, 400)
+        return min(limit, max_page_size)
+
+    def get_page_cursor(self) -> t.Optional[t.Tuple]:
+        """
+        Decode the `cursor` query string param into the sort key values
+        of the last entity of the previous page
+        """
+        cursor = request.args.get("cursor")
+        if not cursor:
+            return None
+        pagination_key = self.get_pagination_key()
+        values = Cursor.decode(cursor, pagination_key)
+        try:
+            return self.model.parse_cursor_values(pagination_key, values)
+        except (ValueError, TypeError):
+            raise ValidationError({"cursor": ["Invalid cursor."]}, 400)
+
+    def get_count_mode(self) -> str:
+        """
+        Read the `count` mode from the query string, falling back to the `count_mode` of the view
+        """
+        mode = request.args.get("count")
+        if mode is None:
+            return self.count_mode or cache.config.EASY_FRAMEWORK_VIEW_COUNT_MODE or "none"
+        if mode not in ("exact", "estimate", "none"):
+            raise ValidationError({"count": ["Must be one of: exact, estimate, none."]}, 400)
+        return mode
+
+    def get_count(self) -> t.Optional[int]:
+        """
+        Count the entities of the list (see `count_mode`), cached per
+        filter signature for `count_ttl` seconds
+        """
+        mode = self.get_count_mode()
+        if mode == "none":
+            return None
+
+        plan = self.get_filter_plan()
+        clauses = () if plan is None else plan.clauses
+        filters = tuple((clause.param, request.args[clause.param]) for clause in clauses)
+        if mode == "estimate" and filters:
+            # the statistics are per table
+            mode = "exact"
+
+        count_cache = self.get_count_cache()
+        count = count_cache.get((mode, filters))
+        if count is None:
+            if mode == "estimate":
+                count = self.model.estimate_count()
+            if count is None:
+                count = self.model.count(*self.get_filter_args())
+            ttl = self.count_ttl
+            if ttl is None:
+                ttl = cache.config.EASY_FRAMEWORK_VIEW_COUNT_TTL or 0
+            count_cache.set((mode, filters), count, ttl)
+        return count
+
+    @classmethod
+    def get_count_cache(cls) -> TTLCache:
+        """
+        The count cache of the view (each view class has its own)
+        """
+        count_cache = cls.__dict__.get("_count_cache")
+        if count_cache is None:
+            count_cache = cls._count_cache = TTLCache()
+        return count_cache
 
     def getOwnedEntities(self) -> List[Dict[str, any]]:
         """
         It will return all entities owned by the user from the database (normaly if there is no lookup_field in the request)
         """
         model: BaseModelSql = self.model()
-        res = model.get_many(_owner_id=current_user.id)
+        res = model.get_many(
+            *self.get_filter_args(),
+            _owner_id=current_user.id,
+            **self.get_sort_kwargs(),
+            **self.get_projection_kwargs(),
+        )
         return self.get_serializer().dump(res, many=True)
 
     def createEntity(self) -> Dict[str, any]:
@@ -301,24 +941,231 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
         If soft, it will the `delete` field will be set to True. It will not be delete from the Database
         but it will not be showing in the requests anymore.
         """
-        model: BaseModelSql = self.model.get_one(
-            **{self.field_lookup: self.field_lookup_value}
-        )
-        if not model:
-            return "impossible delete: entity not found", 404
         if deleteMethod == "hard":
+            model: BaseModelSql = self.model.get_one(
+                **{self.field_lookup: self.field_lookup_value}
+            )
+            if not model:
+                return "impossible delete: entity not found", 404
             return model.delete(deleteMethod)
 
-        model._deleted = True
-        model.update()
+        # soft delete is a single UPDATE, no need to load the entity
+        if self.field_lookup_value is None:
+            return "impossible delete: entity not found", 404
+        if not self.model.soft_delete_by(**{self.field_lookup: self.field_lookup_value}):
+            return "impossible delete: entity not found", 404
         return "", 204
 
+    def is_bulk_request(self) -> bool:
+        """
+        Return True if the view accepts bulk requests and the request json is an array
+        """
+        return (
+            self.bulk
+            and request.method in ["POST", "PATCH", "DELETE"]
+            and isinstance(request.get_json(silent=True), list)
+        )
+
+    def bulkCreateEntities(self) -> t.Tuple[Dict[str, any], int]:
+        """
+        Create many entities from the received json array, in a single transaction
+        """
+        items = self.get_bulk_items()
+        loaded, results = self.bulk_load(items)
+
+        entities = self.model.bulk_save(
+            [self.model(**data) for data in loaded.values()],
+            chunk_size=self.bulk_chunk_size,
+        )
+        serializer = self.get_serializer()
+        for index, entity in zip(loaded, entities):
+            results[index] = {"status": 201, "data": serializer.dump(entity)}
+
+        return self.bulk_response(results, 201)
+
+    def bulkUpdateEntities(self) -> t.Tuple[Dict[str, any], int]:
+        """
+        Update many entities from the received json array. Each item must
+        contain its `field_lookup` value.
+        """
+        items = self.get_bulk_items()
+        lookups = [
+            item.get(self.field_lookup) if isinstance(item, dict) else None
+            for item in items
+        ]
+        items = [
+            {k: v for k, v in item.items() if k != self.field_lookup}
+            if isinstance(item, dict)
+            else item
+            for item in items
+        ]
+        loaded, results = self.bulk_load(items)
+
+        for index in [i for i in loaded if lookups[i] is None]:
+            results[index] = {
+                "status": 422,
+                "errors": {self.field_lookup: ["Missing data for required field."]},
+            }
+            del loaded[index]
+
+        entities = self.get_bulk_entities([lookups[i] for i in loaded])
+        serializer = self.get_serializer()
+        mappings = []
+        indexes = []
+        for index, data in loaded.items():
+            entity = entities.get(str(lookups[index]))
+            if entity is None:
+                results[index] = {"status": 404, "errors": "entity not found"}
+                continue
+
+            changes = {key: value for key, value in data.items() if hasattr(entity, key)}
+            self.detach_entity(entity)
+            for key, value in changes.items():
+                setattr(entity, key, value)
+            mappings.append({"id": entity.id, **changes})
+            indexes.append(index)
+            results[index] = {"status": 200, "data": serializer.dump(entity)}
+
+        owner_filters = self.get_bulk_owner_filters()
+        updated = self.model.bulk_update(
+            mappings, chunk_size=self.bulk_chunk_size, **owner_filters
+        )
+        if updated is not None and updated < len(mappings):
+            # some entities were deleted (or changed owner) since they were loaded
+            ids = [mapping["id"] for mapping in mappings]
+            found = {str(i.id) for i in self.model.get_many_in("id", ids, **owner_filters)}
+            for index, mapping in zip(indexes, mappings):
+                if str(mapping["id"]) not in found:
+                    results[index] = {"status": 404, "errors": "entity not found"}
+        return self.bulk_response(results, 200)
+
+    def bulkDeleteEntities(self) -> t.Tuple[Dict[str, any], int]:
+        """
+        Soft delete many entities. The json array can contain the `field_lookup` values,
+        or objects with the `field_lookup` value
+        """
+        items = self.get_bulk_items()
+        lookups = [
+            item.get(self.field_lookup) if isinstance(item, dict) else item
+            for item in items
+        ]
+        entities = self.get_bulk_entities([i for i in lookups if i is not None])
+
+        results = []
+        ids = []
+        for value in lookups:
+            entity = entities.get(str(value)) if value is not None else None
+            if entity is None:
+                results.append({"status": 404, "errors": "entity not found"})
+                continue
+            ids.append(entity.id)
+            results.append({"status": 204})
+
+        if ids:
+            self.model.bulk_soft_delete(
+                ids, chunk_size=self.bulk_chunk_size, **self.get_bulk_owner_filters()
+            )
+        return self.bulk_response(results, 200)
+
+    def get_bulk_items(self) -> t.List[t.Any]:
+        """
+        Return the json array of a bulk request, checking its size
+        """
+        items = request.get_json()
+        if len(items) > self.bulk_max_size:
+            raise ValidationError(
+                {"msg": f"Bulk requests accept at most {self.bulk_max_size} items"}, 413
+            )
+        return items
+
+    def bulk_load(
+        self, items: t.List[t.Any]
+    ) -> t.Tuple[t.Dict[int, Dict[str, any]], t.List[t.Optional[Dict[str, any]]]]:
+        """
+        Validate all the items with the serializer (`many=True`).
+        Returns the valid data by item index, and the results list
+        already filled with the errors of the invalid items.
+        """
+        results = [None] * len(items)
+        try:
+            return dict(enumerate(self.get_serializer().load(items, many=True))), results
+        except MarshmallowValidationError as e:
+            loaded = {}
+            for index, data in enumerate(e.valid_data or []):
+                if index in e.messages:
+                    results[index] = {"status": 422, "errors": e.messages[index]}
+                else:
+                    loaded[index] = data
+            return loaded, results
+
+    def get_bulk_entities(self, lookups: t.List[t.Any]) -> t.Dict[str, BaseModelSql]:
+        """
+        Load, in a single query, the entities of a bulk request by their `field_lookup` value
+        """
+        if not lookups:
+            return {}
+        entities = self.model.get_many_in(
+            self.field_lookup, lookups, **self.get_bulk_owner_filters()
+        )
+        return {str(getattr(i, self.field_lookup)): i for i in entities}
+
+    @staticmethod
+    def detach_entity(entity: t.Any) -> None:
+        """
+        Detach a SQL entity from its session before changing it for a bulk statement.
+        With the unit of work, the request session would otherwise flush the changes
+        again, without the WHERE clause of the bulk statement
+        """
+        dbSession = object_session(entity) if isinstance(entity, BaseModelSql) else None
+        if dbSession is not None:
+            dbSession.expunge(entity)
+
+    def is_bulk_owned_only(self) -> bool:
+        """
+        True if the bulk requests only reach the entities of the current user
+        """
+        if self.bulk_owned_only is not None:
+            return self.bulk_owned_only
+        return any(
+            isinstance(getattr(i, "validator", i), type)
+            and issubclass(getattr(i, "validator", i), Self_required)
+            for i in self.get_validator_plan(request.method)
+        )
+
+    def get_bulk_owner_filters(self) -> Dict[str, t.Any]:
+        """
+        The filters added to the WHERE clause of the bulk queries: `_owner_id == current_user.id`
+        when the bulk requests are owned only
+        """
+        if not self.is_bulk_owned_only():
+            return {}
+        user_id = getattr(current_user, "id", None)
+        if user_id is None:
+            # `_owner_id IS NULL` would match the entities without owner
+            raise NotTheOwner()
+        return {"_owner_id": user_id}
+
+    def bulk_response(
+        self, results: t.List[Dict[str, any]], success_status: int
+    ) -> t.Tuple[Dict[str, any], int]:
+        """
+        Return the per item results, with the `success_status` if every item
+        succeeded or 207 (multi status) otherwise
+        """
+        status = success_status
+        if any(result["status"] >= 400 for result in results):
+            status = 207
+        return {"results": results}, status
+
     def validateRequest(self):
         """
         validate the request according to the serializer
         """
         if request.method in ["GET", "DELETE"]:
             return {}
+        if self.is_bulk_request():
+            # bulk items are validated one by one by the bulk methods
+            return {}
         try:
             return self.get_serializer().load(request.get_json())
         except MarshmallowValidationError as e:
@@ -326,19 +1173,66 @@ class GenericApiView(ABC, FlaskView, metaclass=GenericApiViewMeta):
 
     def validateValidators(self):
         """
-        Class that runs all validators in self `validator_list` attribute
+        Run the compiled validators of the request HTTP method
         """
+        for validator in self.get_validator_plan(request.method):
+            validator(self)
 
-        def run_validator(validator: BaseValidator):
-            validator = validator(self)
+    @classmethod
+    def compile_validators(cls, methods: t.Optional[t.Iterable[str]] = None) -> t.Dict[str, t.Tuple]:
+        """
+        Compile the `validator_list` into an immutable tuple of validators per HTTP method:
+        the `*` validators followed by the method ones, without duplicates.
+        Called once by `prepare_view`, or on the first request of each method.
+        """
+        plans = dict(cls.__dict__.get("_validator_plans") or {})
+        for method in methods or cls.methods:
+            plans[method.upper()] = cls.build_validator_plan(cls.validator_list, method)
+        cls._validator_plans = plans
+        return plans
+
+    @classmethod
+    def invalidate_validator_plans(cls) -> None:
+        """
+        Drop the compiled validators (EG. after a validator was added to the view)
+        """
+        cls._validator_plans = None
+
+    @staticmethod
+    def build_validator_plan(validator_list, method: str) -> t.Tuple:
+        if isinstance(validator_list, list):
+            validators = validator_list
+        elif isinstance(validator_list, dict):
+            validator_list = {k.lower(): v for k, v in validator_list.items()}
+            validators = [
+                *validator_list.get("*", []),
+                *validator_list.get(method.lower(), []),
+            ]
+        else:
+            validators = []
+
+        plan = []
+        keys = set()
+        for validator in validators:
+            if isinstance(validator, type) and issubclass(validator, BaseValidator):
+                validator = ValidatorCall(validator)
+            key = getattr(validator, "key", None)
+            if key is not None:
+                if key in keys:
+                    continue
+                keys.add(key)
+            plan.append(validator)
+        return tuple(plan)
+
+    def get_validator_plan(self, method: str) -> t.Tuple:
+        """
+        Return the compiled validators of the HTTP method
+        """
+        if isinstance(getattr(type(self), "validator_list", None), property) or "validator_list" in self.__dict__:
+            # validators defined per instance can't be compiled
+            return self.build_validator_plan(self.validator_list, method)
 
-        if isinstance(self.validator_list, list):
-            for validator in self.validator_list:
-                run_validator(validator)
-        elif isinstance(self.validator_list, dict):
-            self.validator_list = {k.lower(): v for k, v in self.validator_list.items()}
-            for validator in [
-                *[i for i in self.validator_list.get("*", [])],
-                *[i for i in self.validator_list.get(request.method.lower(), [])],
-            ]:
-                run_validator(validator)
+        plan = (type(self).__dict__.get("_validator_plans") or {}).get(method.upper())
+        if plan is None:
+            plan = self.compile_validators([method])[method.upper()]
+        return plan
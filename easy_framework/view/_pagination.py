@@ -0,0 +1,52 @@
+from __future__ import annotations
+import typing as t
+import base64
+import json
+
+from easy_framework.exception import ValidationError
+
+
+class Cursor:
+    '''
+    Opaque cursor used by the keyset pagination of the GenericApiView.
+
+    The cursor keeps the sort key of the last entity of a page, so the next
+    page can be fetched by seeking (`WHERE key > last_key`) instead of using OFFSET.
+    It's only base64 encoded: don't store anything secret in it.
+    '''
+
+    @classmethod
+    def encode(cls, order_by: str, values: t.Sequence[t.Any]) -> str:
+        '''
+        Encode the sort key values of the last entity into the cursor string
+        '''
+        raw = json.dumps([order_by, list(values)], default=str, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, cursor: str, order_by: str) -> t.List[t.Any]:
+        '''
+        Decode the cursor received in the query string.
+        Raises a 400 ValidationError if the cursor is invalid or
+        was generated for a different sort key
+        '''
+        try:
+            padding = '=' * (-len(cursor) % 4)
+            cursor_order_by, values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        except (ValueError, TypeError):
+            raise ValidationError({'cursor': ['Invalid cursor.']}, 400)
+
+        if cursor_order_by != order_by or not isinstance(values, list):
+            raise ValidationError({'cursor': ['Cursor does not match the requested sort order.']}, 400)
+        return values
+
+    @classmethod
+    def key_values(cls, entity: t.Any, order_by: str) -> t.Tuple:
+        '''
+        Return the sort key values of an entity, in the cursor format
+        '''
+        key = order_by.lstrip('-+')
+        if key == 'id':
+            return (entity.id,)
+        return (getattr(entity, key), entity.id)
+
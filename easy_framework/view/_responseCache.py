@@ -0,0 +1,42 @@
+from __future__ import annotations
+import typing as t
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from flask import request
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    '''
+    What the response cache of a GenericApiView keeps for a GET request:
+    the body and headers of the response, its validators (see `conditional_get`)
+    and the write generation of the model when it was built.
+    '''
+
+    generation: int
+    data: bytes
+    headers: t.List[t.Tuple[str, str]]
+    etag: t.Optional[str] = None
+    last_modified: t.Optional[datetime] = None
+
+
+def as_utc(value: t.Optional[datetime]) -> t.Optional[datetime]:
+    '''
+    The databases return naive UTC datetimes
+    '''
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def is_not_modified(etag: t.Optional[str], last_modified: t.Optional[datetime]) -> bool:
+    '''
+    Return True if the validators match the conditional headers of the request.
+    `If-None-Match` takes precedence over `If-Modified-Since` (RFC 9110)
+    '''
+    if request.if_none_match:
+        return etag is not None and request.if_none_match.contains_weak(etag)
+    if request.if_modified_since is not None and last_modified is not None:
+        return as_utc(last_modified).replace(microsecond=0) <= request.if_modified_since
+    return False
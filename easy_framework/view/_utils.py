@@ -18,7 +18,8 @@ def register_view(view: GenericApiView, flaskApp: Flask):
 def register_view(view: GenericApiView, flaskApp: Flask = None):
     if not flaskApp:
         flaskApp: Flask = cache.app
-    
+
+    view.prepare_view()
     for route in view.routes:
         view_id = view.__name__+'.'+ route
         flaskApp.add_url_rule(route, view_id, view.as_view(view_id))
\ No newline at end of file
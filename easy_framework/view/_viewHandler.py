@@ -7,18 +7,49 @@ from pathlib import Path
 import importlib
 from loguru import logger
 from easy_framework._context import cache
+from easy_framework._startupReport import StartupReport
+from ._viewManifest import ViewManifest, LazyViewLoader
 
 class ViewHandler:
     
     @classmethod
-    def register_views(cls, directory: str|Path, flaskApp: Flask, view_class_name: str):
+    def register_views(
+        cls,
+        directory: str|Path,
+        flaskApp: Flask,
+        view_class_name: str,
+        lazy_import: bool = False,
+        manifest_path: t.Optional[str|Path] = None,
+    ):
         '''
-        Import and register all views in a directory
+        Import and register all views in a directory.
+
+        With `lazy_import`, the routes are registered from the view manifest
+        and each module is only imported when the first request reaches it
         '''
+        if lazy_import:
+            manifest = cls.get_manifest(cls, directory, view_class_name, manifest_path)
+            cls.registerManifestViews(cls, manifest, flaskApp)
+            return manifest
+
         module_list = cls.get_modules(cls, directory)
         view_list = cls.filter_views_from_module_list(cls, module_list, view_class_name)
         cls.registerAllViews(cls, view_list, flaskApp)
 
+    def get_manifest(
+        self,
+        directory: str|Path,
+        view_class_name: str,
+        manifest_path: t.Optional[str|Path] = None,
+    ) -> ViewManifest:
+        '''
+        Load the view manifest of the directory (see ViewManifest)
+        '''
+        if not os.path.isabs(directory):
+            directory = cache.root_dir.joinpath(directory)
+
+        return ViewManifest(directory, view_class_name, manifest_path).load()
+
     def get_modules(self, directory:str|Path):
         '''
         get modules from directory using the FilterModules class
@@ -35,7 +66,8 @@ class ViewHandler:
 
         view_list = []
         for module in module_list:
-            module = importlib.import_module(module, module)
+            with StartupReport.measure_module(module):
+                module = importlib.import_module(module, module)
 
             if hasattr(module, view_class_name):
                 view = getattr(module, view_class_name)
@@ -50,6 +82,8 @@ class ViewHandler:
 
         logger.info("Adding url rules...")
         for view in view_list:
+            if hasattr(view, 'prepare_view'):
+                view.prepare_view()
 
             for route in view.routes:
                 view_id = view.__name__+'.'+ route
@@ -57,6 +91,44 @@ class ViewHandler:
 
         logger.info(f"{len(view_list)} urls registered")
 
+    def registerManifestViews(self, manifest: ViewManifest, flaskApp: Flask):
+        '''
+        Register the views of the manifest in the flask app, without importing them.
+        The views whose routes can't be read from the source are imported now
+        '''
+        logger.info("Adding url rules from the view manifest...")
+        loaders = []
+        eager_modules = []
+        for entry in manifest.views:
+            if not entry.is_static:
+                eager_modules.append(entry.module)
+                continue
+
+            loader = LazyViewLoader(entry)
+            for route in entry.routes:
+                view_id = entry.view_class+'.'+ route
+                flaskApp.add_url_rule(route, view_id, loader.view_function(view_id))
+            loaders.append(loader)
+
+        flaskApp.lazyViews = getattr(flaskApp, 'lazyViews', []) + loaders
+        view_list = ViewHandler.filter_views_from_module_list(self, eager_modules, manifest.view_class_name)
+        # the same view can be imported by another module of the folder
+        lazy_views = {(loader.entry.module, loader.entry.view_class) for loader in loaders}
+        view_list = [view for view in view_list if (view.__module__, view.__name__) not in lazy_views]
+        ViewHandler.registerAllViews(self, view_list, flaskApp)
+        logger.info(f"{len(loaders)} lazy views registered ({len(manifest.parsed)} files parsed)")
+
+    @staticmethod
+    def load_lazy_views(flaskApp: Flask) -> int:
+        '''
+        Import and prepare now all the lazy views registered in the flask app.
+        Returns the number of views loaded
+        '''
+        loaders = [loader for loader in getattr(flaskApp, 'lazyViews', []) if not loader.is_loaded]
+        for loader in loaders:
+            loader.get_view()
+        return len(loaders)
+
 class FilterModules:
     '''
     Access a specific directory, get all python files
@@ -0,0 +1,244 @@
+from __future__ import annotations
+import typing as t
+import ast
+import hashlib
+import importlib
+import json
+import os
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+from flask.views import MethodView
+from loguru import logger
+
+from easy_framework._startupReport import StartupReport
+
+
+@dataclass
+class ViewManifestEntry:
+    '''
+    What the manifest knows about a python file of the view folder.
+
+    `view_class` is None when the module has no view. `routes` and `methods`
+    are None when they can't be read from the source (EG. inherited, computed
+    or imported views): those modules are imported at registration.
+    '''
+
+    path: str
+    module: str
+    mtime_ns: int
+    size: int
+    digest: str
+    view_class: t.Optional[str] = None
+    routes: t.Optional[t.List[str]] = None
+    methods: t.Optional[t.List[str]] = None
+
+    @property
+    def is_static(self) -> bool:
+        return self.view_class is not None and self.routes is not None and self.methods is not None
+
+
+class ViewManifest:
+    '''
+    Discovery manifest of a view folder: module -> view class -> routes.
+
+    The routes and methods of the views are read from the source code (AST),
+    without importing the modules. The result is cached in a json file,
+    keyed by the mtime and size of each file (and its hash, when only the
+    mtime changed), so only the new or modified files are parsed again.
+
+    By default the cache is stored in the `__pycache__` folder of the view folder.
+    '''
+
+    version = 1
+    cache_file_name = 'easy_framework_views.json'
+
+    def __init__(self, directory: str | Path, view_class_name: str, cache_path: t.Optional[str | Path] = None) -> None:
+        self.directory = Path(directory)
+        self.view_class_name = view_class_name
+        self.cache_path = Path(cache_path) if cache_path else self.directory / '__pycache__' / self.cache_file_name
+        self.entries: t.List[ViewManifestEntry] = []
+        self.parsed: t.List[str] = []
+        self._changed = False
+
+    @property
+    def views(self) -> t.List[ViewManifestEntry]:
+        return [entry for entry in self.entries if entry.view_class is not None]
+
+    def load(self) -> 'ViewManifest':
+        '''
+        Build the manifest, reusing the cached entries of the unchanged files
+        '''
+        from ._viewHandler import FilterModules
+
+        filter = FilterModules()
+        files = filter.remove_init_from_file_list(filter.find_all_python_files(self.directory))
+        modules = filter.convert_from_path_to_module(files)
+        cached = self.read_cache()
+
+        self.entries = []
+        self.parsed = []
+        self._changed = False
+        for path, module in sorted(zip(files, modules)):
+            self.entries.append(self.get_entry(str(path), module, cached.get(str(path))))
+
+        if self.parsed or self._changed or set(cached) != {entry.path for entry in self.entries}:
+            self.write_cache()
+        return self
+
+    def get_entry(self, path: str, module: str, cached: t.Optional[ViewManifestEntry]) -> ViewManifestEntry:
+        stat = os.stat(path)
+        if cached is not None and cached.module == module:
+            if (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+                return cached
+
+        with open(path, 'rb') as file:
+            source = file.read()
+        digest = hashlib.sha256(source).hexdigest()
+        if cached is not None and cached.module == module and cached.digest == digest:
+            cached.mtime_ns, cached.size = stat.st_mtime_ns, stat.st_size
+            self._changed = True
+            return cached
+
+        self.parsed.append(path)
+        entry = ViewManifestEntry(path, module, stat.st_mtime_ns, stat.st_size, digest)
+        try:
+            tree = ast.parse(source, path)
+        except SyntaxError:
+            # let the import raise the error, as the eager registration does
+            entry.view_class = self.view_class_name
+            return entry
+
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == self.view_class_name:
+                entry.view_class = node.name
+                entry.routes, entry.methods = self.get_class_attributes(node)
+            elif self.binds_view_name(node):
+                entry.view_class = self.view_class_name
+                entry.routes = entry.methods = None
+        return entry
+
+    def binds_view_name(self, node: ast.stmt) -> bool:
+        '''
+        Check if a statement (other than the class definition) sets the view name in the module
+        '''
+        name = self.view_class_name
+        if isinstance(node, ast.Assign):
+            return any(isinstance(target, ast.Name) and target.id == name for target in node.targets)
+        if isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+            return isinstance(node.target, ast.Name) and node.target.id == name
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            return any(alias.name == '*' or (alias.asname or alias.name.split('.')[0]) == name for alias in node.names)
+        if isinstance(node, (ast.If, ast.Try, ast.With, ast.For, ast.While)):
+            return any(
+                (isinstance(child, ast.ClassDef) and child.name == name) or self.binds_view_name(child)
+                for child in ast.walk(node)
+                if isinstance(child, ast.stmt) and child is not node
+            )
+        return False
+
+    @staticmethod
+    def get_class_attributes(node: ast.ClassDef) -> t.Tuple[t.Optional[t.List[str]], t.Optional[t.List[str]]]:
+        '''
+        Read the literal `routes` and `methods` of the view class
+        '''
+        values: t.Dict[str, t.Optional[t.List[str]]] = {'routes': None, 'methods': None}
+        for statement in node.body:
+            if isinstance(statement, ast.Assign):
+                targets = [target.id for target in statement.targets if isinstance(target, ast.Name)]
+            elif isinstance(statement, ast.AnnAssign) and statement.value is not None and isinstance(statement.target, ast.Name):
+                targets = [statement.target.id]
+            else:
+                continue
+
+            for target in targets:
+                if target not in values:
+                    continue
+                try:
+                    value = ast.literal_eval(statement.value)
+                except (ValueError, TypeError, SyntaxError):
+                    value = None
+                if not isinstance(value, (list, tuple)) or not all(isinstance(i, str) for i in value):
+                    value = None
+                values[target] = list(value) if value is not None else None
+        return values['routes'], values['methods']
+
+    def read_cache(self) -> t.Dict[str, ViewManifestEntry]:
+        try:
+            with open(self.cache_path) as file:
+                data = json.load(file)
+            if data.get('version') != self.version or data.get('view_class_name') != self.view_class_name:
+                return {}
+            return {entry['path']: ViewManifestEntry(**entry) for entry in data['entries']}
+        except (OSError, ValueError, TypeError, KeyError):
+            return {}
+
+    def write_cache(self) -> None:
+        data = {
+            'version': self.version,
+            'view_class_name': self.view_class_name,
+            'entries': [asdict(entry) for entry in self.entries],
+        }
+        temp_path = self.cache_path.with_name(f'{self.cache_path.name}.{os.getpid()}.tmp')
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w') as file:
+                json.dump(data, file)
+            os.replace(temp_path, self.cache_path)
+        except OSError as error:
+            logger.warning(f"Could not write the view manifest {self.cache_path}: {error}")
+
+
+class LazyViewLoader:
+    '''
+    Imports and prepares the view of a manifest entry on the first request
+    that reaches one of its routes
+    '''
+
+    def __init__(self, entry: ViewManifestEntry) -> None:
+        self.entry = entry
+        self.view: t.Optional[MethodView] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.view is not None
+
+    def get_view(self) -> MethodView:
+        if self.view is None:
+            with self._lock:
+                if self.view is None:
+                    self.view = self.load()
+        return self.view
+
+    def load(self) -> MethodView:
+        entry = self.entry
+        with StartupReport.measure_module(entry.module):
+            module = importlib.import_module(entry.module, entry.module)
+        view = getattr(module, entry.view_class)
+        if hasattr(view, 'prepare_view'):
+            view.prepare_view()
+
+        if list(view.routes) != entry.routes:
+            logger.warning(f"The routes of {entry.module}.{entry.view_class} don't match the view manifest")
+        logger.debug(f"View {entry.module}.{entry.view_class} loaded")
+        return view
+
+    def view_function(self, view_id: str) -> t.Callable:
+        '''
+        Flask view function of a route, that loads the view when called
+        '''
+        loader = self
+        view_func = None
+
+        def lazy_view(**kwargs):
+            nonlocal view_func
+            if view_func is None:
+                view_func = loader.get_view().as_view(view_id)
+            return view_func(**kwargs)
+
+        lazy_view.__name__ = view_id
+        lazy_view.methods = self.entry.methods
+        lazy_view.loader = self
+        return lazy_view
@@ -0,0 +1,53 @@
+from unittest import mock
+
+from tests import TestCase
+from easy_framework.auth import DatabaseMethodSql
+from easy_framework.user.userModel import UserModel
+from easy_framework.validator import Login_required
+from easy_framework._context import cache
+
+
+class TestAuthManager(TestCase):
+    def login(self, flask_app):
+        with flask_app.test_request_context():
+            user = UserModel(login="test", password="test").save()
+            return flask_app.authManager.auth_method.generateSession(user)
+
+    def test_auth_method_is_built_once(self):
+        flask_app = self.get_flask_app_sql()
+        authManager = flask_app.authManager
+
+        self.assertIs(authManager.auth_method, authManager.auth_method)
+        self.assertIsInstance(authManager.auth_method, DatabaseMethodSql)
+
+        cache.config.EASY_FRAMEWORK_AUTH_METHOD = "database_mongo"
+        self.assertIsNot(authManager.auth_method, authManager.auth_method_database_sql())
+        self.assertEqual(type(authManager.auth_method).__name__, "DatabaseMethodMongo")
+
+    def test_parse_and_validate_the_token_once_per_request(self):
+        flask_app = self.get_flask_app_sql()
+        token = self.login(flask_app)
+
+        class View:
+            @Login_required()
+            @Login_required()
+            def get(self):
+                return "ok"
+
+        with mock.patch.object(DatabaseMethodSql, "getTokenFromRequest", autospec=True, return_value=token) as parse, \
+                mock.patch.object(DatabaseMethodSql, "validateToken", autospec=True) as validate:
+            with flask_app.test_request_context("/", headers={"Authorization": f"Bearer {token}"}):
+                self.assertEqual(View().get(), "ok")
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(validate.call_count, 1)
+
+    def test_a_new_request_parses_its_own_token(self):
+        flask_app = self.get_flask_app_sql()
+        token = self.login(flask_app)
+        auth_method = flask_app.authManager.auth_method
+
+        with flask_app.test_request_context("/", headers={"Authorization": f"Bearer {token}"}):
+            self.assertEqual(auth_method.token, token)
+        with flask_app.test_request_context("/", headers={"Authorization": "Bearer other"}):
+            self.assertEqual(auth_method.token, "other")
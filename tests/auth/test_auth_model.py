@@ -1,8 +1,13 @@
 from tests import TestCase
-from datetime import datetime
+from datetime import datetime, timedelta
+
+import sqlalchemy as sa
+from sqlalchemy import event
 
 from easy_framework.auth import AuthModel
 from easy_framework.auth import AuthModelMongo
+from easy_framework.auth import DatabaseMethodSql, DatabaseMethodMongo
+from easy_framework.user import UserModel, UserModelMongo
 from easy_framework._context import cache
 
 from tests import generate_objectid
@@ -55,3 +60,63 @@ class TestAuthModel(TestCase):
                 session.expiration_date,
                 datetime.now() + cache.config.EASY_FRAMEWORK_AUTH_TOKEN_EXPIRATION,
             )
+
+
+class TestAuthModelIndexes(TestCase):
+    def test_session_table_indexes(self):
+        self.get_flask_app_sql()
+        indexes = sa.inspect(self.get_sqldb().dbConfig.engine).get_indexes(AuthModel.__tablename__)
+        by_columns = {tuple(index["column_names"]): index for index in indexes}
+
+        self.assertTrue(by_columns[("token_digest",)]["unique"])
+        self.assertIn(("user_id",), by_columns)
+        self.assertIn(("expiration_date",), by_columns)
+
+    def test_lookup_the_session_through_the_token_digest_index(self):
+        flask_app = self.get_flask_app_sql()
+        with flask_app.test_request_context():
+            user = UserModel(login="test", password="123").save()
+            token = DatabaseMethodSql().generateSession(user)
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, *args):
+            statements.append((statement, parameters))
+
+        engine = self.get_sqldb().dbConfig.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        with flask_app.app_context():
+            found, _ = DatabaseMethodSql().lookupSession(token)
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        self.assertEqual(found.id, user.id)
+        self.assertEqual(len(statements), 1)
+        with engine.connect() as connection:
+            plan = " ".join(str(row) for row in connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statements[0][0], statements[0][1]))
+        self.assertIn("ux_FLASK_EASY_FRAMEWORK_SESSION_token_digest", plan)
+
+    def test_do_not_lookup_expired_sessions(self):
+        flask_app = self.get_flask_app_sql()
+        with flask_app.test_request_context():
+            user = UserModel(login="test", password="123").save()
+            token = DatabaseMethodSql().generateSession(user)
+            ModelSession = AuthModel.get_one(AuthModel.token == token)
+            ModelSession.expiration_date = datetime.now() - timedelta(seconds=1)
+            ModelSession.update()
+
+            self.assertEqual(DatabaseMethodSql().lookupSession(token), (None, None))
+
+    def test_mongo_session_indexes(self):
+        with self.get_flask_app_mongo().test_request_context():
+            user = UserModelMongo(login="test", password="123").save()
+            token = DatabaseMethodMongo().generateSession(user)
+            AuthModelMongo.ensure_indexes()
+            indexes = AuthModelMongo._get_collection().index_information()
+
+            found, _ = DatabaseMethodMongo().lookupSession(token)
+            self.assertEqual(found.id, user.id)
+
+        by_key = {tuple(key for key, _ in index["key"]): index for index in indexes.values()}
+        self.assertTrue(by_key[("token_digest",)]["unique"])
+        self.assertIn(("user_id",), by_key)
+        self.assertEqual(by_key[("expiration_date",)]["expireAfterSeconds"], 0)
@@ -146,3 +146,16 @@ class TestDatabaseMethod(TestCase):
             DatabaseMethodMongo().loadUser()
 
             self.assertIsInstance(g.user, UserMixin)
+
+    def test_get_user_from_a_token_without_expiration_date_mongo(self):
+        with self.get_flask_app_mongo().test_request_context("/", json=self.authJson()):
+            user = self.userModelMongo(login="test", password="test")
+            user.save()
+            token = DatabaseMethodMongo().generateSession(user)
+            AuthModelMongo.objects(user_id=user.id).update(set__expiration_date=None)
+        with self.get_flask_app_mongo().test_request_context(
+            "/", headers={"Authorization": f"Bearer {token}"}
+        ):
+            DatabaseMethodMongo().loadUser()
+
+            self.assertEqual(g.user.id, user.id)
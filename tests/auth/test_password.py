@@ -0,0 +1,80 @@
+import threading
+
+from tests import TestCase
+from easy_framework.auth import AuthView
+from easy_framework.auth import PasswordManager
+from easy_framework.auth._password import PasswordHashingPool
+from easy_framework.exception import ServiceUnavailable
+from easy_framework.user.userModel import UserModel
+from easy_framework._context import cache
+
+
+class TestPasswordManager(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.config.EASY_FRAMEWORK_AUTH_PASSWORD_BCRYPT_ROUNDS = 4
+
+    def tearDown(self) -> None:
+        cache.config.EASY_FRAMEWORK_AUTH_PASSWORD_ITERATIONS = 30000
+        cache.config.EASY_FRAMEWORK_AUTH_PASSWORD_BCRYPT_ROUNDS = 12
+        super().tearDown()
+
+    def test_hash_with_the_configured_cost(self):
+        cache.config.EASY_FRAMEWORK_AUTH_PASSWORD_ITERATIONS = 1000
+        hash = PasswordManager().hash("test")
+
+        self.assertTrue(hash.startswith(b"$ef$1000$$2b$04$"))
+        self.assertTrue(PasswordManager().compare("test", hash))
+        self.assertFalse(PasswordManager().compare("wrong", hash))
+        self.assertFalse(PasswordManager().needs_rehash(hash))
+
+    def test_compare_hashes_without_the_iterations_prefix(self):
+        hash = PasswordManager().hash("test")
+
+        self.assertTrue(hash.startswith(b"$2b$04$"))
+        cache.config.EASY_FRAMEWORK_AUTH_PASSWORD_ITERATIONS = 1000
+        self.assertTrue(PasswordManager().compare("test", hash.decode()))
+        self.assertTrue(PasswordManager().needs_rehash(hash))
+
+    def test_needs_rehash_when_the_bcrypt_rounds_change(self):
+        hash = PasswordManager().hash("test")
+        cache.config.EASY_FRAMEWORK_AUTH_PASSWORD_BCRYPT_ROUNDS = 5
+        self.assertTrue(PasswordManager().needs_rehash(hash))
+
+    def test_rehash_the_password_on_login(self):
+        flask_app = self.get_flask_app_sql()
+        with flask_app.app_context():
+            UserModel(login="test", password="test").save()
+
+        cache.config.EASY_FRAMEWORK_AUTH_PASSWORD_ITERATIONS = 1000
+        res = flask_app.test_client().post(AuthView.routes[0], json={"login": "test", "password": "test"})
+
+        self.assertEqual(res.status_code, 200)
+        with flask_app.app_context():
+            password = UserModel.get_one(login="test").password
+        self.assertTrue(password.startswith("$ef$1000$"))
+        self.assertTrue(PasswordManager().compare("test", password))
+
+
+class TestPasswordHashingPool(TestCase):
+    def test_raise_503_when_the_pool_is_saturated(self):
+        pool = PasswordHashingPool(workers=1, queue_size=0)
+        self.addCleanup(pool.shutdown)
+        started, release = threading.Event(), threading.Event()
+
+        def blocking():
+            started.set()
+            release.wait(5)
+            return True
+
+        worker = threading.Thread(target=pool.run, args=(blocking,))
+        worker.start()
+        started.wait(5)
+
+        with self.assertRaises(ServiceUnavailable) as exc_info:
+            pool.run(lambda: True)
+        self.assertEqual(exc_info.exception.status_code, 503)
+
+        release.set()
+        worker.join(5)
+        self.assertTrue(pool.run(lambda: True))
@@ -0,0 +1,151 @@
+import time
+from datetime import datetime, timedelta
+from unittest import mock
+
+from sqlalchemy import event
+
+from tests import TestCase
+from tests import generate_objectid
+from easy_framework.auth import AuthModel
+from easy_framework.auth import AuthModelMongo
+from easy_framework.auth import SessionSweeper
+from easy_framework._context import cache
+
+
+class TestSessionSweeper(TestCase):
+    def create_sessions(self, flask_app, expired: int, valid: int):
+        with flask_app.app_context():
+            sessions = AuthModel.bulk_save(
+                [AuthModel(token=f"token_{i}", user_id=1) for i in range(expired + valid)]
+            )
+            AuthModel.bulk_update(
+                [{"id": session.id, "expiration_date": datetime.now() - timedelta(minutes=1)} for session in sessions[:expired]]
+            )
+
+    def count_sessions(self, flask_app):
+        with flask_app.app_context():
+            with self.get_sqldb().getScopedSession() as dbSession:
+                return dbSession.query(AuthModel).count()
+
+    def test_sweep_expired_sessions_in_batches(self):
+        flask_app = self.get_flask_app_sql()
+        self.create_sessions(flask_app, expired=5, valid=2)
+
+        with flask_app.app_context():
+            report = SessionSweeper(flask_app, batch_size=2, pause=0).sweep()
+
+        self.assertEqual(report.deleted, 5)
+        self.assertEqual([deleted for deleted, _ in report.batches], [2, 2, 1])
+        self.assertEqual(self.count_sessions(flask_app), 2)
+
+    def test_delete_the_expired_sessions_by_their_ids(self):
+        flask_app = self.get_flask_app_sql()
+        self.create_sessions(flask_app, expired=3, valid=1)
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = self.get_sqldb().dbConfig.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", before_cursor_execute)
+        with flask_app.app_context():
+            self.assertEqual(AuthModel.delete_expired(batch_size=2), 2)
+
+        deletes = [statement for statement in statements if statement.startswith("DELETE")]
+        self.assertEqual(len(deletes), 1)
+        self.assertNotIn("LIMIT", deletes[0])
+        self.assertNotIn("SELECT", deletes[0])
+
+    def test_sweep_logged_out_sessions(self):
+        flask_app = self.get_flask_app_sql()
+        self.create_sessions(flask_app, expired=0, valid=2)
+        with flask_app.app_context():
+            AuthModel.soft_delete_by(token="token_0")
+            self.assertEqual(SessionSweeper(flask_app, pause=0).sweep().deleted, 1)
+
+    def test_limit_the_number_of_batches(self):
+        flask_app = self.get_flask_app_sql()
+        self.create_sessions(flask_app, expired=5, valid=0)
+
+        with flask_app.app_context():
+            report = SessionSweeper(flask_app, batch_size=2, pause=0).sweep(max_batches=1)
+
+        self.assertEqual(report.deleted, 2)
+        self.assertEqual(self.count_sessions(flask_app), 3)
+
+    def test_sweep_sessions_cli_command(self):
+        flask_app = self.get_flask_app_sql()
+        self.create_sessions(flask_app, expired=3, valid=1)
+
+        result = flask_app.test_cli_runner().invoke(args=["sweep-sessions"])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("3 sessions deleted", result.output)
+        self.assertEqual(self.count_sessions(flask_app), 1)
+
+    def test_background_sweeper_thread(self):
+        flask_app = self.get_flask_app_sql()
+        self.create_sessions(flask_app, expired=3, valid=1)
+
+        sweeper = SessionSweeper(flask_app, pause=0, interval=timedelta(milliseconds=10), jitter=timedelta(0))
+        sweeper.start()
+        self.addCleanup(sweeper.stop, 5)
+        deadline = time.monotonic() + 5
+        while self.count_sessions(flask_app) > 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sweeper.stop(5)
+
+        self.assertEqual(self.count_sessions(flask_app), 1)
+
+    def test_background_sweeper_starts_on_the_first_request_of_each_process(self):
+        cache.config.EASY_FRAMEWORK_AUTH_SESSION_SWEEPER = True
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_AUTH_SESSION_SWEEPER", False)
+        flask_app = self.get_flask_app_sql()
+        sweeper = flask_app.sessionSweeper
+        self.addCleanup(sweeper.stop, 5)
+        self.assertFalse(sweeper.is_running())
+
+        flask_app.test_client().get("/")
+        self.assertTrue(sweeper.is_running())
+        thread = sweeper._thread
+
+        flask_app.test_client().get("/")
+        self.assertIs(sweeper._thread, thread)
+
+        with mock.patch("easy_framework.auth._sessionSweeper.os.getpid", return_value=-1):
+            self.assertFalse(sweeper.is_running())
+            flask_app.test_client().get("/")
+            self.assertIsNot(sweeper._thread, thread)
+
+    def test_commit_every_batch_with_unit_of_work(self):
+        cache.config.EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK = True
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK", False)
+        flask_app = self.get_flask_app_sql()
+        with flask_app.app_context():
+            AuthModel.bulk_save([AuthModel(token=f"token_{i}", user_id=1) for i in range(3)])
+            AuthModel.soft_delete_by(user_id=1)
+        counts = []
+
+        def count_committed():
+            with self.get_sqldb().dbConfig.session() as dbSession:
+                counts.append(dbSession.query(AuthModel).count())
+
+        sweeper = SessionSweeper(flask_app, batch_size=2, pause=1)
+        with mock.patch.object(sweeper._stop, "wait", side_effect=lambda *args: count_committed()):
+            with flask_app.app_context():
+                self.assertEqual(sweeper.sweep().deleted, 3)
+                count_committed()
+
+        self.assertEqual(counts[0], 1)
+        self.assertEqual(counts[-1], 0)
+
+    def test_sweep_logged_out_sessions_mongo(self):
+        with self.get_flask_app_mongo().test_request_context():
+            for i in range(3):
+                AuthModelMongo(user_id=generate_objectid(), token=f"token_{i}").save()
+            AuthModelMongo.soft_delete_by(token__in=["token_0", "token_1"])
+
+            self.assertEqual(AuthModelMongo.delete_expired(batch_size=1), 1)
+            self.assertEqual(AuthModelMongo.delete_expired(), 1)
+            self.assertEqual(AuthModelMongo.objects.count(), 1)
@@ -0,0 +1,128 @@
+from unittest import mock
+
+from flask import g
+from sqlalchemy import event
+
+from tests import TestCase
+from easy_framework.auth import AuthView
+from easy_framework.auth import SignedTokenMethod, TokenUser
+from easy_framework.exception.apiExceptions import ValidationError
+from easy_framework.user.userModel import UserModel
+from easy_framework.user.userModelMongo import UserModelMongo
+from easy_framework.user.userMixin import AnonymousUser
+from easy_framework._context import cache
+
+
+class TestSignedTokenMethod(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.flask_app = self.get_flask_app_sql()
+        self.set_signing_keys({"key_1": "secret_1"})
+        cache.config.EASY_FRAMEWORK_AUTH_METHOD = "jwt"
+
+    def tearDown(self) -> None:
+        self.set_signing_keys({})
+        super().tearDown()
+
+    def set_signing_keys(self, keys, kid=None):
+        cache.config.EASY_FRAMEWORK_AUTH_SIGNING_KEYS = keys
+        cache.config.EASY_FRAMEWORK_AUTH_SIGNING_KEY_ID = kid
+
+    def login(self, login="test", password="test"):
+        with self.flask_app.test_request_context():
+            UserModel(login=login, password=password).save()
+        res = self.flask_app.test_client().post(
+            AuthView.routes[0], json={"login": login, "password": password}
+        )
+        return res.get_json()["auth_token"]
+
+    def load_user(self, token):
+        with self.flask_app.test_request_context("/", headers={"Authorization": f"Bearer {token}"}):
+            self.flask_app.authManager.loadUser()
+            return g.user
+
+    def test_auth_manager_uses_the_signed_token_method(self):
+        self.assertIsInstance(self.flask_app.authManager.auth_method, SignedTokenMethod)
+
+    def test_load_the_user_from_the_token_without_hitting_the_database(self):
+        token = self.login()
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = self.get_sqldb().dbConfig.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", before_cursor_execute)
+
+        user = self.load_user(token)
+
+        self.assertEqual(statements, [])
+        self.assertIsInstance(user, TokenUser)
+        self.assertEqual(user.id, UserModel.get_one(login="test").id)
+        with self.flask_app.app_context():
+            self.assertEqual(user.get_user().login, "test")
+
+    def test_reject_a_tampered_token(self):
+        header, claims, signature = self.login().split(".")
+        with self.flask_app.app_context():
+            forged = SignedTokenMethod.encode({**SignedTokenMethod.decode(claims), "sub": 999})
+
+        self.assertIsInstance(self.load_user(f"{header}.{forged}.{signature}"), AnonymousUser)
+        with self.flask_app.app_context():
+            with self.assertRaises(ValidationError):
+                SignedTokenMethod().verify(f"{header}.{forged}.{signature}")
+
+    def test_reject_a_token_with_an_invalid_kid(self):
+        _, claims, signature = self.login().split(".")
+        for kid in (["key"], {"key": 1}, 1):
+            header = SignedTokenMethod.encode({"alg": "HS256", "typ": "JWT", "kid": kid})
+            with self.flask_app.app_context():
+                with self.assertRaises(ValidationError) as exc_info:
+                    SignedTokenMethod().verify(f"{header}.{claims}.{signature}")
+            self.assertEqual(exc_info.exception.status_code, 498)
+
+    def test_reject_a_token_with_a_non_ascii_signature(self):
+        header, claims, _ = self.login().split(".")
+        for signature in ("é" * 43, "\ud800"):
+            with self.flask_app.app_context():
+                with self.assertRaises(ValidationError) as exc_info:
+                    SignedTokenMethod().verify(f"{header}.{claims}.{signature}")
+            self.assertEqual(exc_info.exception.status_code, 498)
+
+    def test_reject_an_expired_token(self):
+        token = self.login()
+        with mock.patch("easy_framework.auth._signedTokenMethod.time.time", return_value=10**12):
+            self.assertIsInstance(self.load_user(token), AnonymousUser)
+
+    def test_key_rotation_accepts_tokens_signed_with_any_active_key(self):
+        old_token = self.login()
+        self.set_signing_keys({"key_1": "secret_1", "key_2": "secret_2"}, "key_2")
+        new_token = self.login(login="test_2")
+
+        self.assertIsInstance(self.load_user(old_token), TokenUser)
+        self.assertIsInstance(self.load_user(new_token), TokenUser)
+
+        self.set_signing_keys({"key_2": "secret_2"})
+        self.assertIsInstance(self.load_user(old_token), AnonymousUser)
+        self.assertIsInstance(self.load_user(new_token), TokenUser)
+
+    def test_logout_revokes_the_token(self):
+        token = self.login()
+        headers = {"Authorization": f"Bearer {token}"}
+
+        res = self.flask_app.test_client().delete(AuthView.routes[0], headers=headers)
+        self.assertEqual(res.status_code, 204)
+        self.assertIsInstance(self.load_user(token), AnonymousUser)
+
+    def test_token_user_id_uses_the_mongo_user_id_type(self):
+        flask_app = self.get_flask_app_mongo()
+        cache.config.EASY_FRAMEWORK_AUTH_METHOD = "jwt"
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_AUTH_METHOD", "database_sql")
+        with flask_app.test_request_context():
+            user = UserModelMongo(login="test", password="test").save()
+            token = SignedTokenMethod().generateSession(user)
+
+        with flask_app.test_request_context("/", headers={"Authorization": f"Bearer {token}"}):
+            flask_app.authManager.loadUser()
+            self.assertEqual(g.user.id, user.id)
@@ -0,0 +1,209 @@
+from datetime import datetime, timedelta
+from unittest import TestCase as _TestCase
+from unittest import mock
+
+from flask import g
+from sqlalchemy import event
+
+from tests import TestCase
+from easy_framework.auth import DatabaseMethodSql
+from easy_framework.auth import DatabaseMethodMongo
+from easy_framework.auth import MemoryTokenCache, TokenCacheEntry
+from easy_framework.auth import AuthView
+from easy_framework.user.userModel import UserModel
+from easy_framework.user.userModelMongo import UserModelMongo
+from easy_framework.user.userMixin import AnonymousUser
+from easy_framework._ttlCache import TTLCache
+from easy_framework._context import cache
+
+
+class TestTTLCache(_TestCase):
+    def test_evict_the_least_recently_used_entry(self):
+        ttlCache = TTLCache(maxsize=2, ttl=60)
+        ttlCache.set("a", 1)
+        ttlCache.set("b", 2)
+        ttlCache.get("a")
+        ttlCache.set("c", 3)
+
+        self.assertEqual(ttlCache.get("a"), 1)
+        self.assertIsNone(ttlCache.get("b"))
+        self.assertEqual(len(ttlCache), 2)
+
+    def test_expire_entries_after_their_ttl(self):
+        ttlCache = TTLCache(maxsize=2, ttl=60)
+        with mock.patch("easy_framework._ttlCache.time.monotonic", return_value=100):
+            ttlCache.set("a", 1)
+            ttlCache.set("b", 2, ttl=5)
+        with mock.patch("easy_framework._ttlCache.time.monotonic", return_value=110):
+            self.assertEqual(ttlCache.get("a"), 1)
+            self.assertNotIn("b", ttlCache)
+
+    def test_do_not_store_entries_without_ttl(self):
+        ttlCache = TTLCache(maxsize=2, ttl=60)
+        ttlCache.set("a", 1, ttl=0)
+        self.assertNotIn("a", ttlCache)
+
+
+class TestMemoryTokenCache(_TestCase):
+    def entry(self, user_id=1, expiration_date=None):
+        return TokenCacheEntry(user_id, expiration_date, {"id": user_id})
+
+    def test_get_the_cached_entry(self):
+        tokenCache = MemoryTokenCache()
+        tokenCache.set("token", self.entry())
+        self.assertEqual(tokenCache.get("token"), self.entry())
+        self.assertNotIn("token", tokenCache.entries._data)
+
+    def test_entries_do_not_outlive_the_session_expiration(self):
+        tokenCache = MemoryTokenCache(ttl=timedelta(minutes=5))
+        tokenCache.set("expired", self.entry(expiration_date=datetime.now() - timedelta(seconds=1)))
+
+        self.assertIsNone(tokenCache.get("expired"))
+        self.assertLessEqual(tokenCache.get_ttl(datetime.now() + timedelta(seconds=10)), 10)
+
+    def test_delete_user_invalidates_all_its_tokens(self):
+        tokenCache = MemoryTokenCache()
+        tokenCache.set("token_1", self.entry(1))
+        tokenCache.set("token_2", self.entry(1))
+        tokenCache.set("token_3", self.entry(2))
+        tokenCache.delete_user(1)
+
+        self.assertIsNone(tokenCache.get("token_1"))
+        self.assertIsNone(tokenCache.get("token_2"))
+        self.assertIsNotNone(tokenCache.get("token_3"))
+
+        tokenCache.set("token_1", self.entry(1))
+        self.assertIsNotNone(tokenCache.get("token_1"))
+
+    def test_the_invalidations_are_bounded(self):
+        tokenCache = MemoryTokenCache(maxsize=2)
+        tokenCache.set("token_1", self.entry(1))
+        tokenCache.delete_users([1, 2])
+        tokenCache.delete_user(3)
+
+        self.assertLessEqual(len(tokenCache.generations), 2)
+        self.assertIsNone(tokenCache.get("token_1"))
+
+    def test_expired_invalidations_are_forgotten_first(self):
+        tokenCache = MemoryTokenCache(maxsize=2, ttl=timedelta(seconds=60))
+        with mock.patch("easy_framework.auth._tokenCache.time.monotonic", return_value=100):
+            tokenCache.delete_users([1, 2])
+        tokenCache.set("token_3", self.entry(3))
+        with mock.patch("easy_framework.auth._tokenCache.time.monotonic", return_value=200):
+            tokenCache.delete_user(4)
+
+        self.assertEqual(list(tokenCache.generations), ["4"])
+        self.assertIsNotNone(tokenCache.get("token_3"))
+
+
+class TestDatabaseMethodTokenCache(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.config.EASY_FRAMEWORK_AUTH_TOKEN_CACHE = MemoryTokenCache
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_AUTH_TOKEN_CACHE", None)
+
+    def test_token_cache_is_disabled_by_default(self):
+        cache.config.EASY_FRAMEWORK_AUTH_TOKEN_CACHE = None
+        self.get_flask_app_sql()
+        self.assertIsNone(cache.config.EASY_FRAMEWORK_AUTH_TOKEN_CACHE_STORE)
+
+    def capture_statements(self) -> list:
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = self.get_sqldb().dbConfig.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", before_cursor_execute)
+        return statements
+
+    def load_user(self, flask_app, token, authMethod=DatabaseMethodSql):
+        with flask_app.test_request_context("/", headers={"Authorization": f"Bearer {token}"}):
+            authMethod().loadUser()
+            return g.user
+
+    def test_second_request_with_the_same_token_does_not_hit_the_database(self):
+        flask_app = self.get_flask_app_sql()
+        with flask_app.test_request_context():
+            user = UserModel(login="test", password="test").save()
+            token = DatabaseMethodSql().generateSession(user)
+
+        self.assertEqual(self.load_user(flask_app, token).id, user.id)
+        statements = self.capture_statements()
+        cached_user = self.load_user(flask_app, token)
+
+        self.assertEqual(statements, [])
+        self.assertEqual((cached_user.id, cached_user.login), (user.id, "test"))
+
+    def test_token_cache_disabled(self):
+        flask_app = self.get_flask_app_sql()
+        cache.config.EASY_FRAMEWORK_AUTH_TOKEN_CACHE_STORE = None
+        with flask_app.test_request_context():
+            user = UserModel(login="test", password="test").save()
+            token = DatabaseMethodSql().generateSession(user)
+
+        self.load_user(flask_app, token)
+        statements = self.capture_statements()
+        self.assertEqual(self.load_user(flask_app, token).id, user.id)
+        self.assertEqual(len(statements), 1)
+
+    def test_user_update_invalidates_its_cached_sessions(self):
+        flask_app = self.get_flask_app_sql()
+        with flask_app.test_request_context():
+            user = UserModel(login="test", password="test").save()
+            token = DatabaseMethodSql().generateSession(user)
+        self.load_user(flask_app, token)
+
+        with flask_app.app_context():
+            user = UserModel.get_one(UserModel.id == user.id)
+            user.login = "new_login"
+            user.update()
+
+        self.assertEqual(self.load_user(flask_app, token).login, "new_login")
+
+    def test_user_bulk_update_and_soft_delete_invalidate_the_cached_sessions(self):
+        flask_app = self.get_flask_app_sql()
+        with flask_app.test_request_context():
+            user = UserModel(login="test", password="test").save()
+            user_2 = UserModel(login="test_2", password="test").save()
+            token = DatabaseMethodSql().generateSession(user)
+            token_2 = DatabaseMethodSql().generateSession(user_2)
+        self.load_user(flask_app, token)
+        self.load_user(flask_app, token_2)
+
+        with flask_app.app_context():
+            UserModel.bulk_update([{"id": user.id, "login": "new_login"}])
+        self.assertEqual(self.load_user(flask_app, token).login, "new_login")
+
+        with flask_app.app_context():
+            UserModel.soft_delete_by(login="test_2")
+        self.assertIsInstance(self.load_user(flask_app, token_2), AnonymousUser)
+
+    def test_logout_closes_the_session_and_drops_it_from_the_cache(self):
+        flask_app = self.get_flask_app_sql()
+        with flask_app.test_request_context():
+            user = UserModel(login="test", password="test").save()
+            token = DatabaseMethodSql().generateSession(user)
+        self.load_user(flask_app, token)
+
+        headers = {"Authorization": f"Bearer {token}"}
+        res = flask_app.test_client().delete(AuthView.routes[0], headers=headers)
+        self.assertEqual(res.status_code, 204)
+        self.assertIsInstance(self.load_user(flask_app, token), AnonymousUser)
+
+        res = flask_app.test_client().delete(AuthView.routes[0], headers=headers)
+        self.assertEqual(res.status_code, 401)
+
+    def test_cached_session_mongo(self):
+        flask_app = self.get_flask_app_mongo()
+        with flask_app.test_request_context():
+            user = UserModelMongo(login="test", password="test").save()
+            token = DatabaseMethodMongo().generateSession(user)
+
+        self.load_user(flask_app, token, DatabaseMethodMongo)
+        with mock.patch.object(DatabaseMethodMongo, "lookupSession") as lookupSession:
+            cached_user = self.load_user(flask_app, token, DatabaseMethodMongo)
+
+        lookupSession.assert_not_called()
+        self.assertEqual((cached_user.id, cached_user.login), (user.id, "test"))
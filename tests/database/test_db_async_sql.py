@@ -0,0 +1,97 @@
+import asyncio
+import importlib.util
+import unittest
+
+from sqlalchemy.pool import NullPool
+
+from tests import TestCase
+from tests.classes import ModelTestSql
+from easy_framework.database.sql import AsyncSqldb
+from easy_framework._context import cache
+
+
+@unittest.skipUnless(importlib.util.find_spec("aiosqlite"), "aiosqlite is not installed")
+class TestAsyncSqldb(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.config.EASY_FRAMEWORK_DB_SQL_ASYNC_ACTIVATE = True
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_DB_SQL_ASYNC_ACTIVATE", False)
+        self.flaskApp = self.get_flask_app_sql()
+        self.sqldb: AsyncSqldb = cache.config.EASY_FRAMEWORK_DB_ASYNC_SQLDB
+
+    def test_async_engine_uses_the_asyncio_driver_without_pool(self):
+        self.assertIs(AsyncSqldb.get_current(), self.sqldb)
+        self.assertTrue(self.sqldb.dbConfig.string_url.startswith("sqlite+aiosqlite://"))
+        self.assertTrue(issubclass(type(self.sqldb.dbConfig.engine.pool), NullPool))
+
+    def test_asave_and_aget_one(self):
+        async def scenario():
+            entity = await ModelTestSql(name="async", desc="saved").asave()
+            by_id = await ModelTestSql.aget_one(id=entity.id)
+            by_filter = await ModelTestSql.aget_one(ModelTestSql.desc == "saved", name="async")
+            missing = await ModelTestSql.aget_one(name="missing")
+            return entity, by_id, by_filter, missing
+
+        entity, by_id, by_filter, missing = asyncio.run(scenario())
+
+        self.assertIsNotNone(entity.id)
+        self.assertIsNotNone(entity._created_at)
+        self.assertEqual(by_id.id, entity.id)
+        self.assertEqual(by_filter.id, entity.id)
+        self.assertIsNone(missing)
+        self.assertEqual(ModelTestSql.get_one(id=entity.id).name, "async")
+
+    def test_overlapping_queries_use_their_own_sessions(self):
+        for i in range(3):
+            ModelTestSql(name=f"entity_{i}").save()
+
+        async def scenario():
+            return await asyncio.gather(
+                ModelTestSql.aget_many(),
+                ModelTestSql.aget_one(name="entity_1"),
+                ModelTestSql.aget_many(ModelTestSql.name != "entity_0"),
+            )
+
+        everything, one, filtered = asyncio.run(scenario())
+
+        self.assertEqual(len(everything), 3)
+        self.assertEqual(one.name, "entity_1")
+        self.assertEqual({entity.name for entity in filtered}, {"entity_1", "entity_2"})
+
+    def test_nested_scopes_of_a_task_share_the_session(self):
+        async def scenario():
+            async with self.sqldb.getScopedSession() as outer:
+                async with self.sqldb.getScopedSession() as inner:
+                    same = inner is outer
+                other = await asyncio.create_task(self.get_task_session())
+            return same, other is outer
+
+        self.assertEqual(asyncio.run(scenario()), (True, False))
+
+    async def get_task_session(self):
+        async with self.sqldb.getScopedSession() as dbSession:
+            return dbSession
+
+    def test_aupdate_and_adelete(self):
+        entity = ModelTestSql(name="before").save()
+
+        async def scenario():
+            loaded = await ModelTestSql.aget_one(id=entity.id)
+            loaded.name = "after"
+            await loaded.aupdate()
+            updated = await ModelTestSql.aget_one(id=entity.id)
+
+            await updated.adelete()
+            soft_deleted = await ModelTestSql.aget_one(id=entity.id)
+            return updated, soft_deleted
+
+        updated, soft_deleted = asyncio.run(scenario())
+
+        self.assertEqual(updated.name, "after")
+        self.assertIsNone(soft_deleted)
+        self.assertIsNone(ModelTestSql.get_one(id=entity.id))
+
+        hard = ModelTestSql(name="hard").save()
+        asyncio.run(hard.adelete("hard"))
+        with self.get_sqldb().getScopedSession() as dbSession:
+            self.assertIsNone(dbSession.get(ModelTestSql, hard.id))
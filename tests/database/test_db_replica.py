@@ -0,0 +1,223 @@
+import os
+import shutil
+import tempfile
+import threading
+import typing as t
+from datetime import timedelta
+from unittest import mock
+
+from flask import g
+from marshmallow import fields as ma_fields
+from sqlalchemy import orm
+import sqlalchemy as sa
+
+from tests import TestCase
+from easy_framework.database.sql import Base, ReplicaSet, Sqldb
+from easy_framework.model import BaseModelSql
+from easy_framework.serializer import BaseSerializerSql
+from easy_framework.view import GenericApiView, register_view
+from easy_framework._context import cache
+
+
+class ReplicaTestModel(BaseModelSql):
+    __tablename__ = "test_db_replica"
+    name: orm.Mapped[t.Optional[str]] = orm.mapped_column(default=None)
+
+
+class TestDbReplica(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # forget the writes (outside requests) of the previous tests
+        patcher = mock.patch("easy_framework.database.sql._replica._local", threading.local())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        cache.config.EASY_FRAMEWORK_DB_TEST_SQL_REPLICA_URIS = [
+            f"sqlite:///{os.path.join(directory, f'replica_{i}.db')}" for i in range(2)
+        ]
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_DB_TEST_SQL_REPLICA_URIS", [])
+        self.app = cache.app
+        self.sqldb = cache.config.EASY_FRAMEWORK_DB_SQLDB = Sqldb(self.app)
+        self.sqldb.register_request_session(self.app)
+        self.sqldb.dbConfig.engine
+        self.replicas: ReplicaSet = self.sqldb.dbConfig.replicas
+        self.addCleanup(self.replicas.dispose)
+        for i, node in enumerate(self.replicas.nodes):
+            Base.metadata.create_all(node.engine)
+            self.insert(node.engine, f"replica_{i}")
+        self.insert(self.sqldb.dbConfig.engine, "primary")
+
+    def insert(self, engine, name: str) -> None:
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text(f"INSERT INTO {ReplicaTestModel.__tablename__} (name, _deleted) VALUES (:name, 0)"),
+                {"name": name},
+            )
+
+    def get_names(self):
+        with self.sqldb.readOnly():
+            return [entity.name for entity in ReplicaTestModel.get_many()]
+
+    def get_replica_checkouts(self) -> int:
+        return sum(node.statistics.checkouts for node in self.replicas.nodes)
+
+    def test_reads_go_to_the_replicas_round_robin(self):
+        self.assertEqual(self.get_names(), ["replica_0"])
+        self.assertEqual(self.get_names(), ["replica_1"])
+        self.assertEqual(self.get_names(), ["replica_0"])
+        with self.sqldb.readOnly():
+            self.assertEqual(ReplicaTestModel.get_one(id=1).name, "replica_1")
+
+    def test_model_reads_outside_read_only_go_to_the_primary(self):
+        checkouts = self.get_replica_checkouts()
+        self.assertEqual([entity.name for entity in ReplicaTestModel.get_many()], ["primary"])
+        self.assertEqual(ReplicaTestModel.get_one(id=1).name, "primary")
+        self.assertEqual(ReplicaTestModel.count(), 1)
+        self.assertEqual(self.get_replica_checkouts(), checkouts)
+
+    def test_queries_outside_read_only_go_to_the_primary(self):
+        with self.sqldb.getScopedSession() as dbSession:
+            self.assertEqual(dbSession.query(ReplicaTestModel).one().name, "primary")
+
+    def test_use_primary_inside_read_only(self):
+        with self.sqldb.readOnly(), self.sqldb.usePrimary():
+            self.assertEqual(self.get_names(), ["primary"])
+        with self.sqldb.usePrimary(), self.sqldb.readOnly():
+            self.assertEqual(self.get_names(), ["primary"])
+
+    def test_read_your_writes(self):
+        with self.app.test_request_context():
+            ReplicaTestModel(name="written").save()
+            self.assertEqual(self.get_names(), ["primary", "written"])
+
+            g._easy_framework_sql_last_write -= 10
+            self.assertEqual(self.get_names(), ["replica_0"])
+
+        self.assertEqual(self.get_names(), ["replica_1"])
+
+    def test_reads_after_a_write_in_the_same_transaction(self):
+        with self.sqldb.readOnly(), self.sqldb.getScopedSession() as dbSession:
+            self.assertEqual(dbSession.query(ReplicaTestModel).one().name, "replica_0")
+            dbSession.add(ReplicaTestModel(name="pending"))
+            dbSession.flush()
+            self.assertEqual(dbSession.query(ReplicaTestModel).count(), 2)
+            dbSession.rollback()
+
+    def test_least_connections(self):
+        self.replicas.selection = "least_connections"
+        first, second = self.replicas.nodes
+
+        with first.engine.connect():
+            self.assertEqual(first.active, 1)
+            self.assertIs(self.replicas.choose(), second.engine)
+        self.assertEqual(first.active, 0)
+
+    def test_failing_replicas_are_ejected(self):
+        first, second = self.replicas.nodes
+        first.engine.dispose()
+        first.engine.url = sa.engine.make_url("sqlite:////nonexistent/replica.db")
+        broken = sa.create_engine("sqlite:////nonexistent/replica.db")
+        first.engine = broken
+        self.replicas.register_events(first)
+
+        health = self.replicas.check_health()
+
+        self.assertEqual(list(health.values()), [False, True])
+        self.assertFalse(first.healthy)
+        self.assertEqual(first.failures, 1)
+        self.assertEqual({self.replicas.choose() for _ in range(4)}, {second.engine})
+
+        second.ejected_until = first.ejected_until
+        self.assertIsNone(self.replicas.choose())
+        self.assertEqual(self.get_names(), ["primary"])
+
+        first.ejected_until = 0
+        self.assertIs(self.replicas.choose(), broken)
+
+    def test_pool_statistics_of_the_replicas(self):
+        self.get_names()
+
+        replicas = self.sqldb.pool_statistics()["replicas"]
+
+        self.assertEqual(len(replicas), 2)
+        self.assertTrue(all(replica["healthy"] for replica in replicas))
+        self.assertGreaterEqual(replicas[0]["checkouts"], 1)
+
+    def test_get_requests_read_from_the_replicas(self):
+        class View(GenericApiView):
+            routes = ["/testReplicaView"]
+            methods = ["GET", "POST"]
+            model = ReplicaTestModel
+            serializer = None
+            field_lookup = None
+            auto_treat_request = False
+            validate_request = False
+
+            def __init__(self):
+                pass
+
+            def get(self):
+                return {"names": [entity.name for entity in self.model.get_many()]}
+
+            def post(self):
+                with self.model.get_databaseClass().getScopedSession() as dbSession:
+                    return {"names": [entity.name for entity in dbSession.query(self.model)]}
+
+        register_view(View, self.app)
+        client = self.app.test_client()
+
+        self.assertEqual(client.get("/testReplicaView").get_json(), {"names": ["replica_0"]})
+        self.assertEqual(client.post("/testReplicaView").get_json(), {"names": ["primary"]})
+
+    def test_patch_requests_read_the_entity_from_the_primary(self):
+        class Serializer(BaseSerializerSql):
+            class Meta:
+                name = ma_fields.String()
+
+        class View(GenericApiView):
+            routes = ["/testReplicaPatchView"]
+            methods = ["GET", "PATCH"]
+            model = ReplicaTestModel
+            serializer = Serializer
+            field_lookup = "id"
+
+        register_view(View, self.app)
+        client = self.app.test_client()
+        checkouts = self.get_replica_checkouts()
+
+        res = client.patch("/testReplicaPatchView?id=1", json={"name": "patched"})
+
+        self.assertEqual(res.status_code, 204)
+        self.assertEqual(self.get_replica_checkouts(), checkouts)
+        with self.sqldb.getScopedSession() as dbSession:
+            self.assertEqual(dbSession.query(ReplicaTestModel).one().name, "patched")
+        self.assertEqual(client.get("/testReplicaPatchView?id=1").get_json()["name"], "replica_0")
+
+    def test_cached_responses_are_read_from_the_primary(self):
+        class Serializer(BaseSerializerSql):
+            class Meta:
+                name = ma_fields.String()
+
+        class View(GenericApiView):
+            routes = ["/testReplicaCachedView"]
+            methods = ["GET"]
+            model = ReplicaTestModel
+            serializer = Serializer
+            field_lookup = "id"
+            response_cache = True
+
+        register_view(View, self.app)
+        client = self.app.test_client()
+        checkouts = self.get_replica_checkouts()
+
+        for _ in range(2):
+            self.assertEqual(client.get("/testReplicaCachedView").get_json(), [{"id": 1, "name": "primary"}])
+        self.assertEqual(self.get_replica_checkouts(), checkouts)
+
+    def test_replica_selection_is_validated(self):
+        with self.assertRaises(ValueError):
+            ReplicaSet([], selection="random")
+
+    def test_read_your_writes_config(self):
+        self.assertEqual(self.sqldb.dbConfig.read_your_writes, timedelta(seconds=5))
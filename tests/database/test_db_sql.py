@@ -1,13 +1,32 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
 from sqlalchemy import orm
+from sqlalchemy.pool import NullPool, QueuePool
 import sqlalchemy as sa
 
 from tests import TestCase
 from easy_framework.model import BaseModelSql
+from easy_framework.database.sql import DbConfig
+from easy_framework._context import cache
 class ModelTestSql(BaseModelSql):
     __tablename__ = "test_db_sql"
     id: orm.Mapped[int] = orm.mapped_column(primary_key=True)
     info: orm.Mapped[str]
 
+class VisibleModelTestSql(BaseModelSql):
+    __tablename__ = "test_db_sql_visible"
+    id: orm.Mapped[int] = orm.mapped_column(primary_key=True)
+    visible: orm.Mapped[bool] = orm.mapped_column(default=True)
+
+    @classmethod
+    def get_one_base_query(cls, dbSession, model):
+        return super().get_one_base_query(dbSession, model).filter(model.visible == True)
+
+
 class TestDbSql(TestCase):
     def test_assert_session_is_active_before_closing_it(self):
         dbSession: orm.Session = self.get_sqldb().getNewSession()
@@ -85,4 +104,203 @@ class TestDbSql(TestCase):
             sqldb.closeSession()
     
 
-        
\ No newline at end of file
+        
+
+class TestDbSqlUnitOfWork(TestCase):
+    def setUp(self) -> None:
+        cache.config.EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK = True
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+
+    def tearDown(self) -> None:
+        cache.config.EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK = False
+        super().tearDown()
+
+    def count(self) -> int:
+        with self.get_sqldb().dbConfig.session() as dbSession:
+            return dbSession.query(ModelTestSql).count()
+
+    def test_model_calls_share_the_app_context_session(self):
+        sqldb = self.get_sqldb()
+        with self.flaskApp.app_context():
+            with sqldb.getScopedSession() as first, sqldb.getScopedSession() as second:
+                self.assertIs(first, second)
+                self.assertIs(first, sqldb.getRequestSession())
+
+    def test_commit_once_when_app_context_ends(self):
+        with self.flaskApp.app_context():
+            ModelTestSql(id=1, info="first").save()
+            ModelTestSql(id=2, info="second").save()
+            self.assertEqual(self.count(), 0)
+
+        self.assertEqual(self.count(), 2)
+
+    def test_rollback_when_app_context_ends_with_exception(self):
+        with self.assertRaises(RuntimeError):
+            with self.flaskApp.app_context():
+                ModelTestSql(id=1, info="first").save()
+                raise RuntimeError()
+
+        self.assertEqual(self.count(), 0)
+
+    def test_rollback_when_request_returns_an_error(self):
+        @self.flaskApp.route("/unitOfWorkError")
+        def error():
+            ModelTestSql(id=1, info="first").save()
+            return "error", 422
+
+        res = self.flaskApp.test_client().get("/unitOfWorkError")
+
+        self.assertEqual(res.status_code, 422)
+        self.assertEqual(self.count(), 0)
+
+    def test_get_one_by_id_uses_the_session_identity_map(self):
+        with self.flaskApp.app_context():
+            entity = ModelTestSql(id=1, info="first").save()
+            self.assertIs(ModelTestSql.get_one(id=1), entity)
+
+            statements = []
+            engine = self.get_sqldb().dbConfig.engine
+            listener = lambda conn, cursor, statement, *args: statements.append(statement)
+            sa.event.listen(engine, "before_cursor_execute", listener)
+            self.addCleanup(sa.event.remove, engine, "before_cursor_execute", listener)
+            # ids from the query string are converted to the primary key type
+            self.assertIs(ModelTestSql.get_one(id="1"), entity)
+            self.assertEqual(statements, [])
+
+    def test_get_one_by_id_applies_an_overridden_base_query(self):
+        with self.flaskApp.app_context():
+            VisibleModelTestSql(id=1, visible=False).save()
+            VisibleModelTestSql(id=2).save()
+
+            self.assertIsNone(VisibleModelTestSql.get_one(id=1))
+            self.assertEqual(VisibleModelTestSql.get_one(id="2").id, 2)
+
+
+class TestDbConfigProcessEngine(TestCase):
+    def test_engine_is_created_on_first_use(self):
+        dbConfig = self.get_sqldb().dbConfig
+        dbConfig.dispose()
+        self.assertIs(dbConfig.engine, dbConfig.engine)
+        self.assertIs(dbConfig.session.kw["bind"], dbConfig.engine)
+
+    def test_engine_is_created_again_in_a_new_process(self):
+        dbConfig = self.get_sqldb().dbConfig
+        engine = dbConfig.engine
+
+        with mock.patch("os.getpid", return_value=os.getpid() + 1):
+            self.assertIsNot(dbConfig.engine, engine)
+            self.assertIs(dbConfig.session.kw["bind"], dbConfig.engine)
+            with dbConfig.session() as dbSession:
+                self.assertEqual(dbSession.execute(sa.text("SELECT 1")).scalar(), 1)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "os.fork is not available")
+    def test_forked_process_uses_its_own_engine(self):
+        dbConfig = self.get_sqldb().dbConfig
+        parent_engine = dbConfig.engine
+        read, write = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                with dbConfig.session() as dbSession:
+                    dbSession.execute(sa.text("SELECT 1"))
+                ok = dbConfig.engine is not parent_engine
+                os.write(write, b"1" if ok else b"0")
+            finally:
+                os._exit(0)
+
+        os.close(write)
+        result = os.read(read, 1)
+        os.close(read)
+        os.waitpid(pid, 0)
+        self.assertEqual(result, b"1")
+        self.assertIs(dbConfig.engine, parent_engine)
+
+
+class TestDbConfigPool(TestCase):
+    def get_db_config(self, **engine_options) -> DbConfig:
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        dbConfig = DbConfig("sqlite", "/", os.path.join(directory, "pool.db"), "", "", "", False, engine_options=engine_options)
+        self.addCleanup(dbConfig.dispose)
+        return dbConfig
+
+    def test_engine_options_from_the_environment_config(self):
+        config = cache.config
+        with mock.patch.multiple(
+            config,
+            EASY_FRAMEWORK_DB_TEST_SQL_POOL_SIZE=3,
+            EASY_FRAMEWORK_DB_TEST_SQL_POOL_MAX_OVERFLOW=0,
+            EASY_FRAMEWORK_DB_TEST_SQL_POOL_PRE_PING=False,
+            EASY_FRAMEWORK_DB_TEST_SQL_ENGINE_OPTIONS={"pool_reset_on_return": None},
+        ):
+            options = self.get_sqldb().getEngineOptions("TEST")
+
+        self.assertEqual(options["pool_size"], 3)
+        self.assertEqual(options["max_overflow"], 0)
+        self.assertEqual(options["pool_recycle"], 300)
+        self.assertFalse(options["pool_pre_ping"])
+        self.assertIsNone(options["pool_reset_on_return"])
+        self.assertNotIn("pool_timeout", options)
+
+    def test_queue_pool_parameters(self):
+        engine = self.get_db_config(pool_size=3, max_overflow=1, pool_timeout=2, pool_use_lifo=True).engine
+
+        self.assertIsInstance(engine.pool, QueuePool)
+        self.assertEqual(engine.pool.size(), 3)
+        self.assertEqual(engine.pool.timeout(), 2)
+
+    def test_pool_class_by_name(self):
+        dbConfig = self.get_db_config(poolclass="NullPool")
+
+        self.assertIsInstance(dbConfig.engine.pool, NullPool)
+        with dbConfig.engine.connect() as connection:
+            connection.execute(sa.text("SELECT 1"))
+        statistics = dbConfig.pool_statistics()
+        self.assertEqual(statistics["pool_class"], "NullPool")
+        self.assertEqual(statistics["checkouts"], 1)
+        self.assertNotIn("checked_out", statistics)
+
+    def test_pool_statistics(self):
+        dbConfig = self.get_db_config(pool_size=1, max_overflow=0, pool_timeout=0.01)
+
+        with dbConfig.engine.connect():
+            statistics = dbConfig.pool_statistics()
+            self.assertEqual(statistics["checked_out"], 1)
+            self.assertEqual(statistics["size"], 1)
+            with self.assertRaises(sa.exc.TimeoutError):
+                dbConfig.engine.connect()
+
+        statistics = dbConfig.pool_statistics()
+        self.assertEqual(statistics["checkouts"], 1)
+        self.assertEqual(statistics["timeouts"], 1)
+        self.assertEqual(statistics["checked_out"], 0)
+        self.assertGreaterEqual(statistics["max_wait_seconds"], 0.01)
+
+        dbConfig.dispose()
+        with dbConfig.engine.connect():
+            pass
+        self.assertEqual(dbConfig.pool_statistics()["checkouts"], 2)
+
+    def test_ping_idle_connections_and_retry_the_checkout(self):
+        dbConfig = self.get_db_config(pool_size=1, pool_ping_idle_after=0)
+        with dbConfig.engine.connect() as connection:
+            dbapi_connection = connection.connection.dbapi_connection
+
+        dbapi_connection.close()
+        with dbConfig.engine.connect() as connection:
+            self.assertEqual(connection.execute(sa.text("SELECT 1")).scalar(), 1)
+            self.assertIsNot(connection.connection.dbapi_connection, dbapi_connection)
+
+        self.assertEqual(dbConfig.pool_statistics()["disconnects"], 1)
+
+    def test_idle_ping_skips_recently_used_connections(self):
+        dbConfig = self.get_db_config(pool_size=1, pool_ping_idle_after=60)
+        with dbConfig.engine.connect() as connection:
+            dbapi_connection = connection.connection.dbapi_connection
+
+        dbapi_connection.close()
+        with dbConfig.engine.connect() as connection:
+            self.assertIs(connection.connection.dbapi_connection, dbapi_connection)
+        self.assertEqual(dbConfig.pool_statistics()["disconnects"], 0)
@@ -1,3 +1,4 @@
+import bson
 import flask
 
 from tests import TestCase
@@ -116,4 +117,137 @@ class TestBasemodelMongo(TestCase):
 
 
 
-    
\ No newline at end of file
+    
+    def test_soft_delete_by_filter_and_return_the_number_of_deleted_documents(self):
+        ModelTestMongo(username='delete_me', password='123').save()
+        ModelTestMongo(username='keep_me', password='123').save()
+
+        self.assertEqual(ModelTestMongo.soft_delete_by(username='delete_me'), 1)
+        self.assertIsNone(ModelTestMongo.get_one(username='delete_me'))
+        self.assertIsNotNone(ModelTestMongo.get_one(username='keep_me'))
+
+
+class TestBaseModelMongoBulk(TestCase):
+    def test_bulk_save_inserts_all_documents_and_sets_their_ids(self):
+        documents = ModelTestMongo.bulk_save(
+            [ModelTestMongo(username=f'user_{i}', password='123') for i in range(5)], chunk_size=2
+        )
+
+        self.assertTrue(all(document.id is not None for document in documents))
+        self.assertEqual(len(ModelTestMongo.get_many()), 5)
+
+    def test_bulk_save_runs_the_before_save_hook(self):
+        users = UserModelMongo.bulk_save([UserModelMongo(login='bulk_1', password='123')])
+
+        self.assertNotEqual(users[0].password, b'123')
+        self.assertEqual(bytes(UserModelMongo.get_one(login='bulk_1').password), users[0].password)
+
+    def test_bulk_update_skips_soft_deleted_documents(self):
+        documents = ModelTestMongo.bulk_save([ModelTestMongo(username=f'user_{i}', password='123') for i in range(3)])
+        ModelTestMongo.soft_delete_by(id=documents[2].id)
+
+        modified = ModelTestMongo.bulk_update(
+            [{'id': str(document.id), 'desc': 'updated'} for document in documents], chunk_size=2
+        )
+
+        self.assertEqual(modified, 2)
+        self.assertEqual([document.desc for document in ModelTestMongo.get_many()], ['updated', 'updated'])
+
+    def test_bulk_soft_delete_in_chunks(self):
+        documents = ModelTestMongo.bulk_save([ModelTestMongo(username=f'user_{i}', password='123') for i in range(3)])
+
+        self.assertEqual(ModelTestMongo.bulk_soft_delete([document.id for document in documents[:2]], chunk_size=1), 2)
+        self.assertEqual(len(ModelTestMongo.get_many()), 1)
+
+
+class TestBaseModelMongoProjection(TestCase):
+    def test_only_loads_the_requested_fields(self):
+        ModelTestMongo(username='user', password='123', desc='a very long description').save()
+
+        many = ModelTestMongo.get_many(only=['username'])
+        one = ModelTestMongo.get_one(username='user', only=['username', 'unknown'])
+        page = ModelTestMongo.get_page(limit=1, order_by='-username', only=['password'])
+
+        self.assertEqual(many[0].username, 'user')
+        self.assertIsNone(many[0].desc)
+        self.assertIsNotNone(many[0].id)
+        # a name which is not a field (EG. a fields.Function of the serializer) can need any field
+        self.assertEqual((one.username, one.desc), ('user', 'a very long description'))
+        self.assertEqual((page[0].username, page[0].password), ('user', '123'))
+        self.assertIsNone(page[0].desc)
+
+
+class TestBaseModelMongoFilters(TestCase):
+    def test_get_many_with_q_objects_and_order_by(self):
+        for name in ['b', 'a', 'c']:
+            ModelTestMongo(username=name, password='123', name=name).save()
+
+        documents = ModelTestMongo.get_many(
+            ModelTestMongo.filter_expression('name', 'gte', 'b'),
+            ModelTestMongo.filter_expression('name', 'prefix', 'c'),
+            order_by='-name',
+        )
+        self.assertEqual([i.name for i in documents], ['c'])
+        documents = ModelTestMongo.get_many(ModelTestMongo.filter_expression('name', 'in', ['a', 'b']), order_by='-name')
+        self.assertEqual([i.name for i in documents], ['b', 'a'])
+        self.assertEqual(ModelTestMongo.get_one(ModelTestMongo.filter_expression('name', 'lt', 'b')).name, 'a')
+
+    def test_filter_parser_and_indexed_fields(self):
+        self.assertFalse(ModelTestMongo.get_filter_parser('_deleted')('false'))
+        self.assertIsNone(ModelTestMongo.get_filter_parser('unknown'))
+        self.assertTrue(ModelTestMongo.is_indexed_field('id'))
+        self.assertFalse(ModelTestMongo.is_indexed_field('name'))
+
+
+class TestBaseModelMongoCount(TestCase):
+    def test_count_and_estimate_count(self):
+        for name in ['a', 'b', 'c']:
+            ModelTestMongo(username=name, password='123', name=name).save()
+        ModelTestMongo.soft_delete_by(name='a')
+
+        self.assertEqual(ModelTestMongo.count(), 2)
+        self.assertEqual(ModelTestMongo.count(ModelTestMongo.filter_expression('name', 'gt', 'b')), 1)
+        self.assertEqual(ModelTestMongo.estimate_count(), 3)
+
+
+class TestBaseModelMongoVersion(TestCase):
+    def test_updated_at_and_get_version(self):
+        from easy_framework.model._writeGeneration import get_write_generation
+
+        document = ModelTestMongo(username='a', password='123', name='a').save()
+        first_updated_at = document._updated_at
+        generation = get_write_generation(ModelTestMongo)
+
+        document.name = 'b'
+        document.update()
+        self.assertGreater(get_write_generation(ModelTestMongo), generation)
+        self.assertGreaterEqual(document._updated_at, first_updated_at)
+
+        ModelTestMongo(username='c', password='123', name='c').save()
+        count, last_updated_at = ModelTestMongo.get_version(name='b')
+        self.assertEqual(count, 1)
+        self.assertIsNotNone(last_updated_at)
+        self.assertEqual(ModelTestMongo.get_version()[0], 2)
+
+
+class TestBaseModelMongoPagination(TestCase):
+    def walk(self, order_by):
+        names = []
+        after = None
+        while True:
+            page = ModelTestMongo.get_page(after=after, limit=1, order_by=order_by)
+            if not page:
+                return names
+            names.append(page[0].username)
+            after = ModelTestMongo.parse_cursor_values(order_by, [page[0].name, str(page[0].id)])
+
+    def test_paginate_by_nullable_sort_key(self):
+        for username, name in [('a', 'x'), ('b', None), ('c', 'y'), ('d', None)]:
+            ModelTestMongo(username=username, password='123', name=name).save()
+
+        self.assertEqual(self.walk('name'), ['b', 'd', 'a', 'c'])
+        self.assertEqual(self.walk('-name'), ['c', 'a', 'd', 'b'])
+
+    def test_cursor_values_are_parsed_strictly(self):
+        with self.assertRaises(ValueError):
+            ModelTestMongo.parse_cursor_values('_deleted', ['false', str(bson.ObjectId())])
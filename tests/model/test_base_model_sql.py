@@ -1,8 +1,11 @@
 import flask
+import sqlalchemy as sa
+from sqlalchemy import event
 
 from tests import TestCase
 from tests.classes import ModelTestSql
 from easy_framework.user.userModel import UserModel
+from easy_framework.model._writeGeneration import get_write_generation
 
 
 class TestBasemodelSql(TestCase):
@@ -134,4 +137,240 @@ class TestBasemodelSql(TestCase):
             self.assertEqual(ModelTestSql.get_one(id=new_entity.id)._owner_id, flask.g.user.id)
 
 
-    
\ No newline at end of file
+    
+class TestBaseModelSqlTargetedUpdate(TestCase):
+    def capture_statements(self) -> list:
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(self.get_sqldb().dbConfig.engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, self.get_sqldb().dbConfig.engine, "before_cursor_execute", before_cursor_execute)
+        return statements
+
+    def test_update_detached_entity_with_a_single_update_of_changed_columns(self):
+        with self.get_flask_app_sql().app_context():
+            ModelTestSql(id=1, info="old", name="name").save()
+            entity = ModelTestSql.get_one(ModelTestSql.id == 1)
+
+            statements = self.capture_statements()
+            entity.info = "new"
+            entity.update()
+
+            self.assertEqual(len(statements), 1)
+            self.assertTrue(statements[0].startswith("UPDATE"))
+            self.assertIn("info=", statements[0])
+            self.assertNotIn("name=", statements[0])
+            self.assertEqual(entity.get_changed_columns(), {})
+            self.assertEqual(ModelTestSql.get_one(ModelTestSql.id == 1).info, "new")
+
+    def test_update_entity_without_changes_does_not_hit_the_database(self):
+        with self.get_flask_app_sql().app_context():
+            ModelTestSql(id=1, info="old").save()
+            entity = ModelTestSql.get_one(ModelTestSql.id == 1)
+
+            statements = self.capture_statements()
+            entity.update()
+
+            self.assertEqual(statements, [])
+
+    def test_soft_delete_by_filter_with_a_single_statement(self):
+        with self.get_flask_app_sql().app_context():
+            ModelTestSql(id=1, name="delete_me").save()
+            ModelTestSql(id=2, name="keep_me").save()
+
+            statements = self.capture_statements()
+            deleted = ModelTestSql.soft_delete_by(name="delete_me")
+
+            self.assertEqual(deleted, 1)
+            self.assertEqual(len(statements), 1)
+            self.assertIsNone(ModelTestSql.get_one(ModelTestSql.id == 1))
+            self.assertIsNotNone(ModelTestSql.get_one(ModelTestSql.id == 2))
+            self.assertEqual(ModelTestSql.soft_delete_by(name="delete_me"), 0)
+
+
+class TestBaseModelSqlBulk(TestCase):
+    def test_bulk_save_inserts_all_entities_and_reads_back_generated_columns(self):
+        with self.get_flask_app_sql().app_context():
+            entities = ModelTestSql.bulk_save([ModelTestSql(name=f"name_{i}") for i in range(5)], chunk_size=2)
+
+            self.assertEqual(len({entity.id for entity in entities}), 5)
+            self.assertTrue(all(entity._created_at is not None for entity in entities))
+            self.assertTrue(all(entity._deleted is False for entity in entities))
+            self.assertEqual(
+                [entity.name for entity in entities],
+                [ModelTestSql.get_one(ModelTestSql.id == entity.id).name for entity in entities],
+            )
+
+    def test_bulk_save_with_user_context_register_user_id_as_owner(self):
+        with self.get_flask_app_sql().test_request_context():
+            flask.g.user = UserModel(login='123', password='123').save()
+            entities = ModelTestSql.bulk_save([ModelTestSql(name="a"), ModelTestSql(name="b")])
+
+            self.assertEqual([entity._owner_id for entity in entities], [flask.g.user.id] * 2)
+
+    def test_bulk_save_runs_the_before_save_hook(self):
+        with self.get_flask_app_sql().app_context():
+            users = UserModel.bulk_save([UserModel(login="bulk_1", password="123"), UserModel(login="bulk_2", password="123")])
+
+            for user in users:
+                self.assertNotEqual(user.password, "123")
+                self.assertTrue(user.passwordManager.compare("123", user.password))
+
+    def test_bulk_update_skips_soft_deleted_entities(self):
+        with self.get_flask_app_sql().app_context():
+            ModelTestSql.bulk_save([ModelTestSql(id=i, name=f"name_{i}") for i in range(1, 4)])
+            ModelTestSql.soft_delete_by(id=3)
+
+            generation = get_write_generation(ModelTestSql)
+            updated = ModelTestSql.bulk_update([{"id": i, "name": f"new_{i}"} for i in range(1, 4)], chunk_size=2)
+
+            self.assertEqual(updated, 2)
+            self.assertGreater(get_write_generation(ModelTestSql), generation)
+
+            self.assertEqual([entity.name for entity in ModelTestSql.get_many()], ["new_1", "new_2"])
+            with self.get_sqldb().getScopedSession() as dbSession:
+                self.assertEqual(dbSession.get(ModelTestSql, 3).name, "name_3")
+
+    def test_bulk_soft_delete_in_chunks(self):
+        with self.get_flask_app_sql().app_context():
+            ModelTestSql.bulk_save([ModelTestSql(id=i) for i in range(1, 6)])
+
+            self.assertEqual(ModelTestSql.bulk_soft_delete([1, 2, 3, 4], chunk_size=3), 4)
+            self.assertEqual([entity.id for entity in ModelTestSql.get_many()], [5])
+            self.assertEqual(ModelTestSql.bulk_soft_delete([1, 5]), 1)
+
+
+class TestBaseModelSqlProjection(TestCase):
+    def capture_selects(self) -> list:
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(self.get_sqldb().dbConfig.engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, self.get_sqldb().dbConfig.engine, "before_cursor_execute", before_cursor_execute)
+        return statements
+
+    def test_only_selects_the_requested_columns(self):
+        with self.get_flask_app_sql().app_context():
+            ModelTestSql(id=1, name="name", desc="a very long description").save()
+
+            statements = self.capture_selects()
+            entities = ModelTestSql.get_many(only=["name"])
+            entity = ModelTestSql.get_one(name="name", only=["name"])
+            by_id = ModelTestSql.get_one(id=1, only=["name"])
+
+            self.assertEqual(len(statements), 3)
+            for statement in statements:
+                self.assertIn('"TestModelSql".name', statement)
+                self.assertNotIn('"TestModelSql"."desc"', statement)
+            for loaded in (entities[0], entity, by_id):
+                self.assertEqual(loaded.name, "name")
+                self.assertNotIn("desc", loaded.__dict__)
+
+    def test_only_with_a_non_column_attribute_loads_every_column(self):
+        with self.get_flask_app_sql().app_context():
+            ModelTestSql(id=1, name="name", desc="desc").save()
+
+            self.assertIsNotNone(ModelTestSql.get_load_only(["name", "desc"]))
+            self.assertIsNone(ModelTestSql.get_load_only(["name", "unknown"]))
+            self.assertIsNone(ModelTestSql.get_load_only(["name", "get_changed_columns"]))
+            self.assertIsNone(ModelTestSql.get_load_only(None))
+            self.assertEqual(ModelTestSql.get_many(only=["get_changed_columns"])[0].desc, "desc")
+
+    def test_get_page_and_iter_many_load_the_sort_key(self):
+        with self.get_flask_app_sql().app_context():
+            ModelTestSql.bulk_save([ModelTestSql(id=i, name=f"name_{i}", age=i, desc="desc") for i in range(1, 4)])
+
+            page = ModelTestSql.get_page(limit=2, order_by="-age", only=["name"])
+            iterated = list(ModelTestSql.iter_many(only=["name"]))
+
+            self.assertEqual([(entity.age, entity.name) for entity in page], [(3, "name_3"), (2, "name_2")])
+            self.assertEqual([entity.name for entity in iterated], ["name_1", "name_2", "name_3"])
+            self.assertNotIn("desc", page[0].__dict__)
+            self.assertNotIn("desc", iterated[0].__dict__)
+
+
+class TestBaseModelSqlFilters(TestCase):
+    def test_get_many_with_filter_expressions_and_order_by(self):
+        with self.get_flask_app_sql().app_context():
+            for i, name in enumerate(["b", "a", "c"]):
+                ModelTestSql(name=name, age=i).save()
+
+            entities = ModelTestSql.get_many(
+                ModelTestSql.filter_expression("age", "gte", 1),
+                ModelTestSql.filter_expression("name", "in", ["a", "b", "c"]),
+                order_by="-name",
+            )
+            self.assertEqual([i.name for i in entities], ["c", "a"])
+            self.assertEqual([i.name for i in ModelTestSql.get_many(ModelTestSql.age < 2, name="a")], ["a"])
+            self.assertRaises(ValueError, ModelTestSql.filter_expression, "name", "like", "a")
+
+    def test_filter_parser_and_indexed_fields(self):
+        self.assertEqual(ModelTestSql.get_filter_parser("age")("10"), 10)
+        self.assertIsNone(ModelTestSql.get_filter_parser("unknown"))
+        self.assertTrue(ModelTestSql.is_indexed_field("id"))
+        self.assertFalse(ModelTestSql.is_indexed_field("name"))
+        self.assertTrue(UserModel.is_indexed_field("login"))
+
+
+class TestBaseModelSqlCount(TestCase):
+    def test_count_uses_a_direct_select_count(self):
+        with self.get_flask_app_sql().app_context():
+            for i in range(3):
+                ModelTestSql(name=f"name_{i}", age=i).save()
+            ModelTestSql.soft_delete_by(name="name_0")
+
+            statements = []
+
+            def before_cursor_execute(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            engine = self.get_sqldb().dbConfig.engine
+            event.listen(engine, "before_cursor_execute", before_cursor_execute)
+            self.addCleanup(event.remove, engine, "before_cursor_execute", before_cursor_execute)
+
+            self.assertEqual(ModelTestSql.count(), 2)
+            self.assertEqual(ModelTestSql.count(ModelTestSql.age > 1, name="name_2"), 1)
+            self.assertTrue(statements[0].startswith('SELECT count("TestModelSql".id)'))
+            self.assertNotIn("anon", statements[0])
+
+    def test_estimate_count_reads_the_sqlite_statistics(self):
+        with self.get_flask_app_sql().app_context():
+            for i in range(3):
+                ModelTestSql(name=f"name_{i}").save()
+
+            with self.get_sqldb().getScopedSession() as dbSession:
+                dbSession.execute(sa.text("DROP TABLE IF EXISTS sqlite_stat1"))
+                dbSession.commit()
+            self.assertIsNone(ModelTestSql.estimate_count())
+
+            with self.get_sqldb().getScopedSession() as dbSession:
+                dbSession.execute(sa.text("ANALYZE"))
+                dbSession.commit()
+            self.assertEqual(ModelTestSql.estimate_count(), 3)
+
+
+class TestBaseModelSqlVersion(TestCase):
+    def test_get_version_and_write_generation(self):
+        with self.get_flask_app_sql().app_context():
+            generation = get_write_generation(ModelTestSql)
+            entity = ModelTestSql(name="a", age=1).save()
+            self.assertGreater(get_write_generation(ModelTestSql), generation)
+            last = ModelTestSql(name="b", age=2).save()
+
+            count, last_updated_at = ModelTestSql.get_version()
+            self.assertEqual(count, 2)
+            self.assertEqual(
+                last_updated_at,
+                max(ModelTestSql.get_one(id=i.id)._updated_at for i in (entity, last)),
+            )
+            self.assertEqual(ModelTestSql.get_version(ModelTestSql.age > 1)[0], 1)
+
+            generation = get_write_generation(ModelTestSql)
+            ModelTestSql.bulk_soft_delete([entity.id])
+            self.assertGreater(get_write_generation(ModelTestSql), generation)
+            self.assertEqual(ModelTestSql.get_version()[0], 1)
@@ -2,6 +2,7 @@ from flask import request
 from marshmallow import ValidationError
 
 from tests import TestCase
+from easy_framework.serializer import SerializerRegistry
 from tests.classes import SerializerTestSql
 
 class TestBaseSerializerSql(TestCase):
@@ -62,4 +63,33 @@ class TestBaseSerializerSql(TestCase):
             with self.assertRaises(ValidationError) as e_info:
                 serializer.load(request.json)
             self.assertTrue('username' in str(e_info.exception))
-            self.assertTrue('Missing data for required field' in str(e_info.exception))
\ No newline at end of file
+            self.assertTrue('Missing data for required field' in str(e_info.exception))
+
+class TestSerializerRegistry(TestCase):
+    def test_compiled_serializer_class_is_reused_between_instances(self):
+        with self.get_flask_app_sql().test_request_context('/', method='POST'):
+            self.assertIs(type(SerializerTestSql()), type(SerializerTestSql()))
+
+    def test_compiled_serializer_class_is_different_per_http_method(self):
+        app = self.get_flask_app_sql()
+        with app.test_request_context('/', method='POST'):
+            post_class = type(SerializerTestSql())
+        with app.test_request_context('/', method='PATCH'):
+            patch_class = type(SerializerTestSql())
+
+        self.assertIsNot(post_class, patch_class)
+        self.assertTrue(post_class._declared_fields['username'].required)
+        self.assertFalse(patch_class._declared_fields['username'].required)
+
+    def test_invalidate_compiled_serializer_and_get_a_new_class(self):
+        with self.get_flask_app_sql().test_request_context('/', method='GET'):
+            old_class = type(SerializerTestSql())
+            SerializerTestSql.invalidate_compiled()
+            self.assertIsNot(old_class, type(SerializerTestSql()))
+
+    def test_eager_compile_serializer_for_http_methods(self):
+        SerializerRegistry.invalidate(SerializerTestSql)
+        SerializerTestSql.compile(['GET', 'POST'])
+
+        self.assertIs(SerializerRegistry.get(SerializerTestSql, 'GET'), SerializerTestSql.selectMeta(SerializerTestSql, 'GET'))
+        self.assertIn((SerializerTestSql, 'Post'), SerializerRegistry._compiled)
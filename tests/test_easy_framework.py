@@ -0,0 +1,55 @@
+from unittest import mock
+
+from flask import Flask
+
+from easy_framework import EasyFramework
+from easy_framework._startupReport import StartupReport
+from easy_framework._context import cache
+from tests import TestCase
+
+
+class TestEasyFrameworkPrepare(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.app = Flask(__name__)
+        self.easy_framework = EasyFramework(self.app)
+
+    def test_run_all_configs_reports_each_phase(self):
+        report = self.easy_framework.run_all_configs()
+
+        self.assertIsInstance(report, StartupReport)
+        self.assertIs(self.app.startup_report, report)
+        self.assertEqual(
+            [phase.name for phase in report.phases][:3],
+            ["database_register", "database_create_all", "exceptions_register"],
+        )
+        self.assertIsNotNone(report.get_phase("auto_import_view"))
+        self.assertAlmostEqual(report.seconds, sum(phase["seconds"] for phase in report.to_dict()["phases"]))
+
+    def test_prepare_runs_once(self):
+        report = self.easy_framework.prepare()
+
+        self.assertTrue(self.easy_framework.prepared)
+        self.assertIsNotNone(report.get_phase("preload_views"))
+        self.assertIs(self.easy_framework.prepare(), report)
+
+    def test_prepare_closes_the_connections(self):
+        self.easy_framework.prepare()
+        dbConfig = cache.config.EASY_FRAMEWORK_DB_SQLDB.dbConfig
+
+        self.assertEqual(dbConfig.engine.pool.checkedin(), 0)
+
+    def test_app_run_does_not_preload_the_lazy_views(self):
+        with mock.patch.object(self.easy_framework, "run_server") as run_server:
+            self.app.run()
+
+        run_server.assert_called_once()
+        self.assertIsNone(self.easy_framework.startup_report.get_phase("preload_views"))
+
+    def test_app_run_preloads_the_lazy_views_when_configured(self):
+        cache.config.EASY_FRAMEWORK_VIEW_PRELOAD_LAZY = True
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_VIEW_PRELOAD_LAZY", False)
+        with mock.patch.object(self.easy_framework, "run_server"):
+            self.app.run()
+
+        self.assertIsNotNone(self.easy_framework.startup_report.get_phase("preload_views"))
@@ -0,0 +1,82 @@
+import tracemalloc
+
+from flask import Flask
+from loguru import logger
+
+from easy_framework import EasyFramework
+from easy_framework._startupReport import StartupReport
+from easy_framework._context import cache
+from easy_framework.view._viewHandler import ViewHandler
+from tests.view import genericView
+from tests import TestCase
+
+
+class TestStartupReport(TestCase):
+    def test_measure_phases_and_modules(self):
+        report = StartupReport()
+        with report.activate():
+            self.assertIs(StartupReport.get_current(), report)
+            with report.phase("phase"):
+                with StartupReport.measure_module("module"):
+                    data = [object() for _ in range(1000)]
+
+        self.assertIsNone(StartupReport.get_current())
+        self.assertEqual([phase.name for phase in report.phases], ["phase"])
+        self.assertEqual([module.name for module in report.modules], ["module"])
+        self.assertGreaterEqual(report.get_module("module").allocated_blocks, 1000)
+        self.assertGreaterEqual(report.get_phase("phase").seconds, report.get_module("module").seconds)
+        self.assertIsNone(report.get_phase("phase").allocated_bytes)
+        self.assertEqual(len(data), 1000)
+
+    def test_measure_module_without_report(self):
+        with StartupReport.measure_module("module"):
+            pass
+
+    def test_trace_memory(self):
+        report = StartupReport(trace_memory=True)
+        with report.activate():
+            with report.phase("phase"):
+                with report.module("module"):
+                    data = bytearray(1_000_000)
+                    del data
+                kept = bytearray(100_000)
+
+        self.assertFalse(tracemalloc.is_tracing())
+        module, phase = report.get_module("module"), report.get_phase("phase")
+        self.assertGreaterEqual(module.peak_bytes, 1_000_000)
+        self.assertLess(module.allocated_bytes, 100_000)
+        self.assertGreaterEqual(phase.peak_bytes, 1_000_000)
+        self.assertGreaterEqual(phase.allocated_bytes, 100_000)
+        self.assertEqual(len(kept), 100_000)
+
+    def test_run_all_configs_logs_the_report(self):
+        records = []
+        handler = logger.add(records.append, filter=lambda record: "startup_report" in record["extra"])
+        self.addCleanup(logger.remove, handler)
+
+        report = EasyFramework(Flask(__name__)).run_all_configs()
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].record["extra"]["startup_report"], report.to_dict())
+        self.assertEqual(
+            [phase["name"] for phase in report.to_dict()["phases"]][-1],
+            "auto_import_view",
+        )
+
+    def test_view_modules_are_measured(self):
+        report = StartupReport()
+        with report.activate():
+            module_list = ViewHandler().get_modules(genericView.__file__.rsplit("/", 1)[0])
+            ViewHandler().filter_views_from_module_list(module_list, "View")
+
+        self.assertEqual([module.name for module in report.modules], module_list)
+        self.assertIn(genericView.__name__, [module.name for module in report.slowest_modules(len(module_list))])
+
+    def test_trace_memory_config(self):
+        cache.config.EASY_FRAMEWORK_STARTUP_TRACE_MEMORY = True
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_STARTUP_TRACE_MEMORY", False)
+
+        report = EasyFramework(Flask(__name__)).run_all_configs()
+
+        self.assertTrue(report.trace_memory)
+        self.assertIsNotNone(report.get_phase("database_register").peak_bytes)
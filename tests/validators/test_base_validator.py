@@ -1,3 +1,5 @@
+from unittest import mock
+
 from flask import Flask
 
 from easy_framework.exception import AuthMissingError
@@ -307,4 +309,115 @@ class TestBaseValidator(TestCase):
 
         with self.assertRaises(AuthMissingError) as exc_info3:
             test3() 
-            self.assertIsInstance(exc_info3, AuthMissingError)
\ No newline at end of file
+            self.assertIsInstance(exc_info3, AuthMissingError)
+
+    def test_validators_do_not_inspect_the_stack(self):
+        @self.falseValidatorTest(methods_to_validate=['GET'])
+        class _ObjectiveClass(self.ObjectiveClass):
+            pass
+
+        with mock.patch('inspect.stack', side_effect=AssertionError('inspect.stack called')):
+            with self.assertRaises(AuthMissingError):
+                with self.get_flask_app_sql().test_request_context(method='GET'):
+                    _ObjectiveClass()._validate()
+
+    def test_explicit_entry_points_with_a_class_as_decorator_argument(self):
+        class TypeValidator(BaseValidator):
+            def validate(self, expected_type: type) -> None:
+                if not isinstance(self.view, expected_type):
+                    raise AuthMissingError()
+
+        @TypeValidator.decorator(self.ObjectiveClass)
+        class _ObjectiveClass(self.ObjectiveClass):
+            pass
+
+        with self.get_flask_app_sql().test_request_context(method='GET'):
+            _ObjectiveClass()._validate()
+            TypeValidator.run(_ObjectiveClass(), self.ObjectiveClass)
+            with self.assertRaises(AuthMissingError):
+                TypeValidator.run(_ObjectiveClass(), int)
+
+
+    def test_direct_call_on_a_bound_method_validates(self):
+        class _Test:
+            def method(self):
+                return True
+
+        self.trueValidatorTest(_Test().method)
+        with self.assertRaises(AuthMissingError):
+            self.falseValidatorTest(_Test().method)
+        with self.assertRaises(AuthMissingError):
+            self.paramValidatorTest(_Test().method, True)
+
+    def test_direct_call_on_an_object_that_can_not_be_validated_raises(self):
+        class _Test:
+            pass
+
+        for obj in (_Test(), object()):
+            with self.assertRaises(TypeError):
+                self.falseValidatorTest(obj)
+
+class TestValidatorPlan(TestCase):
+    def countingValidator(self, calls: list):
+        class CountingValidator(BaseValidator):
+            def validate(self, name='default') -> None:
+                calls.append(name)
+        return CountingValidator
+
+    def test_compile_an_immutable_plan_per_method(self):
+        calls = []
+        CountingValidator = self.countingValidator(calls)
+
+        @CountingValidator.decorator('get', methods_to_validate=['GET'])
+        @CountingValidator.decorator('all')
+        class _ObjectiveClass(TestBaseValidator.ObjectiveClass):
+            methods = ['GET', 'POST']
+
+        _ObjectiveClass.prepare_view()
+        plans = _ObjectiveClass.__dict__['_validator_plans']
+        self.assertIsInstance(plans['GET'], tuple)
+        self.assertEqual(len(plans['GET']), 2)
+        self.assertEqual(len(plans['POST']), 1)
+
+        with self.get_flask_app_sql().test_request_context(method='GET'):
+            _ObjectiveClass()._validate()
+            _ObjectiveClass()._validate()
+        self.assertEqual(calls, ['all', 'get', 'all', 'get'])
+        self.assertIs(_ObjectiveClass.__dict__['_validator_plans'], plans)
+
+    def test_decorating_a_child_view_does_not_change_the_parent(self):
+        calls = []
+        CountingValidator = self.countingValidator(calls)
+
+        @CountingValidator.decorator('parent')
+        class _Parent(TestBaseValidator.ObjectiveClass):
+            pass
+
+        @CountingValidator.decorator('child')
+        class _Child(_Parent):
+            pass
+
+        with self.get_flask_app_sql().test_request_context(method='GET'):
+            _Parent()._validate()
+            self.assertEqual(calls, ['parent'])
+            _Child()._validate()
+        self.assertEqual(calls, ['parent', 'parent', 'child'])
+
+    def test_run_repeated_validators_once_per_request(self):
+        calls = []
+        CountingValidator = self.countingValidator(calls)
+
+        class NestedValidator(BaseValidator):
+            def validate(self) -> None:
+                CountingValidator.run(self.view)
+
+        @NestedValidator.decorator()
+        @CountingValidator.decorator()
+        class _ObjectiveClass(TestBaseValidator.ObjectiveClass):
+            validator_list = [CountingValidator]
+
+        with self.get_flask_app_sql().test_request_context(method='GET'):
+            _ObjectiveClass()._validate()
+            self.assertEqual(calls, ['default'])
+            _ObjectiveClass()._validate()
+        self.assertEqual(calls, ['default', 'default'])
@@ -0,0 +1,141 @@
+import asyncio
+import importlib.util
+import unittest
+
+from easy_framework.view import AsyncGenericApiView, GenericApiView, register_view
+from easy_framework._context import cache
+from tests.classes import ModelTestSql, SerializerTestSql
+from tests import TestCase
+
+
+@unittest.skipUnless(
+    importlib.util.find_spec("aiosqlite") and importlib.util.find_spec("asgiref"),
+    "aiosqlite and asgiref are not installed",
+)
+class TestAsyncGenericApiView(TestCase):
+    class AsyncView(AsyncGenericApiView):
+        routes = ["/AsyncGenericViewTest"]
+        methods = ["POST", "GET", "PATCH", "DELETE"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "name"
+        filter_fields = {"desc": ["eq", "prefix"]}
+        sort_fields = ["desc"]
+
+    class SyncView(GenericApiView):
+        routes = ["/SyncGenericViewTest"]
+        methods = ["GET"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "name"
+
+    class FanOutView(AsyncGenericApiView):
+        routes = ["/AsyncFanOutViewTest"]
+        methods = ["GET"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = None
+        auto_treat_request = False
+
+        async def get(self):
+            entities, first = await asyncio.gather(
+                self.model.aget_many(),
+                self.model.aget_one(name="first"),
+            )
+            return {"count": len(entities), "first": first.desc}
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.config.EASY_FRAMEWORK_DB_SQL_ASYNC_ACTIVATE = True
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_DB_SQL_ASYNC_ACTIVATE", False)
+        self.flaskApp = self.get_flask_app_sql()
+        for view in (self.AsyncView, self.SyncView, self.FanOutView):
+            register_view(view, self.flaskApp)
+        self.client = self.flaskApp.test_client()
+
+    def post(self, name: str, desc: str):
+        return self.client.post(
+            "/AsyncGenericViewTest",
+            json={"username": name, "password": "123", "name": name, "desc": desc},
+        )
+
+    def test_async_crud(self):
+        res = self.post("first", "created")
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.get_json()["desc"], "created")
+
+        res = self.client.get("/AsyncGenericViewTest", query_string={"name": "first"})
+        self.assertEqual(res.get_json()["desc"], "created")
+
+        res = self.client.patch(
+            "/AsyncGenericViewTest", query_string={"name": "first"}, json={"desc": "updated"}
+        )
+        self.assertEqual(res.status_code, 204)
+        self.assertEqual(ModelTestSql.get_one(name="first").desc, "updated")
+
+        res = self.client.delete("/AsyncGenericViewTest", query_string={"name": "first"})
+        self.assertEqual(res.status_code, 204)
+        self.assertEqual(self.client.get("/AsyncGenericViewTest").get_json(), [])
+
+        res = self.client.delete("/AsyncGenericViewTest", query_string={"name": "first"})
+        self.assertEqual(res.status_code, 404)
+
+    def test_async_get_with_fields(self):
+        self.post("first", "a")
+
+        res = self.client.get("/AsyncGenericViewTest", query_string={"fields": "name"})
+        self.assertEqual(res.get_json(), [{"name": "first"}])
+
+        res = self.client.get("/AsyncGenericViewTest", query_string={"name": "first", "fields": "desc"})
+        self.assertEqual(res.get_json(), {"desc": "a"})
+
+    def test_async_list_with_filters_and_sort(self):
+        for name, desc in (("first", "b"), ("second", "a"), ("third", "c")):
+            self.post(name, desc)
+
+        res = self.client.get("/AsyncGenericViewTest", query_string={"sort": "-desc", "fields": "name"})
+        self.assertEqual(res.get_json(), [{"name": "third"}, {"name": "first"}, {"name": "second"}])
+
+        res = self.client.get("/AsyncGenericViewTest", query_string={"desc": "a", "fields": "name"})
+        self.assertEqual(res.get_json(), [{"name": "second"}])
+
+    def test_async_conditional_get_and_response_cache(self):
+        self.post("first", "a")
+        self.AsyncView.conditional_get = True
+        self.AsyncView.response_cache = True
+        self.addCleanup(setattr, self.AsyncView, "conditional_get", None)
+        self.addCleanup(setattr, self.AsyncView, "response_cache", None)
+        self.AsyncView.get_response_cache().clear()
+
+        single = self.client.get("/AsyncGenericViewTest", query_string={"name": "first"})
+        many = self.client.get("/AsyncGenericViewTest")
+        for res, query_string in ((single, {"name": "first"}), (many, {})):
+            res = self.client.get(
+                "/AsyncGenericViewTest", query_string=query_string, headers={"If-None-Match": res.headers["ETag"]}
+            )
+            self.assertEqual(res.status_code, 304)
+
+        self.post("second", "b")
+        self.assertEqual(len(self.client.get("/AsyncGenericViewTest").get_json()), 2)
+
+    def test_invalid_body_returns_422(self):
+        res = self.client.post("/AsyncGenericViewTest", json={"name": "no_username"})
+        self.assertEqual(res.status_code, 422)
+
+    def test_sync_and_async_views_in_the_same_app(self):
+        self.post("first", "a")
+        self.post("second", "b")
+
+        async_list = self.client.get("/AsyncGenericViewTest").get_json()
+        sync_list = self.client.get("/SyncGenericViewTest").get_json()
+
+        self.assertEqual(async_list, sync_list)
+        self.assertEqual(len(async_list), 2)
+
+    def test_async_handler_overlapping_queries(self):
+        self.post("first", "a")
+        self.post("second", "b")
+
+        res = self.client.get("/AsyncFanOutViewTest")
+
+        self.assertEqual(res.get_json(), {"count": 2, "first": "a"})
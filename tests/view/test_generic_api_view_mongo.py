@@ -1,3 +1,5 @@
+import json
+
 from flask import Flask
 
 from tests import TestCase
@@ -118,3 +120,223 @@ class TestGenericApiViewMongo(TestCase):
                 set(i.items()) for i in self.view().getOwnedEntities()
             ]
             self.assertFalse(any([i in set_user2_models for i in set_owned_entities]))
+
+
+class TestGenericApiViewMongoPagination(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewMongoPaginationTest"]
+        methods = ["GET"]
+        model = ModelTestMongo
+        serializer = SerializerTestMongo
+        field_lookup = "id"
+        paginate = True
+        page_size = 2
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_mongo()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewMongoPaginationTest"),
+        )
+        for i in range(5):
+            ModelTestMongo(username=f"user_{i}", password="123").save()
+
+    def test_follow_cursor_until_last_page(self):
+        client = self.flaskApp.test_client()
+        usernames = []
+        query = {}
+        while True:
+            res = client.get(self.GenericView.routes[0], query_string=query).get_json()
+            usernames += [i["username"] for i in res["results"]]
+            if res["next_cursor"] is None:
+                break
+            query = {"cursor": res["next_cursor"]}
+
+        self.assertEqual(usernames, [f"user_{i}" for i in range(5)])
+
+
+class TestGenericApiViewMongoStreaming(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewMongoStreamingTest"]
+        methods = ["GET"]
+        model = ModelTestMongo
+        serializer = SerializerTestMongo
+        field_lookup = "id"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_mongo()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewMongoStreamingTest"),
+        )
+        for i in range(5):
+            ModelTestMongo(username=f"user_{i}", password="123").save()
+
+    def test_stream_ndjson_when_requested_by_accept_header(self):
+        res = self.flaskApp.test_client().get(
+            self.GenericView.routes[0], headers={"Accept": "application/x-ndjson"}
+        )
+
+        self.assertEqual(res.mimetype, "application/x-ndjson")
+        lines = [json.loads(i) for i in res.get_data(as_text=True).splitlines()]
+        self.assertEqual([i["username"] for i in lines], [f"user_{i}" for i in range(5)])
+
+
+class TestGenericApiViewMongoBulk(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewMongoBulkTest"]
+        methods = ["POST", "PATCH", "DELETE"]
+        model = ModelTestMongo
+        serializer = SerializerTestMongo
+        field_lookup = "username"
+        bulk = True
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_mongo()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewMongoBulkTest"),
+        )
+        self.client = self.flaskApp.test_client()
+
+    def test_bulk_create_update_and_delete_documents(self):
+        res = self.client.post(
+            self.GenericView.routes[0],
+            json=[{"username": f"user_{i}", "password": "123"} for i in range(3)],
+        )
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(len(ModelTestMongo.get_many()), 3)
+
+        res = self.client.patch(
+            self.GenericView.routes[0], json=[{"username": "user_0", "desc": "updated"}]
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(ModelTestMongo.get_one(username="user_0").desc, "updated")
+
+        res = self.client.delete(self.GenericView.routes[0], json=["user_1", "user_2"])
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([i.username for i in ModelTestMongo.get_many()], ["user_0"])
+
+
+class TestGenericApiViewMongoFields(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewMongoFieldsTest"]
+        methods = ["GET"]
+        model = ModelTestMongo
+        serializer = SerializerTestMongo
+        field_lookup = "username"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_mongo()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewMongoFieldsTest"),
+        )
+        ModelTestMongo(username="user", password="123", desc="a very long description").save()
+        self.client = self.flaskApp.test_client()
+
+    def test_list_and_single_document_with_fields(self):
+        res = self.client.get(self.GenericView.routes[0], query_string={"fields": "username"})
+        self.assertEqual(res.get_json(), [{"username": "user"}])
+
+        res = self.client.get(
+            self.GenericView.routes[0], query_string={"username": "user", "fields": "id,desc"}
+        )
+        self.assertEqual(set(res.get_json()), {"id", "desc"})
+
+    def test_unknown_fields_return_400(self):
+        res = self.client.get(self.GenericView.routes[0], query_string={"fields": "nope"})
+        self.assertEqual(res.status_code, 400)
+
+
+class TestGenericApiViewMongoFilters(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewMongoFiltersTest"]
+        methods = ["GET"]
+        model = ModelTestMongo
+        serializer = SerializerTestMongo
+        field_lookup = "id"
+        filter_fields = {"name": ["eq", "in", "prefix", "range"]}
+        sort_fields = ["name"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_mongo()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewMongoFiltersTest"),
+        )
+        for name in ["ana", "bob", "anabel", "carl"]:
+            ModelTestMongo(username=name, password="123", name=name).save()
+        self.client = self.flaskApp.test_client()
+
+    def names(self, **query_string):
+        res = self.client.get(self.GenericView.routes[0], query_string=query_string)
+        self.assertEqual(res.status_code, 200, res.get_json())
+        return [document["name"] for document in res.get_json()]
+
+    def test_filters_and_sort(self):
+        self.assertEqual(self.names(name="bob"), ["bob"])
+        self.assertEqual(self.names(name__in="bob,carl"), ["bob", "carl"])
+        self.assertEqual(self.names(name__prefix="ana", sort="-name"), ["anabel", "ana"])
+        self.assertEqual(self.names(name__gt="ana", name__lte="bob", sort="name"), ["anabel", "bob"])
+
+    def test_paginated_count(self):
+        self.GenericView.paginate = True
+        self.addCleanup(setattr, self.GenericView, "paginate", None)
+        self.GenericView.get_count_cache().clear()
+        route = self.GenericView.routes[0]
+
+        res = self.client.get(route, query_string={"count": "estimate", "limit": 1})
+        self.assertEqual(res.get_json()["count"], 4)
+        res = self.client.get(route, query_string={"count": "estimate", "name__prefix": "ana"})
+        self.assertEqual(res.get_json()["count"], 2)
+
+    def test_not_allowed_filters_return_400(self):
+        for query_string in ({"username": "bob"}, {"sort": "desc"}):
+            res = self.client.get(self.GenericView.routes[0], query_string=query_string)
+            self.assertEqual(res.status_code, 400, query_string)
+
+
+class TestGenericApiViewMongoConditionalGet(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewMongoConditionalTest"]
+        methods = ["GET"]
+        model = ModelTestMongo
+        serializer = SerializerTestMongo
+        field_lookup = "username"
+        conditional_get = True
+        response_cache = True
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_mongo()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewMongoConditionalTest"),
+        )
+        self.document = ModelTestMongo(username="user", password="123", desc="a").save()
+        self.client = self.flaskApp.test_client()
+        self.GenericView.get_response_cache().clear()
+
+    def get(self, headers=None, **query_string):
+        return self.client.get(self.GenericView.routes[0], query_string=query_string, headers=headers)
+
+    def test_etag_304_and_invalidation(self):
+        single_etag = self.get(username="user").headers["ETag"]
+        list_etag = self.get().headers["ETag"]
+
+        self.assertEqual(self.get({"If-None-Match": single_etag}, username="user").status_code, 304)
+        self.assertEqual(self.get({"If-None-Match": list_etag}).status_code, 304)
+
+        self.document.desc = "b"
+        self.document.update()
+
+        res = self.get({"If-None-Match": single_etag}, username="user")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.get_json()["desc"], "b")
+        self.assertEqual(self.get({"If-None-Match": list_etag}).status_code, 200)
@@ -1,7 +1,17 @@
+import json
+from datetime import datetime, timedelta
+from unittest import mock
+
+import marshmallow as mar
+import sqlalchemy as sa
+from sqlalchemy import event
+
 from flask import Flask
 from easy_framework.view._genericApiView import GenericApiView
+from easy_framework.validator import Self_required
 from tests.classes import ModelTestSql, SerializerTestSql, UserTestSql
 from tests import TestCase, FlaskClient
+from easy_framework._context import cache
 
 
 class TestGenericApiView(TestCase):
@@ -189,3 +199,849 @@ class TestGenericApiViewWithPathFieldlookup(TestGenericApiView):
 
         res = client.get(self.GenericView.routes[0])
         self.assertFalse(res.get_json())
+
+
+class TestGenericApiViewPagination(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewPaginationTest"]
+        methods = ["GET"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "id"
+        paginate = True
+        page_size = 2
+        max_page_size = 3
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewPaginationTest"),
+        )
+        with self.flaskApp.app_context():
+            for i in range(5):
+                ModelTestSql(name=f"name_{i}", age=10 - (i % 2)).save()
+
+    def get(self, **query_string):
+        return self.flaskApp.test_client().get(
+            self.GenericView.routes[0], query_string=query_string
+        )
+
+    def test_get_first_page_with_default_page_size_and_next_cursor(self):
+        res = self.get().get_json()
+
+        self.assertEqual([i["name"] for i in res["results"]], ["name_0", "name_1"])
+        self.assertIsNotNone(res["next_cursor"])
+
+    def test_follow_cursor_until_last_page(self):
+        names = []
+        cursor = None
+        while True:
+            query = {"cursor": cursor} if cursor else {}
+            res = self.get(**query).get_json()
+            names += [i["name"] for i in res["results"]]
+            cursor = res["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(names, [f"name_{i}" for i in range(5)])
+
+    def test_limit_is_reduced_to_max_page_size(self):
+        res = self.get(limit=100).get_json()
+        self.assertEqual(len(res["results"]), 3)
+
+    def test_invalid_limit_and_cursor_return_400(self):
+        self.assertEqual(self.get(limit="abc").status_code, 400)
+        self.assertEqual(self.get(limit=0).status_code, 400)
+        self.assertEqual(self.get(cursor="not-a-cursor").status_code, 400)
+
+    def test_paginate_by_non_unique_sort_key(self):
+        self.GenericView.pagination_key = "-age"
+        try:
+            first = self.get(limit=3).get_json()
+            second = self.get(limit=3, cursor=first["next_cursor"]).get_json()
+        finally:
+            self.GenericView.pagination_key = "id"
+
+        names = [i["name"] for i in first["results"] + second["results"]]
+        self.assertEqual(names, ["name_4", "name_2", "name_0", "name_3", "name_1"])
+        self.assertIsNone(second["next_cursor"])
+
+    def walk(self, pagination_key):
+        self.GenericView.pagination_key = pagination_key
+        self.addCleanup(setattr, self.GenericView, "pagination_key", "id")
+        names = []
+        query = {"limit": 1}
+        while True:
+            res = self.get(**query).get_json()
+            names += [i["name"] for i in res["results"]]
+            if res["next_cursor"] is None:
+                return names
+            query["cursor"] = res["next_cursor"]
+
+    def test_paginate_by_nullable_sort_key(self):
+        with self.flaskApp.app_context():
+            ModelTestSql(name="null_a").save()
+            ModelTestSql(name="null_b").save()
+
+        self.assertEqual(
+            self.walk("age"),
+            ["name_1", "name_3", "name_0", "name_2", "name_4", "null_a", "null_b"],
+        )
+        self.assertEqual(
+            self.walk("-age"),
+            ["null_b", "null_a", "name_4", "name_2", "name_0", "name_3", "name_1"],
+        )
+
+    def test_cursor_values_are_parsed_strictly(self):
+        self.assertEqual(ModelTestSql.parse_cursor_values("age", ["10", 3]), (10, 3))
+        with self.assertRaises(ValueError):
+            ModelTestSql.parse_cursor_values("_deleted", ["false", 3])
+
+
+class TestGenericApiViewStreaming(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewStreamTest"]
+        methods = ["GET"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "id"
+        stream_batch_size = 2
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewStreamTest"),
+        )
+        with self.flaskApp.app_context():
+            for i in range(5):
+                ModelTestSql(name=f"name_{i}").save()
+
+    def test_stream_ndjson_when_requested_by_accept_header(self):
+        res = self.flaskApp.test_client().get(
+            self.GenericView.routes[0], headers={"Accept": "application/x-ndjson"}
+        )
+
+        self.assertEqual(res.mimetype, "application/x-ndjson")
+        lines = [json.loads(i) for i in res.get_data(as_text=True).splitlines()]
+        self.assertEqual([i["name"] for i in lines], [f"name_{i}" for i in range(5)])
+
+    def test_stream_json_array_when_view_stream_is_true(self):
+        self.GenericView.stream = True
+        try:
+            res = self.flaskApp.test_client().get(self.GenericView.routes[0])
+        finally:
+            self.GenericView.stream = False
+
+        self.assertEqual(res.mimetype, "application/json")
+        self.assertEqual(
+            [i["name"] for i in res.get_json()], [f"name_{i}" for i in range(5)]
+        )
+
+    def test_do_not_stream_when_accept_header_prefers_json(self):
+        res = self.flaskApp.test_client().get(
+            self.GenericView.routes[0], headers={"Accept": "*/*"}
+        )
+        self.assertEqual(len(res.get_json()), 5)
+
+
+class TestGenericApiViewBulk(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewBulkTest"]
+        methods = ["POST", "GET", "PATCH", "DELETE"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "name"
+        bulk = True
+        bulk_chunk_size = 2
+        bulk_max_size = 10
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewBulkTest"),
+        )
+        self.client = self.flaskApp.test_client()
+
+    def create(self, count: int):
+        return self.client.post(
+            self.GenericView.routes[0],
+            json=[
+                {"username": f"user_{i}", "password": "123", "name": f"name_{i}"}
+                for i in range(count)
+            ],
+        )
+
+    def test_bulk_create_entities(self):
+        res = self.create(5)
+
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual([i["status"] for i in res.get_json()["results"]], [201] * 5)
+        self.assertTrue(all(i["data"]["id"] for i in res.get_json()["results"]))
+        with self.flaskApp.app_context():
+            self.assertEqual(len(ModelTestSql.get_many()), 5)
+
+    def test_bulk_create_with_invalid_items_and_get_per_item_results(self):
+        res = self.client.post(
+            self.GenericView.routes[0],
+            json=[
+                {"username": "user_0", "password": "123"},
+                {"username": "user_1"},
+                "not an object",
+            ],
+        )
+
+        self.assertEqual(res.status_code, 207)
+        results = res.get_json()["results"]
+        self.assertEqual([i["status"] for i in results], [201, 422, 422])
+        self.assertIn("password", results[1]["errors"])
+        with self.flaskApp.app_context():
+            self.assertEqual(len(ModelTestSql.get_many()), 1)
+
+    def test_bulk_request_bigger_than_max_size_returns_413(self):
+        self.assertEqual(self.create(11).status_code, 413)
+
+    def test_bulk_update_entities(self):
+        self.create(3)
+        res = self.client.patch(
+            self.GenericView.routes[0],
+            json=[
+                {"name": "name_0", "desc": "updated_0"},
+                {"name": "name_2", "desc": "updated_2"},
+                {"name": "not_found", "desc": "updated"},
+                {"desc": "no lookup"},
+            ],
+        )
+
+        self.assertEqual(res.status_code, 207)
+        self.assertEqual(
+            [i["status"] for i in res.get_json()["results"]], [200, 200, 404, 422]
+        )
+        with self.flaskApp.app_context():
+            descs = {i.name: i.desc for i in ModelTestSql.get_many()}
+        self.assertEqual(descs, {"name_0": "updated_0", "name_1": None, "name_2": "updated_2"})
+
+    def test_bulk_update_reports_the_entities_deleted_before_the_update(self):
+        self.create(3)
+        get_bulk_entities = self.GenericView.get_bulk_entities
+
+        def deleted_meanwhile(view, lookups):
+            entities = get_bulk_entities(view, lookups)
+            ModelTestSql.soft_delete_by(name="name_1")
+            return entities
+
+        with mock.patch.object(self.GenericView, "get_bulk_entities", deleted_meanwhile):
+            res = self.client.patch(
+                self.GenericView.routes[0],
+                json=[{"name": "name_0", "desc": "updated"}, {"name": "name_1", "desc": "updated"}],
+            )
+
+        self.assertEqual([i["status"] for i in res.get_json()["results"]], [200, 404])
+
+    def test_bulk_delete_entities(self):
+        self.create(3)
+        res = self.client.delete(
+            self.GenericView.routes[0], json=["name_0", {"name": "name_1"}]
+        )
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([i["status"] for i in res.get_json()["results"]], [204, 204])
+        with self.flaskApp.app_context():
+            self.assertEqual([i.name for i in ModelTestSql.get_many()], ["name_2"])
+
+
+class TestGenericApiViewBulkUnitOfWork(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewBulkUnitOfWorkTest"]
+        methods = ["PATCH", "DELETE"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "name"
+        bulk = True
+        bulk_chunk_size = 2
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.config.EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK = True
+        self.addCleanup(setattr, cache.config, "EASY_FRAMEWORK_DB_SQL_UNIT_OF_WORK", False)
+        self.flaskApp = self.get_flask_app_sql()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewBulkUnitOfWorkTest"),
+        )
+        with self.flaskApp.app_context():
+            ModelTestSql.bulk_save([ModelTestSql(name=f"name_{i}") for i in range(3)])
+        self.client = self.flaskApp.test_client()
+
+        self.statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            self.statements.append(statement)
+
+        engine = self.get_sqldb().dbConfig.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", before_cursor_execute)
+
+    def updates(self):
+        return [i for i in self.statements if i.startswith("UPDATE")]
+
+    def test_bulk_patch_runs_only_the_bulk_update(self):
+        res = self.client.patch(
+            self.GenericView.routes[0],
+            json=[{"name": f"name_{i}", "desc": "updated"} for i in range(3)],
+        )
+
+        self.assertEqual([i["status"] for i in res.get_json()["results"]], [200] * 3)
+        # bulk_chunk_size rows per UPDATE, and no flush of the loaded entities (without the guards)
+        self.assertEqual(len(self.updates()), 2)
+        self.assertTrue(all("_deleted" in statement for statement in self.updates()))
+        with self.flaskApp.app_context():
+            self.assertEqual({i.desc for i in ModelTestSql.get_many()}, {"updated"})
+
+    def test_bulk_delete_uses_the_bulk_chunk_size(self):
+        res = self.client.delete(self.GenericView.routes[0], json=["name_0", "name_1", "name_2"])
+
+        self.assertEqual([i["status"] for i in res.get_json()["results"]], [204] * 3)
+        self.assertEqual(len(self.updates()), 2)
+
+
+class TestGenericApiViewBulkOwned(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewBulkOwnedTest"]
+        methods = ["GET", "PATCH", "DELETE"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "name"
+        bulk = True
+        validator_list = [Self_required]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0],
+            view_func=self.GenericView.as_view("GenericViewBulkOwnedTest"),
+        )
+        self.client = self.flaskApp.test_client()
+        self.user_a = UserTestSql(self.flaskApp, "user_a", "123")
+        self.user_b = UserTestSql(self.flaskApp, "user_b", "123")
+        with self.flaskApp.test_request_context(
+            headers={"Authorization": f"Bearer {self.user_a.token}"}
+        ):
+            ModelTestSql.bulk_save([ModelTestSql(name=f"name_{i}") for i in range(2)])
+        with self.flaskApp.test_request_context(
+            headers={"Authorization": f"Bearer {self.user_b.token}"}
+        ):
+            ModelTestSql(name="name_b").save()
+
+    def test_bulk_patch_other_user_entities_returns_404(self):
+        res = self.client.patch(
+            self.GenericView.routes[0],
+            json=[
+                {"name": "name_0", "desc": "hacked"},
+                {"name": "name_1", "desc": "hacked"},
+                {"name": "name_b", "desc": "updated"},
+            ],
+            headers={"Authorization": f"Bearer {self.user_b.token}"},
+        )
+
+        self.assertEqual(res.status_code, 207)
+        self.assertEqual([i["status"] for i in res.get_json()["results"]], [404, 404, 200])
+        with self.flaskApp.app_context():
+            descs = {i.name: i.desc for i in ModelTestSql.get_many()}
+        self.assertEqual(descs, {"name_0": None, "name_1": None, "name_b": "updated"})
+
+    def test_bulk_delete_other_user_entities_returns_404(self):
+        res = self.client.delete(
+            self.GenericView.routes[0],
+            json=["name_0", "name_b"],
+            headers={"Authorization": f"Bearer {self.user_b.token}"},
+        )
+
+        self.assertEqual(res.status_code, 207)
+        self.assertEqual([i["status"] for i in res.get_json()["results"]], [404, 204])
+        with self.flaskApp.app_context():
+            self.assertEqual(sorted(i.name for i in ModelTestSql.get_many()), ["name_0", "name_1"])
+
+    def test_bulk_update_only_updates_the_rows_matching_the_owner(self):
+        with self.flaskApp.app_context():
+            entities = ModelTestSql.get_many()
+            ModelTestSql.bulk_update(
+                [{"id": i.id, "desc": "updated"} for i in entities],
+                _owner_id=self.user_b.user.id,
+            )
+            descs = {i.name: i.desc for i in ModelTestSql.get_many()}
+        self.assertEqual(descs, {"name_0": None, "name_1": None, "name_b": "updated"})
+
+    def test_bulk_owned_only_can_be_disabled(self):
+        self.GenericView.bulk_owned_only = False
+        self.addCleanup(delattr, self.GenericView, "bulk_owned_only")
+        res = self.client.patch(
+            self.GenericView.routes[0],
+            json=[{"name": "name_0", "desc": "updated"}],
+            headers={"Authorization": f"Bearer {self.user_b.token}"},
+        )
+
+        self.assertEqual([i["status"] for i in res.get_json()["results"]], [200])
+
+
+class SummarySerializerTestSql(SerializerTestSql):
+    class Meta(SerializerTestSql.Meta):
+        summary = mar.fields.Function(lambda entity: f"{entity.name}: {entity.desc}")
+
+
+class TestGenericApiViewFields(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewFieldsTest"]
+        methods = ["GET"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "name"
+
+    class PaginatedView(GenericView):
+        routes = ["/GenericViewFieldsPaginationTest"]
+        field_lookup = "id"
+        paginate = True
+        page_size = 2
+
+    class FunctionView(GenericView):
+        routes = ["/GenericViewFieldsFunctionTest"]
+        serializer = SummarySerializerTestSql
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+        for view in (self.GenericView, self.PaginatedView, self.FunctionView):
+            self.flaskApp.add_url_rule(view.routes[0], view_func=view.as_view(view.routes[0]))
+        with self.flaskApp.app_context():
+            for i in range(3):
+                ModelTestSql(name=f"name_{i}", age=i, desc="a very long description").save()
+        self.client = self.flaskApp.test_client()
+
+        self.statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            self.statements.append(statement)
+
+        engine = self.get_sqldb().dbConfig.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", before_cursor_execute)
+
+    def get(self, route, **query_string):
+        return self.client.get(route, query_string=query_string)
+
+    def test_list_only_returns_and_selects_the_requested_fields(self):
+        res = self.get(self.GenericView.routes[0], fields="name, age")
+
+        self.assertEqual(res.get_json(), [{"name": f"name_{i}", "age": i} for i in range(3)])
+        self.assertEqual(len(self.statements), 1)
+        self.assertNotIn('"desc"', self.statements[0])
+
+    def test_single_entity_with_fields(self):
+        res = self.get(self.GenericView.routes[0], name="name_1", fields="desc")
+
+        self.assertEqual(res.get_json(), {"desc": "a very long description"})
+
+    def test_paginated_list_with_fields(self):
+        res = self.get(self.PaginatedView.routes[0], fields="name").get_json()
+
+        self.assertEqual(res["results"], [{"name": "name_0"}, {"name": "name_1"}])
+        res = self.get(self.PaginatedView.routes[0], fields="name", cursor=res["next_cursor"]).get_json()
+        self.assertEqual(res["results"], [{"name": "name_2"}])
+        self.assertTrue(all('"desc"' not in statement for statement in self.statements))
+
+    def test_without_fields_returns_every_field(self):
+        res = self.get(self.GenericView.routes[0], name="name_1")
+
+        self.assertEqual(res.get_json()["desc"], "a very long description")
+        self.assertIn("age", res.get_json())
+
+    def test_fields_which_are_not_columns_load_the_whole_row(self):
+        res = self.get(self.FunctionView.routes[0], fields="name,summary")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            res.get_json(),
+            [{"name": f"name_{i}", "summary": f"name_{i}: a very long description"} for i in range(3)],
+        )
+        res = self.get(self.FunctionView.routes[0], name="name_1", fields="summary")
+        self.assertEqual(res.get_json(), {"summary": "name_1: a very long description"})
+
+    def test_unknown_and_load_only_fields_return_400(self):
+        for fields in ("name,unknown", "password", ","):
+            res = self.get(self.GenericView.routes[0], fields=fields)
+            self.assertEqual(res.status_code, 400, fields)
+
+
+class TestGenericApiViewFilters(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewFiltersTest"]
+        methods = ["GET"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "id"
+        filter_fields = {"name": ["eq", "in", "prefix"], "age": ["range"]}
+        sort_fields = ["age", "name"]
+
+    class PaginatedView(GenericView):
+        routes = ["/GenericViewFiltersPaginationTest"]
+        paginate = True
+        page_size = 2
+
+    class UnfilteredView(GenericView):
+        routes = ["/GenericViewNoFiltersTest"]
+        filter_fields = {}
+        sort_fields = ()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+        for view in (self.GenericView, self.PaginatedView, self.UnfilteredView):
+            view.prepare_view()
+            self.flaskApp.add_url_rule(view.routes[0], view_func=view.as_view(view.routes[0]))
+        with self.flaskApp.app_context():
+            for i, name in enumerate(["ana", "bob", "anabel", "carl", "an_y"]):
+                ModelTestSql(name=name, age=i * 10).save()
+        self.client = self.flaskApp.test_client()
+
+    def names(self, route=None, **query_string):
+        res = self.client.get(route or self.GenericView.routes[0], query_string=query_string)
+        self.assertEqual(res.status_code, 200, res.get_json())
+        return [entity["name"] for entity in res.get_json()]
+
+    def test_eq_in_prefix_and_range_filters(self):
+        self.assertEqual(self.names(name="bob"), ["bob"])
+        self.assertEqual(self.names(name__in="bob,carl,nobody"), ["bob", "carl"])
+        self.assertEqual(self.names(name__prefix="ana"), ["ana", "anabel"])
+        self.assertEqual(self.names(name__prefix="an_"), ["an_y"])
+        self.assertEqual(self.names(age__gte="10", age__lt="30"), ["bob", "anabel"])
+        self.assertEqual(self.names(age__gt="10", name__prefix="an"), ["anabel", "an_y"])
+
+    def test_sort(self):
+        self.assertEqual(self.names(sort="name"), ["an_y", "ana", "anabel", "bob", "carl"])
+        self.assertEqual(self.names(sort="-age", age__lte="20"), ["anabel", "bob", "ana"])
+
+    def test_paginated_filters_and_sort(self):
+        route = self.PaginatedView.routes[0]
+        res = self.client.get(route, query_string={"sort": "-name", "name__prefix": "a"}).get_json()
+        self.assertEqual([i["name"] for i in res["results"]], ["anabel", "ana"])
+
+        res = self.client.get(
+            route, query_string={"sort": "-name", "name__prefix": "a", "cursor": res["next_cursor"]}
+        ).get_json()
+        self.assertEqual([i["name"] for i in res["results"]], ["an_y"])
+        self.assertIsNone(res["next_cursor"])
+
+    def test_not_allowed_filters_and_sort_return_400(self):
+        for query_string in (
+            {"desc": "x"},
+            {"name__gt": "a"},
+            {"age": "10"},
+            {"age__foo": "10"},
+            {"sort": "desc"},
+            {"age__gte": "ten"},
+        ):
+            res = self.client.get(self.GenericView.routes[0], query_string=query_string)
+            self.assertEqual(res.status_code, 400, query_string)
+
+    def test_unknown_params_are_ignored(self):
+        self.assertEqual(len(self.names(unknown="x")), 5)
+        self.assertEqual(len(self.names(self.UnfilteredView.routes[0], name="bob")), 5)
+
+    def test_plans_are_cached_per_query_string_shape(self):
+        spec = self.GenericView.__dict__["_filter_spec"]
+        spec.plans.clear()
+
+        self.names(name="bob", age__gte="10")
+        self.names(age__gte="0", name="carl")
+        self.names(name="bob", sort="age")
+
+        self.assertEqual(len(spec.plans), 2)
+
+    def test_invalid_filter_declaration(self):
+        class WrongOperator(self.GenericView):
+            filter_fields = {"name": ["like"]}
+
+        class WrongField(self.GenericView):
+            sort_fields = ["unknown"]
+
+        self.assertRaises(ValueError, WrongOperator.compile_filters)
+        self.assertRaises(ValueError, WrongField.compile_filters)
+
+
+class TestGenericApiViewCount(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewCountTest"]
+        methods = ["GET"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "id"
+        paginate = True
+        page_size = 2
+        filter_fields = {"age": ["range"]}
+        count_ttl = 60
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0], view_func=self.GenericView.as_view(self.GenericView.routes[0])
+        )
+        with self.flaskApp.app_context():
+            for i in range(5):
+                ModelTestSql(name=f"name_{i}", age=i).save()
+        self.client = self.flaskApp.test_client()
+        self.GenericView.get_count_cache().clear()
+
+        self.counts = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if "count(" in statement:
+                self.counts.append(statement)
+
+        engine = self.get_sqldb().dbConfig.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", before_cursor_execute)
+
+    def get(self, **query_string):
+        res = self.client.get(self.GenericView.routes[0], query_string=query_string)
+        self.assertEqual(res.status_code, 200, res.get_json())
+        return res.get_json()
+
+    def test_no_count_by_default(self):
+        self.assertNotIn("count", self.get())
+        self.assertEqual(self.counts, [])
+
+    def test_exact_count_with_filters_is_cached_per_filter_signature(self):
+        first = self.get(count="exact", age__gte="1")
+        self.assertEqual(first["count"], 4)
+        self.assertEqual(len(self.counts), 1)
+        self.assertNotIn("anon", self.counts[0])
+
+        following = self.get(count="exact", age__gte="1", cursor=first["next_cursor"])
+        self.assertEqual(following["count"], 4)
+        self.assertEqual(len(self.counts), 1)
+
+        self.assertEqual(self.get(count="exact", age__gte="3")["count"], 2)
+        self.assertEqual(len(self.counts), 2)
+
+    def test_count_is_recomputed_after_the_ttl(self):
+        self.GenericView.count_ttl = 0
+        self.addCleanup(setattr, self.GenericView, "count_ttl", 60)
+
+        self.assertEqual(self.get(count="exact")["count"], 5)
+        with self.flaskApp.app_context():
+            ModelTestSql(name="name_5", age=5).save()
+        self.assertEqual(self.get(count="exact")["count"], 6)
+
+    def test_estimate_count_reads_the_statistics(self):
+        # no statistics yet: counted exactly
+        with self.get_sqldb().getScopedSession() as dbSession:
+            dbSession.execute(sa.text("DROP TABLE IF EXISTS sqlite_stat1"))
+            dbSession.commit()
+        self.assertEqual(self.get(count="estimate")["count"], 5)
+        self.GenericView.get_count_cache().clear()
+
+        with self.get_sqldb().getScopedSession() as dbSession:
+            dbSession.execute(sa.text("ANALYZE"))
+            dbSession.commit()
+        with self.flaskApp.app_context():
+            ModelTestSql(name="name_5", age=5).save()
+        self.counts.clear()
+
+        self.assertEqual(self.get(count="estimate")["count"], 5)
+        self.assertEqual(self.counts, [])
+        self.assertEqual(self.get(count="estimate", age__lt="2")["count"], 2)
+
+    def test_invalid_count_returns_400(self):
+        res = self.client.get(self.GenericView.routes[0], query_string={"count": "all"})
+        self.assertEqual(res.status_code, 400)
+
+
+class TestGenericApiViewConditionalGet(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewConditionalTest"]
+        methods = ["GET"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "id"
+        conditional_get = True
+        filter_fields = {"age": ["range"]}
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0], view_func=self.GenericView.as_view(self.GenericView.routes[0])
+        )
+        with self.flaskApp.app_context():
+            self.ids = [ModelTestSql(name=f"name_{i}", age=i).save().id for i in range(3)]
+        self.client = self.flaskApp.test_client()
+
+        self.statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            self.statements.append(statement)
+
+        engine = self.get_sqldb().dbConfig.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", before_cursor_execute)
+
+    def get(self, headers=None, **query_string):
+        return self.client.get(self.GenericView.routes[0], query_string=query_string, headers=headers)
+
+    def touch(self, entity_id, seconds=60):
+        # `_updated_at` has the one second resolution of the sqlite clock
+        with self.get_sqldb().getScopedSession() as dbSession:
+            dbSession.execute(
+                sa.update(ModelTestSql)
+                .where(ModelTestSql.id == entity_id)
+                .values(desc="changed", _updated_at=datetime.utcnow() + timedelta(seconds=seconds))
+            )
+            dbSession.commit()
+
+    def test_single_entity_etag_and_304(self):
+        res = self.get(id=self.ids[0])
+        etag = res.headers["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertIn("Last-Modified", res.headers)
+
+        self.statements.clear()
+        res = self.get({"If-None-Match": etag}, id=self.ids[0])
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res.data, b"")
+        self.assertEqual(res.headers["ETag"], etag)
+        self.assertEqual(len(self.statements), 1)
+        self.assertNotIn('"desc"', self.statements[0])
+
+        self.touch(self.ids[0])
+        res = self.get({"If-None-Match": etag}, id=self.ids[0])
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.get_json()["desc"], "changed")
+        self.assertNotEqual(res.headers["ETag"], etag)
+
+    def test_single_entity_if_modified_since(self):
+        last_modified = self.get(id=self.ids[0]).headers["Last-Modified"]
+
+        res = self.get({"If-Modified-Since": last_modified}, id=self.ids[0])
+        self.assertEqual(res.status_code, 304)
+
+        self.touch(self.ids[0])
+        res = self.get({"If-Modified-Since": last_modified}, id=self.ids[0])
+        self.assertEqual(res.status_code, 200)
+
+    def test_list_etag_changes_with_writes_and_deletions(self):
+        etag = self.get().headers["ETag"]
+        filtered_etag = self.get(age__gte="1").headers["ETag"]
+        self.assertNotEqual(etag, filtered_etag)
+
+        self.statements.clear()
+        res = self.get({"If-None-Match": filtered_etag}, age__gte="1")
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn("max(", self.statements[0])
+
+        with self.flaskApp.app_context():
+            ModelTestSql.soft_delete_by(id=self.ids[0])
+        self.assertEqual(self.get({"If-None-Match": filtered_etag}, age__gte="1").status_code, 304)
+        self.assertEqual(self.get({"If-None-Match": etag}).status_code, 200)
+
+        self.touch(self.ids[2])
+        self.assertEqual(self.get({"If-None-Match": filtered_etag}, age__gte="1").status_code, 200)
+
+    def test_no_validators_when_disabled(self):
+        self.GenericView.conditional_get = None
+        self.addCleanup(setattr, self.GenericView, "conditional_get", True)
+
+        res = self.get(id=self.ids[0])
+        self.assertNotIn("ETag", res.headers)
+        self.assertEqual(self.get({"If-None-Match": "*"}, id=self.ids[0]).status_code, 200)
+
+
+class TestGenericApiViewResponseCache(TestCase):
+    class GenericView(GenericApiView):
+        routes = ["/GenericViewResponseCacheTest"]
+        methods = ["GET", "POST", "PATCH"]
+        model = ModelTestSql
+        serializer = SerializerTestSql
+        field_lookup = "name"
+        response_cache = True
+        conditional_get = True
+        validate_request = False
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.flaskApp = self.get_flask_app_sql()
+        self.flaskApp.add_url_rule(
+            self.GenericView.routes[0], view_func=self.GenericView.as_view(self.GenericView.routes[0])
+        )
+        with self.flaskApp.app_context():
+            for i in range(2):
+                ModelTestSql(name=f"name_{i}", desc="a").save()
+        self.client = self.flaskApp.test_client()
+        self.GenericView.get_response_cache().clear()
+
+        self.selects = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.startswith("SELECT"):
+                self.selects.append(statement)
+
+        engine = self.get_sqldb().dbConfig.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        self.addCleanup(event.remove, engine, "before_cursor_execute", before_cursor_execute)
+
+    def get(self, headers=None, **query_string):
+        return self.client.get(self.GenericView.routes[0], query_string=query_string, headers=headers)
+
+    def test_responses_are_cached_per_query_string(self):
+        first = self.get(name="name_0")
+        queries = len(self.selects)
+        second = self.get(name="name_0")
+
+        self.assertEqual(len(self.selects), queries)
+        self.assertEqual(second.get_json(), first.get_json())
+        self.assertEqual(second.headers["ETag"], first.headers["ETag"])
+        self.assertEqual(second.mimetype, "application/json")
+
+        res = self.get({"If-None-Match": first.headers["ETag"]}, name="name_0")
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(len(self.selects), queries)
+
+        self.assertEqual(self.get(name="name_1").get_json()["name"], "name_1")
+        self.assertGreater(len(self.selects), queries)
+
+    def test_writes_invalidate_the_cached_responses(self):
+        self.assertEqual(len(self.get().get_json()), 2)
+
+        res = self.client.post(self.GenericView.routes[0], json={"username": "u", "password": "p", "name": "name_2"})
+        self.assertEqual(res.status_code, 201, res.get_json())
+        self.assertEqual(len(self.get().get_json()), 3)
+
+        self.assertEqual(self.get(name="name_2").get_json()["desc"], None)
+        self.client.patch(self.GenericView.routes[0], query_string={"name": "name_2"}, json={"desc": "b"})
+        self.assertEqual(self.get(name="name_2").get_json()["desc"], "b")
+
+        with self.flaskApp.app_context():
+            ModelTestSql.soft_delete_by(name="name_2")
+        self.assertEqual(len(self.get().get_json()), 2)
+
+    def test_rolled_back_writes_keep_the_cache(self):
+        self.get()
+        with self.get_sqldb().getScopedSession() as dbSession:
+            dbSession.add(ModelTestSql(name="never saved"))
+            dbSession.flush()
+            dbSession.rollback()
+        queries = len(self.selects)
+        self.get()
+        self.assertEqual(len(self.selects), queries)
+
+    def test_streamed_responses_are_not_cached(self):
+        self.get()
+        res = self.client.get(self.GenericView.routes[0], headers={"Accept": "application/x-ndjson"})
+        self.assertEqual(res.mimetype, "application/x-ndjson")
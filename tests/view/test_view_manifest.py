@@ -0,0 +1,160 @@
+import os
+import sys
+import shutil
+import tempfile
+import textwrap
+from pathlib import Path
+
+from flask import Flask
+
+from easy_framework.view._viewHandler import ViewHandler
+from easy_framework.view._viewManifest import ViewManifest
+from tests import TestCase
+
+STATIC_VIEW = '''
+from easy_framework.view import GenericApiView
+
+class View(GenericApiView):
+    routes = ['/lazyView', '/lazyView2']
+    methods = ['GET']
+    model = None
+    serializer = None
+    field_lookup = None
+    auto_treat_request = False
+
+    def __init__(self):
+        pass
+
+    def get(self):
+        return 'hello_lazy_view'
+'''
+
+DYNAMIC_VIEW = '''
+from easy_framework.view import GenericApiView
+
+ROUTES = ['/dynamicView']
+
+class View(GenericApiView):
+    routes = ROUTES
+    methods = ['GET']
+    model = None
+    serializer = None
+    field_lookup = None
+    auto_treat_request = False
+
+    def __init__(self):
+        pass
+
+    def get(self):
+        return 'hello_dynamic_view'
+'''
+
+NO_VIEW = '''
+def helper():
+    return 1
+'''
+
+
+class TestViewManifest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = Path(tempfile.mkdtemp(prefix='ef_views_', dir=os.getcwd()))
+        self.package = self.directory.name
+        self.write('static_view.py', STATIC_VIEW)
+        self.write('dynamic_view.py', DYNAMIC_VIEW)
+        self.write('helpers.py', NO_VIEW)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        for module in [i for i in sys.modules if i.startswith(self.package)]:
+            del sys.modules[module]
+        super().tearDown()
+
+    def write(self, name: str, source: str) -> None:
+        with open(self.directory / name, 'w') as file:
+            file.write(textwrap.dedent(source))
+
+    def get_entry(self, manifest: ViewManifest, name: str):
+        return next(i for i in manifest.entries if i.module == f'{self.package}.{name}')
+
+    def test_manifest_reads_routes_without_importing(self):
+        manifest = ViewManifest(self.directory, 'View').load()
+
+        static = self.get_entry(manifest, 'static_view')
+        self.assertEqual(static.view_class, 'View')
+        self.assertEqual(static.routes, ['/lazyView', '/lazyView2'])
+        self.assertEqual(static.methods, ['GET'])
+        self.assertTrue(static.is_static)
+
+        dynamic = self.get_entry(manifest, 'dynamic_view')
+        self.assertEqual(dynamic.view_class, 'View')
+        self.assertIsNone(dynamic.routes)
+        self.assertFalse(dynamic.is_static)
+
+        self.assertIsNone(self.get_entry(manifest, 'helpers').view_class)
+        self.assertEqual(len(manifest.views), 2)
+        self.assertNotIn(f'{self.package}.static_view', sys.modules)
+
+    def test_manifest_is_cached(self):
+        manifest = ViewManifest(self.directory, 'View').load()
+        self.assertEqual(len(manifest.parsed), 3)
+        self.assertTrue(manifest.cache_path.exists())
+
+        manifest = ViewManifest(self.directory, 'View').load()
+        self.assertEqual(manifest.parsed, [])
+        self.assertEqual(self.get_entry(manifest, 'static_view').routes, ['/lazyView', '/lazyView2'])
+
+    def test_modified_file_is_parsed_again(self):
+        ViewManifest(self.directory, 'View').load()
+
+        self.write('static_view.py', STATIC_VIEW.replace("'/lazyView2'", "'/lazyView3'"))
+        os.utime(self.directory / 'static_view.py', ns=(1, 1))
+        manifest = ViewManifest(self.directory, 'View').load()
+
+        self.assertEqual(manifest.parsed, [str(self.directory / 'static_view.py')])
+        self.assertEqual(self.get_entry(manifest, 'static_view').routes, ['/lazyView', '/lazyView3'])
+
+    def test_touched_file_is_not_parsed_again(self):
+        ViewManifest(self.directory, 'View').load()
+
+        os.utime(self.directory / 'static_view.py', ns=(1, 1))
+        manifest = ViewManifest(self.directory, 'View').load()
+
+        self.assertEqual(manifest.parsed, [])
+        self.assertEqual(ViewManifest(self.directory, 'View').read_cache()[str(self.directory / 'static_view.py')].mtime_ns, 1)
+
+    def test_register_views_lazy_import(self):
+        flaskApp = Flask(__name__)
+        ViewHandler.register_views(self.directory, flaskApp, 'View', lazy_import=True)
+
+        rules = {rule.rule for rule in flaskApp.url_map.iter_rules()}
+        self.assertTrue({'/lazyView', '/lazyView2', '/dynamicView'}.issubset(rules))
+        self.assertNotIn(f'{self.package}.static_view', sys.modules)
+        self.assertIn(f'{self.package}.dynamic_view', sys.modules)
+
+        test_client = flaskApp.test_client()
+        response = test_client.get('/lazyView2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_data(), b'hello_lazy_view')
+        self.assertIn(f'{self.package}.static_view', sys.modules)
+
+        self.assertEqual(test_client.get('/lazyView').get_data(), b'hello_lazy_view')
+        self.assertEqual(test_client.get('/dynamicView').get_data(), b'hello_dynamic_view')
+        self.assertEqual(test_client.post('/lazyView').status_code, 405)
+
+    def test_load_lazy_views(self):
+        flaskApp = Flask(__name__)
+        ViewHandler.register_views(self.directory, flaskApp, 'View', lazy_import=True)
+
+        self.assertEqual(ViewHandler.load_lazy_views(flaskApp), 1)
+        self.assertIn(f'{self.package}.static_view', sys.modules)
+        self.assertEqual(ViewHandler.load_lazy_views(flaskApp), 0)
+
+    def test_reexported_lazy_view_is_registered_once(self):
+        self.write('reexport.py', f'from {self.package}.static_view import View\n')
+        flaskApp = Flask(__name__)
+        ViewHandler.register_views(self.directory, flaskApp, 'View', lazy_import=True)
+
+        endpoints = [rule.endpoint for rule in flaskApp.url_map.iter_rules() if rule.rule == '/lazyView']
+        self.assertEqual(endpoints, ['View./lazyView'])
+        self.assertEqual(flaskApp.test_client().get('/lazyView').get_data(), b'hello_lazy_view')